@@ -0,0 +1,330 @@
+"""
+Benchmarks de los caminos críticos de Connect.
+
+Mide inserciones individuales (con y sin transacción), bulk_insert, search con y sin índice, read_table
+(con cada formato de fila: tuplas, sqlite3.Row, diccionarios y registros), iter_table, update y delete sobre tablas de distintos tamaños, en archivo y en ':memory:', con uno o
+varios hilos. Para cada caso informa filas por segundo (operaciones por segundo en los escenarios de
+llamadas individuales), latencias p50/p99 por llamada y, opcionalmente,
+el pico de memoria de Python. El resultado se puede guardar en JSON y compararse con una ejecución anterior.
+
+Uso:
+    python benchmarks/bench_connect.py --sizes 1000 100000 --threads 1 4 --output resultados.json
+    python benchmarks/bench_connect.py --sizes 1000 100000 --compare resultados.json --threshold 0.1
+"""
+import argparse
+import json
+import os
+import platform
+import sqlite3
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from threading import Barrier, Thread
+from typing import Any as any, Callable, Iterator
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlite3manager import Connect  # noqa: E402
+
+TABLE = 'bench'
+SCENARIOS = ('bulk_insert', 'read_table', 'read_table_row', 'read_table_dict', 'read_table_record', 'iter_table', 'search_scan', 'search_index',
+             'insert', 'insert_tx', 'update', 'delete')
+# Escenarios que repiten una operación pequeña y por tanto se pueden repartir entre varios hilos.
+PER_CALL_SCENARIOS = ('search_scan', 'search_index', 'insert', 'update', 'delete')
+
+
+def percentile(samples: list[float], fraction: float) -> float:
+    """
+    Calcula un percentil por el método del rango más cercano.
+
+    Args:
+        samples (list[float]): Muestras ordenadas.
+        fraction (float): Percentil entre 0 y 1.
+
+    Returns:
+        float: Valor del percentil, o 0.0 si no hay muestras.
+    """
+    if not samples:
+        return 0.0
+    return samples[min(len(samples) - 1, max(0, round(fraction * len(samples)) - 1))]
+
+
+def make_rows(start: int, count: int) -> Iterator[tuple[int, int, str, float]]:
+    """
+    Genera filas sintéticas para la tabla de pruebas.
+
+    Args:
+        start (int): Primer identificador.
+        count (int): Número de filas.
+
+    Returns:
+        Iterator[tuple]: Filas (id, key, name, value).
+    """
+    return ((i, i % 1000, f'name{i}', i * 0.5) for i in range(start, start + count))
+
+
+class Bench:
+    """
+    Ejecuta los escenarios sobre una base de datos concreta.
+
+    Args:
+        path (str): Ruta de la base de datos, o ':memory:'.
+        rows (int): Filas de la tabla.
+        ops (int): Operaciones por escenario de llamadas individuales.
+        threads (int): Hilos para los escenarios de llamadas individuales.
+        profile (str | None): Perfil de PRAGMAs de Connect.
+    """
+
+    def __init__(self, path: str, rows: int, ops: int, threads: int, profile: str | None) -> None:
+        self.path = path
+        self.rows = rows
+        self.ops = ops
+        self.threads = threads
+        self.conn = Connect(path, raise_exceptions=True, verbose=False, profile=profile)
+        self.conn.connect()
+        self.next_id = rows + 1
+
+    def close(self) -> None:
+        self.conn.close_all()
+
+    def load(self) -> None:
+        """
+        Crea la tabla de pruebas y la llena con ``rows`` filas.
+        """
+        self.conn.drop_table(TABLE)
+        self.conn.create_table(TABLE, {'id': 'INTEGER PRIMARY KEY', 'key': 'INTEGER', 'name': 'TEXT', 'value': 'REAL'})
+        self.conn.bulk_insert(TABLE, make_rows(1, self.rows), columns=('id', 'key', 'name', 'value'))
+
+    def run_calls(self, call: Callable[[int], any]) -> tuple[float, list[float]]:
+        """
+        Ejecuta ``ops`` llamadas repartidas entre los hilos configurados y mide cada una.
+
+        Args:
+            call (Callable[[int], any]): Operación a medir; recibe el número de operación.
+
+        Returns:
+            tuple[float, list[float]]: Tiempo total y latencias ordenadas.
+        """
+        per_thread = [range(n, self.ops, self.threads) for n in range(self.threads)]
+        latencies: list[list[float]] = [[] for _ in per_thread]
+
+        def measure(index: int) -> None:
+            samples = latencies[index]
+            for n in per_thread[index]:
+                start = time.perf_counter()
+                call(n)
+                samples.append(time.perf_counter() - start)
+
+        if self.threads == 1:
+            start = time.perf_counter()
+            measure(0)
+            return time.perf_counter() - start, sorted(latencies[0])
+
+        barrier = Barrier(self.threads + 1)
+
+        def worker(index: int) -> None:
+            self.conn.connect()
+            barrier.wait()
+            measure(index)
+
+        workers = [Thread(target=worker, args=(n,)) for n in range(self.threads)]
+        for thread in workers:
+            thread.start()
+        barrier.wait()
+        start = time.perf_counter()
+        for thread in workers:
+            thread.join()
+        return time.perf_counter() - start, sorted(sample for samples in latencies for sample in samples)
+
+    def scenario(self, name: str) -> tuple[int, float, list[float]]:
+        """
+        Ejecuta un escenario.
+
+        Args:
+            name (str): Nombre del escenario de SCENARIOS.
+
+        Returns:
+            tuple[int, float, list[float]]: Filas procesadas, tiempo total y latencias ordenadas.
+        """
+        conn = self.conn
+        match name:
+            case 'bulk_insert':
+                start = time.perf_counter()
+                self.load()
+                elapsed = time.perf_counter() - start
+                return self.rows, elapsed, [elapsed]
+            case 'read_table':
+                start = time.perf_counter()
+                count = len(conn.read_table(TABLE))
+                elapsed = time.perf_counter() - start
+                return count, elapsed, [elapsed]
+            case 'read_table_row' | 'read_table_dict' | 'read_table_record':
+                start = time.perf_counter()
+                count = len(conn.read_table(TABLE, row_factory=name.rsplit('_', 1)[1]))
+                elapsed = time.perf_counter() - start
+                return count, elapsed, [elapsed]
+            case 'iter_table':
+                start = time.perf_counter()
+                count = sum(1 for _ in conn.iter_table(TABLE))
+                elapsed = time.perf_counter() - start
+                return count, elapsed, [elapsed]
+            case 'search_scan':
+                elapsed, latencies = self.run_calls(lambda n: conn.search(TABLE, {'key': n % 1000}))
+                return self.ops, elapsed, latencies
+            case 'search_index':
+                conn.custom_query(f"CREATE INDEX IF NOT EXISTS idx_{TABLE}_key ON {TABLE} (key)")
+                elapsed, latencies = self.run_calls(lambda n: conn.search(TABLE, {'key': n % 1000}))
+                return self.ops, elapsed, latencies
+            case 'insert':
+                base = self.next_id
+                self.next_id += self.ops
+                elapsed, latencies = self.run_calls(lambda n: conn.insert(TABLE, {'id': base + n, 'key': n % 1000, 'name': f'name{n}', 'value': n * 0.5}))
+                return self.ops, elapsed, latencies
+            case 'insert_tx':
+                base = self.next_id
+                self.next_id += self.ops
+                start = time.perf_counter()
+                latencies = []
+                with conn.transaction():
+                    for n in range(self.ops):
+                        call_start = time.perf_counter()
+                        conn.insert(TABLE, {'id': base + n, 'key': n % 1000, 'name': f'name{n}', 'value': n * 0.5})
+                        latencies.append(time.perf_counter() - call_start)
+                return self.ops, time.perf_counter() - start, sorted(latencies)
+            case 'update':
+                elapsed, latencies = self.run_calls(lambda n: conn.update(TABLE, {'value': n * 2.0}, {'id': 1 + (n * 7919) % self.rows}))
+                return self.ops, elapsed, latencies
+            case 'delete':
+                elapsed, latencies = self.run_calls(lambda n: conn.delete(TABLE, {'id': 1 + (n * 7919) % self.rows}))
+                return self.ops, elapsed, latencies
+        raise ValueError(f"Escenario desconocido: '{name}'")
+
+
+def run_suite(args: argparse.Namespace) -> list[dict[str, any]]:
+    """
+    Ejecuta todas las combinaciones de tamaño, base de datos e hilos pedidas.
+
+    Args:
+        args (argparse.Namespace): Argumentos de la línea de comandos.
+
+    Returns:
+        list[dict]: Un resultado por combinación y escenario.
+    """
+    results = []
+    for rows in args.sizes:
+        for db in args.db:
+            for threads in args.threads:
+                if db == 'memory' and threads > 1:
+                    # Cada conexión a ':memory:' abre una base de datos distinta.
+                    continue
+                directory = tempfile.mkdtemp(prefix='sqlite3manager-bench-')
+                path = ':memory:' if db == 'memory' else os.path.join(directory, 'bench.sqlite3')
+                bench = Bench(path, rows, min(args.ops, rows), threads, args.profile)
+                try:
+                    if threads > 1 or 'bulk_insert' not in args.scenarios:
+                        bench.load()
+                    for scenario in args.scenarios:
+                        if threads > 1 and scenario not in PER_CALL_SCENARIOS:
+                            continue
+                        if args.memory:
+                            tracemalloc.start()
+                        count, elapsed, latencies = bench.scenario(scenario)
+                        peak = tracemalloc.get_traced_memory()[1] if args.memory else None
+                        if args.memory:
+                            tracemalloc.stop()
+                        result = {
+                            'scenario': scenario,
+                            'rows': rows,
+                            'db': db,
+                            'threads': threads,
+                            'processed': count,
+                            'seconds': elapsed,
+                            'rows_per_second': count / elapsed if elapsed else 0.0,
+                            'p50_ms': percentile(latencies, 0.50) * 1000,
+                            'p99_ms': percentile(latencies, 0.99) * 1000,
+                            'peak_memory_bytes': peak,
+                        }
+                        results.append(result)
+                        print(f"{scenario:<17} rows={rows:<9} db={db:<6} threads={threads:<2} "
+                              f"{result['rows_per_second']:>14,.0f} filas/s  p50={result['p50_ms']:.4f} ms  p99={result['p99_ms']:.4f} ms"
+                              + (f"  pico={peak / 1024 / 1024:.1f} MiB" if peak is not None else ""), flush=True)
+                finally:
+                    bench.close()
+                    for name in os.listdir(directory):
+                        os.remove(os.path.join(directory, name))
+                    os.rmdir(directory)
+    return results
+
+
+def compare(results: list[dict[str, any]], baseline_path: str, threshold: float) -> list[str]:
+    """
+    Compara los resultados con una ejecución anterior.
+
+    Args:
+        results (list[dict]): Resultados actuales.
+        baseline_path (str): Archivo JSON generado con --output.
+        threshold (float): Caída relativa de filas por segundo a partir de la cual hay regresión.
+
+    Returns:
+        list[str]: Descripción de cada regresión encontrada.
+    """
+    with open(baseline_path, encoding='utf-8') as file:
+        baseline = {(r['scenario'], r['rows'], r['db'], r['threads']): r for r in json.load(file)['results']}
+    regressions = []
+    for result in results:
+        previous = baseline.get((result['scenario'], result['rows'], result['db'], result['threads']))
+        if previous is None or not previous['rows_per_second']:
+            continue
+        change = result['rows_per_second'] / previous['rows_per_second'] - 1
+        line = (f"{result['scenario']:<17} rows={result['rows']:<9} db={result['db']:<6} threads={result['threads']:<2} "
+                f"{previous['rows_per_second']:>14,.0f} -> {result['rows_per_second']:>14,.0f} filas/s ({change:+.1%})")
+        print(line)
+        if change < -threshold:
+            regressions.append(line)
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmarks de los caminos críticos de Connect.")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 100000], help="Filas de la tabla (de 10^3 a 10^7).")
+    parser.add_argument('--threads', type=int, nargs='+', default=[1, 4], help="Hilos para los escenarios de llamadas individuales.")
+    parser.add_argument('--db', choices=('file', 'memory'), nargs='+', default=['file', 'memory'], help="Tipo de base de datos.")
+    parser.add_argument('--ops', type=int, default=1000, help="Operaciones por escenario de llamadas individuales.")
+    parser.add_argument('--scenarios', choices=SCENARIOS, nargs='+', default=list(SCENARIOS), help="Escenarios a ejecutar.")
+    parser.add_argument('--profile', default=None, help="Perfil de PRAGMAs de Connect.")
+    parser.add_argument('--memory', action='store_true', help="Mide el pico de memoria con tracemalloc (ralentiza la ejecución).")
+    parser.add_argument('--output', help="Archivo JSON donde guardar los resultados.")
+    parser.add_argument('--compare', help="Archivo JSON de una ejecución anterior con el que comparar.")
+    parser.add_argument('--threshold', type=float, default=0.10, help="Caída relativa admitida antes de considerar una regresión.")
+    args = parser.parse_args(argv)
+
+    results = run_suite(args)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            json.dump({
+                'meta': {
+                    'timestamp': datetime.now(timezone.utc).isoformat(),
+                    'python': platform.python_version(),
+                    'sqlite': sqlite3.sqlite_version,
+                    'platform': platform.platform(),
+                    'args': {key: value for key, value in vars(args).items() if key not in ('output', 'compare')},
+                },
+                'results': results,
+            }, file, indent=2)
+
+    if args.compare:
+        regressions = compare(results, args.compare, args.threshold)
+        if regressions:
+            print(f"\n[!] {len(regressions)} regresiones por encima del {args.threshold:.0%}:")
+            for line in regressions:
+                print(f"    {line}")
+            return 1
+        print("\n[i] Sin regresiones")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
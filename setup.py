@@ -24,6 +24,9 @@ setup(
     ],
     python_requires='>=3.10',
     install_requires=[],
+    extras_require={
+        'numpy': ['numpy'],
+    },
     entry_points={
         'console_scripts': [],
     },
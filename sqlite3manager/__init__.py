@@ -1,3 +1,9 @@
 from .manager import Connect
+from .async_manager import AsyncConnect
+from .advisor import IndexAdvisor
+from .cache import ResultCache
+from .instrumentation import Instrumentation
+from .pool import ConnectionPool
+from .writer import WriteBehindQueue
 
-__all__ = ['Connect']
+__all__ = ['Connect', 'AsyncConnect', 'ConnectionPool', 'IndexAdvisor', 'Instrumentation', 'ResultCache', 'WriteBehindQueue']
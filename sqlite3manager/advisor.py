@@ -0,0 +1,162 @@
+import re
+from sqlite3 import Connection, OperationalError
+from threading import Lock
+from typing import Any as any
+
+
+class IndexAdvisor:
+    """
+    Asesor de índices opcional para Connect.
+
+    La primera vez que search(), update() o delete() usan una combinación de columnas en la condición, ejecuta
+    ``EXPLAIN QUERY PLAN`` sobre la sentencia generada. Si el plan recorre la tabla completa y esta tiene al
+    menos ``min_rows`` filas, la combinación se marca y Connect sugiere el índice correspondiente; con
+    ``auto_create`` el índice se crea en cuanto la combinación se usa ``auto_create_after`` veces. Los planes se
+    vuelven a calcular cuando cambia el esquema, por ejemplo, al crear un índice.
+
+    Args:
+        min_rows (int): Filas a partir de las cuales un recorrido completo se considera un problema. Por defecto es 10000.
+        auto_create (bool): Indica si se crean los índices sugeridos. Por defecto es False.
+        auto_create_after (int): Usos de una combinación de columnas antes de crear su índice. Por defecto es 100.
+    """
+    min_rows: int
+    auto_create: bool
+    auto_create_after: int
+
+    def __init__(self, min_rows: int = 10000, auto_create: bool = False, auto_create_after: int = 100) -> None:
+        """
+        Inicializa el asesor sin observaciones.
+
+        Args:
+            min_rows (int): Filas a partir de las cuales un recorrido completo se considera un problema. Por defecto es 10000.
+            auto_create (bool): Indica si se crean los índices sugeridos. Por defecto es False.
+            auto_create_after (int): Usos de una combinación de columnas antes de crear su índice. Por defecto es 100.
+        """
+        if auto_create_after < 1:
+            raise ValueError("auto_create_after debe ser mayor que cero")
+        self.min_rows = min_rows
+        self.auto_create = auto_create
+        self.auto_create_after = auto_create_after
+        self._entries: dict[tuple[str, tuple[str, ...]], dict[str, any]] = {}
+        self._lock = Lock()
+
+    @staticmethod
+    def index_statement(table_name: str, columns: tuple[str, ...]) -> str:
+        """
+        Genera el CREATE INDEX sugerido para una combinación de columnas.
+
+        Args:
+            table_name (str): El nombre de la tabla.
+            columns (tuple[str, ...]): Columnas de la condición.
+
+        Returns:
+            str: Sentencia CREATE INDEX IF NOT EXISTS.
+
+        Example:
+            >>> IndexAdvisor.index_statement('users', ('country', 'age'))
+            'CREATE INDEX IF NOT EXISTS idx_users_country_age ON users (country, age)'
+        """
+        return f"CREATE INDEX IF NOT EXISTS idx_{table_name}_{'_'.join(columns)} ON {table_name} ({', '.join(columns)})"
+
+    @staticmethod
+    def _estimate_rows(connection: Connection, table_name: str) -> int:
+        """
+        Estima las filas de una tabla sin recorrerla: usa el mayor rowid y, en tablas WITHOUT ROWID, COUNT(*).
+
+        Args:
+            connection (Connection): Conexión a la base de datos.
+            table_name (str): El nombre de la tabla.
+
+        Returns:
+            int: Filas estimadas.
+        """
+        try:
+            return connection.execute(f"SELECT MAX(rowid) FROM {table_name}").fetchone()[0] or 0
+        except OperationalError:
+            return connection.execute(f"SELECT COUNT(*) FROM {table_name}").fetchone()[0]
+
+    def _explain(self, connection: Connection, table_name: str, query: str) -> tuple[list[str], bool]:
+        """
+        Obtiene el plan de una sentencia e indica si recorre la tabla completa.
+
+        Args:
+            connection (Connection): Conexión a la base de datos.
+            table_name (str): El nombre de la tabla.
+            query (str): Sentencia con parámetros ``?``.
+
+        Returns:
+            tuple[list[str], bool]: Pasos del plan y si alguno es un recorrido completo de la tabla.
+        """
+        rows = connection.execute(f"EXPLAIN QUERY PLAN {query}", (None,) * query.count('?')).fetchall()
+        plan = [str(row[-1]) for row in rows]
+        scan = re.compile(rf"^SCAN (TABLE )?{re.escape(table_name)}\b(?!.*\bUSING\b.*\bINDEX\b)", re.IGNORECASE)
+        return plan, [step for step in plan if scan.search(step)] != []
+
+    def observe(self, connection: Connection, table_name: str, columns: tuple[str, ...], query: str) -> tuple[str, str] | None:
+        """
+        Registra un uso de una combinación de columnas y decide si hay que sugerir o crear un índice.
+
+        Args:
+            connection (Connection): Conexión a la base de datos.
+            table_name (str): El nombre de la tabla.
+            columns (tuple[str, ...]): Columnas de la condición.
+            query (str): Sentencia generada para la condición.
+
+        Returns:
+            tuple[str, str] | None: ('suggest', sql) la primera vez que se detecta el recorrido completo,
+                ('create', sql) cuando hay que crear el índice, o None.
+        """
+        key = (table_name.lower(), columns)
+        version = connection.execute("PRAGMA schema_version").fetchone()[0]
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = self._entries[key] = {'table': table_name, 'columns': columns, 'count': 0, 'version': None, 'full_scan': False,
+                                              'rows': 0, 'plan': [], 'suggested': False, 'created': False}
+            entry['count'] += 1
+            stale = entry['version'] != version
+            count = entry['count']
+
+        if stale:
+            plan, full_scan = self._explain(connection, table_name, query)
+            rows = self._estimate_rows(connection, table_name) if full_scan else 0
+            with self._lock:
+                entry.update(version=version, plan=plan, full_scan=full_scan and rows >= self.min_rows, rows=rows)
+
+        with self._lock:
+            if not entry['full_scan']:
+                return None
+            sql = self.index_statement(table_name, columns)
+            if self.auto_create and count >= self.auto_create_after and not entry['created']:
+                entry['created'] = True
+                return 'create', sql
+            if not entry['suggested']:
+                entry['suggested'] = True
+                return 'suggest', sql
+        return None
+
+    def suggestions(self) -> list[dict[str, any]]:
+        """
+        Lista las combinaciones de columnas que recorren tablas completas, de la más usada a la menos usada.
+
+        Returns:
+            list[dict]: Tabla, columnas, usos, filas estimadas, plan e índice sugerido de cada combinación.
+
+        Example:
+            >>> conn.advisor.suggestions()
+            [{'table': 'users', 'columns': ('email',), 'count': 250, 'rows': 1000000, 'plan': ['SCAN users'], 'sql': 'CREATE INDEX ...'}]
+        """
+        with self._lock:
+            entries = [entry for entry in self._entries.values() if entry['full_scan']]
+            return [
+                {'table': entry['table'], 'columns': entry['columns'], 'count': entry['count'], 'rows': entry['rows'],
+                 'plan': list(entry['plan']), 'sql': self.index_statement(entry['table'], entry['columns'])}
+                for entry in sorted(entries, key=lambda entry: entry['count'], reverse=True)
+            ]
+
+    def reset(self) -> None:
+        """
+        Descarta todas las observaciones.
+        """
+        with self._lock:
+            self._entries.clear()
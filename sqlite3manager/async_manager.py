@@ -0,0 +1,468 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from itertools import islice
+from typing import IO, Any as any, AsyncIterator, BinaryIO, Callable, Iterator, Sequence, TypeVar
+
+from .blob import BlobStream
+from .manager import Condition, Connect
+
+ResultType = TypeVar('ResultType')
+
+
+class AsyncConnect:
+    """
+    Versión asíncrona de Connect para aplicaciones basadas en asyncio.
+
+    Todas las operaciones se ejecutan en un hilo propio, por lo que nunca bloquean el bucle de eventos.
+    Las escrituras (insert, bulk_insert, update y delete) que llegan a la vez desde varias corrutinas se
+    agrupan en una misma transacción, cada una dentro de su propio SAVEPOINT para que el fallo de una no
+    afecte a las demás. El número de escrituras pendientes está acotado: al alcanzar el límite, las
+    corrutinas esperan antes de encolar más.
+
+    Args:
+        path (str): Ruta de la base de datos SQLite.
+        raise_exceptions (bool): Indica si se deben levantar excepciones en caso de error. Por defecto es False.
+        fetch_size (int): Cantidad de filas que los iteradores leen por cada llamada a fetchmany. Por defecto es 1000.
+        max_pending_writes (int): Escrituras que pueden estar en cola a la vez. Por defecto es 1000.
+        max_batch (int): Escrituras como máximo por transacción compartida. Por defecto es 500.
+        **options: Resto de opciones de Connect (profile, pragmas, result_cache, verbose, instrumentation...).
+    """
+    path: str
+    max_batch: int
+
+    def __init__(self, path: str, raise_exceptions: bool = False, fetch_size: int = 1000, max_pending_writes: int = 1000, max_batch: int = 500, **options: any) -> None:
+        """
+        Inicializa una instancia de la clase AsyncConnect.
+
+        Args:
+            path (str): Ruta de la base de datos SQLite.
+            raise_exceptions (bool): Indica si se deben levantar excepciones en caso de error. Por defecto es False.
+            fetch_size (int): Cantidad de filas que los iteradores leen por cada llamada a fetchmany. Por defecto es 1000.
+            max_pending_writes (int): Escrituras que pueden estar en cola a la vez. Por defecto es 1000.
+            max_batch (int): Escrituras como máximo por transacción compartida. Por defecto es 500.
+            **options: Resto de opciones de Connect (profile, pragmas, result_cache, verbose, instrumentation...).
+        """
+        if max_pending_writes < 1 or max_batch < 1:
+            raise ValueError("max_pending_writes y max_batch deben ser mayores que cero")
+        self.path = path
+        self.max_batch = max_batch
+        self._connect = Connect(path, raise_exceptions=raise_exceptions, fetch_size=fetch_size, **options)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='sqlite3manager')
+        self._write_slots = asyncio.Semaphore(max_pending_writes)
+        self._pending: list[tuple[asyncio.Future, str, tuple, dict]] = []
+        self._flush_task: asyncio.Task | None = None
+
+    def __str__(self) -> str:
+        return str(self._connect)
+
+    async def __aenter__(self) -> 'AsyncConnect':
+        await self.connect()
+        return self
+
+    async def __aexit__(self, *exc_info: any) -> None:
+        await self.close()
+
+    async def _call(self, function: Callable[..., ResultType], *args: any, **kwargs: any) -> ResultType:
+        """
+        Ejecuta una función en el hilo de la base de datos.
+
+        Args:
+            function (Callable): Función a ejecutar.
+
+        Returns:
+            El resultado de la función.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(function, *args, **kwargs))
+
+    async def _run(self, name: str, *args: any, **kwargs: any) -> any:
+        """
+        Ejecuta un método de Connect en el hilo de la base de datos después de confirmar
+        las escrituras pendientes, para que cada operación vea las anteriores.
+
+        Args:
+            name (str): Nombre del método de Connect.
+
+        Returns:
+            El resultado del método.
+        """
+        if self._pending:
+            await self.flush()
+        return await self._call(getattr(self._connect, name), *args, **kwargs)
+
+    async def _write(self, name: str, *args: any, **kwargs: any) -> any:
+        """
+        Encola una escritura para confirmarla junto con las demás escrituras concurrentes.
+
+        Args:
+            name (str): Nombre del método de escritura de Connect.
+
+        Returns:
+            El resultado del método.
+        """
+        async with self._write_slots:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._pending.append((future, name, args, kwargs))
+            if self._flush_task is None:
+                self._flush_task = loop.create_task(self._drain())
+            return await future
+
+    async def _drain(self) -> None:
+        """
+        Confirma las escrituras en cola hasta vaciarla.
+        """
+        try:
+            await self.flush()
+        finally:
+            self._flush_task = None
+
+    def _apply_writes(self, batch: list[tuple[str, tuple, dict]]) -> list[tuple[bool, any]]:
+        """
+        Aplica un lote de escrituras en una sola transacción. Se ejecuta en el hilo de la base de datos.
+
+        Args:
+            batch (list): Escrituras a aplicar como (método, args, kwargs).
+
+        Returns:
+            list[tuple[bool, any]]: Por cada escritura, si tuvo éxito y su resultado o excepción.
+        """
+        results: list[tuple[bool, any]] = []
+        with self._connect.transaction():
+            for name, args, kwargs in batch:
+                try:
+                    with self._connect.transaction():
+                        results.append((True, getattr(self._connect, name)(*args, **kwargs)))
+                except Exception as e:
+                    results.append((False, e))
+        return results
+
+    async def flush(self) -> None:
+        """
+        Confirma inmediatamente todas las escrituras en cola.
+
+        Returns:
+            None
+
+        Example:
+            >>> await conn.flush()
+        """
+        while self._pending:
+            batch, self._pending = self._pending[:self.max_batch], self._pending[self.max_batch:]
+            try:
+                results = await self._call(self._apply_writes, [(name, args, kwargs) for _, name, args, kwargs in batch])
+            except Exception as e:
+                for future, *_ in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            for (future, *_), (success, value) in zip(batch, results):
+                if future.done():
+                    continue
+                if success:
+                    future.set_result(value)
+                else:
+                    future.set_exception(value)
+
+    async def _stream(self, name: str, *args: any, batch_size: int | None = None, **kwargs: any) -> AsyncIterator[tuple[int | float | str, ...]]:
+        """
+        Recorre un iterador de Connect pidiendo un lote al hilo de la base de datos cada vez que el
+        consumidor termina el anterior, por lo que nunca se leen filas que aún no se pidieron.
+
+        Args:
+            name (str): Nombre del método iterador de Connect.
+            batch_size (int | None): Filas por lote. Si es None se usa fetch_size.
+
+        Yields:
+            tuple: Cada fila del resultado.
+        """
+        size = batch_size or self._connect.fetch_size
+        async for row in self._iterate(await self._run(name, *args, batch_size=size, **kwargs), size):
+            yield row
+
+    async def _iterate(self, items: Iterator | None, size: int) -> AsyncIterator[any]:
+        """
+        Consume un iterador de Connect en el hilo de la base de datos, ``size`` elementos por llamada.
+
+        Args:
+            items (Iterator | None): Iterador devuelto por Connect, o None si el método falló.
+            size (int): Elementos pedidos al hilo en cada llamada.
+
+        Yields:
+            any: Cada elemento del iterador.
+        """
+        if items is None:
+            return
+        try:
+            while batch := await self._call(lambda: list(islice(items, size))):
+                for item in batch:
+                    yield item
+        finally:
+            await self._call(items.close)
+
+    async def run(self, function: Callable[[Connect], ResultType]) -> ResultType:
+        """
+        Ejecuta una función arbitraria con el Connect interno en el hilo de la base de datos.
+        Es útil para agrupar varias operaciones, por ejemplo dentro de ``transaction()``.
+
+        Args:
+            function (Callable[[Connect], any]): Función que recibe la instancia de Connect.
+
+        Returns:
+            El resultado de la función.
+
+        Example:
+            >>> def transfer(db):
+            ...     with db.transaction('IMMEDIATE'):
+            ...         db.update('accounts', {'balance': 0}, {'id': 1})
+            ...         db.update('accounts', {'balance': 100}, {'id': 2})
+            >>> await conn.run(transfer)
+        """
+        if self._pending:
+            await self.flush()
+        return await self._call(function, self._connect)
+
+    async def get_status(self) -> bool:
+        """Versión asíncrona de Connect.get_status()."""
+        return await self._call(self._connect.get_status)
+
+    async def connect(self) -> bool:
+        """Versión asíncrona de Connect.connect()."""
+        return await self._run('connect')
+
+    async def list_table_names(self) -> list[str]:
+        """Versión asíncrona de Connect.list_table_names()."""
+        return await self._run('list_table_names')
+
+    async def get_column_names(self, table_name: str) -> list[str]:
+        """Versión asíncrona de Connect.get_column_names()."""
+        return await self._run('get_column_names', table_name)
+
+    async def read_table(self, table_name: str, columns: Sequence[str] | None = None, order_by: str | Sequence[str] | None = None,
+                         limit: int | None = None, offset: int | None = None, row_factory: str | None = None) -> list[tuple[int | float | str, ...]]:
+        """Versión asíncrona de Connect.read_table()."""
+        return await self._run('read_table', table_name, columns, order_by, limit, offset, row_factory)
+
+    async def search(self, table_name: str, condition: Condition | None = None, columns: Sequence[str] | None = None, order_by: str | Sequence[str] | None = None,
+                     limit: int | None = None, offset: int | None = None, after: Sequence[any] | None = None,
+                     row_factory: str | None = None) -> list[tuple[int | float | str, ...]]:
+        """Versión asíncrona de Connect.search()."""
+        return await self._run('search', table_name, condition, columns, order_by, limit, offset, after, row_factory)
+
+    async def count(self, table_name: str, condition: Condition | None = None) -> int:
+        """Versión asíncrona de Connect.count()."""
+        return await self._run('count', table_name, condition)
+
+    async def exists(self, table_name: str, condition: Condition | None = None) -> bool:
+        """Versión asíncrona de Connect.exists()."""
+        return await self._run('exists', table_name, condition)
+
+    async def distinct(self, table_name: str, columns: str | Sequence[str], condition: Condition | None = None) -> list[any]:
+        """Versión asíncrona de Connect.distinct()."""
+        return await self._run('distinct', table_name, columns, condition)
+
+    async def aggregate(self, table_name: str, aggregates: dict[str, tuple[str, str]], condition: Condition | None = None,
+                        group_by: str | Sequence[str] | None = None, having: Condition | None = None) -> dict[str, any] | list[dict[str, any]]:
+        """Versión asíncrona de Connect.aggregate()."""
+        return await self._run('aggregate', table_name, aggregates, condition, group_by, having)
+
+    async def read_columns(self, table_name: str, columns: Sequence[str] | None = None, condition: Condition | None = None, batch_size: int | None = None,
+                           numpy: bool = False, dtypes: dict[str, any] | None = None) -> tuple[dict[str, any], dict[str, any]]:
+        """Versión asíncrona de Connect.read_columns()."""
+        return await self._run('read_columns', table_name, columns, condition, batch_size, numpy, dtypes)
+
+    async def custom_query(self, query: str, row_factory: str | None = None) -> list[tuple[int | float | str, ...]]:
+        """Versión asíncrona de Connect.custom_query()."""
+        return await self._run('custom_query', query, row_factory)
+
+    async def parallel_scan(self, table_name: str, map_function: Callable[[Iterator[tuple]], any], reduce_function: Callable[[any, any], any] | None = None,
+                            workers: int | None = None, key: str = 'rowid', condition: Condition | None = None, columns: Sequence[str] | None = None,
+                            partitions: int | None = None, batch_size: int | None = None, initial: any = None) -> any:
+        """Versión asíncrona de Connect.parallel_scan()."""
+        return await self._run('parallel_scan', table_name, map_function, reduce_function, workers=workers, key=key, condition=condition,
+                               columns=columns, partitions=partitions, batch_size=batch_size, initial=initial)
+
+    def iter_table(self, table_name: str, batch_size: int | None = None, row_factory: str | None = None) -> AsyncIterator[tuple[int | float | str, ...]]:
+        """
+        Versión asíncrona de Connect.iter_table().
+
+        Example:
+            >>> async for row in conn.iter_table('users'):
+            ...     print(row)
+        """
+        return self._stream('iter_table', table_name, batch_size=batch_size, row_factory=row_factory)
+
+    def iter_search(self, table_name: str, condition: Condition, batch_size: int | None = None, row_factory: str | None = None) -> AsyncIterator[tuple[int | float | str, ...]]:
+        """Versión asíncrona de Connect.iter_search()."""
+        return self._stream('iter_search', table_name, condition, batch_size=batch_size, row_factory=row_factory)
+
+    def iter_query(self, query: str, params: tuple | dict = (), batch_size: int | None = None, row_factory: str | None = None) -> AsyncIterator[tuple[int | float | str, ...]]:
+        """Versión asíncrona de Connect.iter_query()."""
+        return self._stream('iter_query', query, params, batch_size=batch_size, row_factory=row_factory)
+
+    async def iter_pages(self, table_name: str, order_by: str | Sequence[str], page_size: int = 1000, condition: Condition | None = None,
+                         columns: Sequence[str] | None = None, row_factory: str | None = None) -> AsyncIterator[list[tuple[int | float | str, ...]]]:
+        """
+        Versión asíncrona de Connect.iter_pages(). Cada página se lee en el hilo de la base de datos cuando
+        el consumidor termina la anterior.
+
+        Example:
+            >>> async for page in conn.iter_pages('users', 'id', page_size=500):
+            ...     process(page)
+        """
+        pages = await self._run('iter_pages', table_name, order_by, page_size, condition, columns, row_factory)
+        async for page in self._iterate(pages, 1):
+            yield page
+
+    async def insert(self, table_name: str, data: dict[str, any]) -> bool:
+        """Versión asíncrona de Connect.insert(). Se agrupa con las escrituras concurrentes."""
+        return await self._write('insert', table_name, data)
+
+    async def bulk_insert(self, table_name: str, data_list: Sequence[dict[str, any] | Sequence[any]], columns: Sequence[str] | None = None, chunk_size: int = 500) -> bool:
+        """Versión asíncrona de Connect.bulk_insert(). Se agrupa con las escrituras concurrentes."""
+        return await self._write('bulk_insert', table_name, data_list, columns=columns, chunk_size=chunk_size)
+
+    async def update(self, table_name: str, data: dict[str, any], condition: Condition) -> bool:
+        """Versión asíncrona de Connect.update(). Se agrupa con las escrituras concurrentes."""
+        return await self._write('update', table_name, data, condition)
+
+    async def delete(self, table_name: str, condition: Condition) -> bool:
+        """Versión asíncrona de Connect.delete(). Se agrupa con las escrituras concurrentes."""
+        return await self._write('delete', table_name, condition)
+
+    async def bulk_update(self, table_name: str, data_list: Sequence[dict[str, any]], key: str | Sequence[str] | None = None, chunk_size: int = 10000) -> int:
+        """Versión asíncrona de Connect.bulk_update(). Se agrupa con las escrituras concurrentes."""
+        return await self._write('bulk_update', table_name, data_list, key=key, chunk_size=chunk_size)
+
+    async def bulk_delete(self, table_name: str, conditions: Sequence[dict[str, any]], chunk_size: int = 10000) -> int:
+        """Versión asíncrona de Connect.bulk_delete(). Se agrupa con las escrituras concurrentes."""
+        return await self._write('bulk_delete', table_name, conditions, chunk_size=chunk_size)
+
+    async def upsert(self, table_name: str, data: dict[str, any], conflict: str | Sequence[str] | None = None, update: Sequence[str] | None = None) -> int:
+        """Versión asíncrona de Connect.upsert(). Se agrupa con las escrituras concurrentes."""
+        return await self._write('upsert', table_name, data, conflict=conflict, update=update)
+
+    async def bulk_upsert(self, table_name: str, data_list: Sequence[dict[str, any] | Sequence[any]], columns: Sequence[str] | None = None,
+                          conflict: str | Sequence[str] | None = None, update: Sequence[str] | None = None, chunk_size: int = 10000) -> int:
+        """Versión asíncrona de Connect.bulk_upsert(). Se agrupa con las escrituras concurrentes."""
+        return await self._write('bulk_upsert', table_name, data_list, columns=columns, conflict=conflict, update=update, chunk_size=chunk_size)
+
+    async def import_csv(self, table_name: str, source: str | IO[str], columns: Sequence[str] | None = None, header: bool = True, create: bool = False,
+                         column_types: dict[str, str] | None = None, delimiter: str = ',', chunk_size: int = 10000,
+                         progress: Callable[[int, float], None] | None = None) -> dict[str, float]:
+        """Versión asíncrona de Connect.import_csv(). El progreso se notifica desde el hilo de la base de datos."""
+        return await self._run('import_csv', table_name, source, columns, header, create, column_types, delimiter, chunk_size, progress)
+
+    async def import_jsonl(self, table_name: str, source: str | IO[str], columns: Sequence[str] | None = None, create: bool = False,
+                           column_types: dict[str, str] | None = None, chunk_size: int = 10000,
+                           progress: Callable[[int, float], None] | None = None) -> dict[str, float]:
+        """Versión asíncrona de Connect.import_jsonl(). El progreso se notifica desde el hilo de la base de datos."""
+        return await self._run('import_jsonl', table_name, source, columns, create, column_types, chunk_size, progress)
+
+    async def export_csv(self, table_name: str, target: str | IO[str], columns: Sequence[str] | None = None, condition: Condition | None = None,
+                         header: bool = True, delimiter: str = ',', batch_size: int | None = None,
+                         progress: Callable[[int, float], None] | None = None) -> dict[str, float]:
+        """Versión asíncrona de Connect.export_csv(). El progreso se notifica desde el hilo de la base de datos."""
+        return await self._run('export_csv', table_name, target, columns, condition, header, delimiter, batch_size, progress)
+
+    async def export_jsonl(self, table_name: str, target: str | IO[str], columns: Sequence[str] | None = None, condition: Condition | None = None,
+                           batch_size: int | None = None, progress: Callable[[int, float], None] | None = None) -> dict[str, float]:
+        """Versión asíncrona de Connect.export_jsonl(). El progreso se notifica desde el hilo de la base de datos."""
+        return await self._run('export_jsonl', table_name, target, columns, condition, batch_size, progress)
+
+    async def create_table(self, table_name: str, columns: dict[str, any], apply_constraints: bool = False) -> bool:
+        """Versión asíncrona de Connect.create_table()."""
+        return await self._run('create_table', table_name, columns, apply_constraints)
+
+    async def add_column(self, table_name: str, column_name: str, column_type: str) -> bool:
+        """Versión asíncrona de Connect.add_column()."""
+        return await self._run('add_column', table_name, column_name, column_type)
+
+    async def drop_column(self, table_name: str, column_name: str) -> bool:
+        """Versión asíncrona de Connect.drop_column()."""
+        return await self._run('drop_column', table_name, column_name)
+
+    async def alter_table(self, table_name: str, operations: Sequence[tuple[str, ...]]) -> bool:
+        """Versión asíncrona de Connect.alter_table()."""
+        return await self._run('alter_table', table_name, operations)
+
+    async def drop_table(self, table_name: str) -> bool:
+        """Versión asíncrona de Connect.drop_table()."""
+        return await self._run('drop_table', table_name)
+
+    async def create_index(self, table_name: str, columns: str | Sequence[str], index_name: str | None = None, unique: bool = False,
+                           where: str | None = None, include: Sequence[str] | None = None) -> bool:
+        """Versión asíncrona de Connect.create_index()."""
+        return await self._run('create_index', table_name, columns, index_name=index_name, unique=unique, where=where, include=include)
+
+    async def drop_index(self, index_name: str) -> bool:
+        """Versión asíncrona de Connect.drop_index()."""
+        return await self._run('drop_index', index_name)
+
+    async def list_indexes(self, table_name: str | None = None) -> list[dict[str, any]]:
+        """Versión asíncrona de Connect.list_indexes()."""
+        return await self._run('list_indexes', table_name)
+
+    async def analyze(self, table_name: str | None = None) -> bool:
+        """Versión asíncrona de Connect.analyze()."""
+        return await self._run('analyze', table_name)
+
+    async def open_blob(self, table_name: str, column: str, rowid: int, readonly: bool = True) -> BlobStream:
+        """
+        Versión asíncrona de Connect.open_blob(). El flujo devuelto es síncrono: conviene leerlo por trozos
+        con run() o en un hilo para no bloquear el bucle de eventos con BLOBs grandes.
+        """
+        return await self._run('open_blob', table_name, column, rowid, readonly)
+
+    async def insert_blob_stream(self, table_name: str, column: str, source: str | BinaryIO, data: dict[str, any] | None = None,
+                                 size: int | None = None, chunk_size: int = 1048576) -> int:
+        """Versión asíncrona de Connect.insert_blob_stream()."""
+        return await self._run('insert_blob_stream', table_name, column, source, data, size, chunk_size)
+
+    async def enable_change_tracking(self, table_name: str) -> bool:
+        """Versión asíncrona de Connect.enable_change_tracking()."""
+        return await self._run('enable_change_tracking', table_name)
+
+    async def disable_change_tracking(self, table_name: str) -> bool:
+        """Versión asíncrona de Connect.disable_change_tracking()."""
+        return await self._run('disable_change_tracking', table_name)
+
+    async def changes_since(self, table_name: str, version: int = 0, limit: int | None = 1000) -> list[tuple[int, str, int, tuple | None]]:
+        """Versión asíncrona de Connect.changes_since()."""
+        return await self._run('changes_since', table_name, version, limit)
+
+    async def prune_changes(self, before: int | None = None, keep: int | None = None, table_name: str | None = None) -> int:
+        """Versión asíncrona de Connect.prune_changes()."""
+        return await self._run('prune_changes', before, keep, table_name)
+
+    async def backup(self, target_path: str, pages_per_step: int = 1024, progress: Callable[[int, int], None] | None = None,
+                     sleep: float = 0.01) -> dict[str, float]:
+        """Versión asíncrona de Connect.backup()."""
+        return await self._run('backup', target_path, pages_per_step, progress, sleep)
+
+    async def load_into_memory(self, flush_interval: float | None = None, pages_per_step: int = 1024) -> bool:
+        """Versión asíncrona de Connect.load_into_memory()."""
+        return await self._run('load_into_memory', flush_interval, pages_per_step)
+
+    async def persist_from_memory(self, pages_per_step: int = 1024, release: bool = False) -> bool:
+        """Versión asíncrona de Connect.persist_from_memory()."""
+        return await self._run('persist_from_memory', pages_per_step, release)
+
+    async def serialize(self, schema: str = 'main') -> bytes:
+        """Versión asíncrona de Connect.serialize()."""
+        return await self._run('serialize', schema)
+
+    async def deserialize(self, data: bytes) -> bool:
+        """Versión asíncrona de Connect.deserialize()."""
+        return await self._run('deserialize', data)
+
+    async def close(self) -> None:
+        """
+        Confirma las escrituras pendientes, cierra la conexión y detiene el hilo de la base de datos.
+
+        Returns:
+            None
+        """
+        await self._run('close')
+        self._executor.shutdown(wait=True)
@@ -0,0 +1,135 @@
+from contextlib import contextmanager
+from io import RawIOBase, SEEK_SET
+from typing import Any as any, BinaryIO, Iterator
+
+
+@contextmanager
+def open_binary(source: str | BinaryIO, mode: str) -> Iterator[BinaryIO]:
+    """
+    Abre una ruta como archivo binario o usa tal cual un archivo ya abierto, que no se cierra.
+
+    Args:
+        source (str | BinaryIO): Ruta o archivo binario.
+        mode (str): 'rb' o 'wb'.
+
+    Yields:
+        BinaryIO: Archivo binario.
+    """
+    if isinstance(source, str):
+        with open(source, mode) as file:
+            yield file
+    else:
+        yield source
+
+
+class BlobStream(RawIOBase):
+    """
+    Flujo de lectura y escritura sobre un valor BLOB, creado por Connect.open_blob().
+
+    Lee y escribe directamente en el BLOB por trozos con la E/S incremental de SQLite (``Connection.blobopen``),
+    sin cargar el valor completo en memoria. Es un archivo binario estándar de ``io``: admite read(), readinto(),
+    write(), seek() y tell(), y se puede usar con ``shutil.copyfileobj`` o como gestor de contexto. El tamaño del
+    BLOB es fijo: las escrituras no pueden ir más allá del final. El flujo deja de ser válido si la fila cambia
+    por otra vía.
+
+    Args:
+        blob (sqlite3.Blob): BLOB abierto.
+        readonly (bool): Indica si el BLOB se abrió en solo lectura.
+    """
+
+    def __init__(self, blob: any, readonly: bool) -> None:
+        """
+        Inicializa el flujo sobre un BLOB abierto.
+
+        Args:
+            blob (sqlite3.Blob): BLOB abierto.
+            readonly (bool): Indica si el BLOB se abrió en solo lectura.
+        """
+        super().__init__()
+        self._blob = blob
+        self._readonly = readonly
+
+    def __len__(self) -> int:
+        return len(self._blob)
+
+    def readable(self) -> bool:
+        return True
+
+    def writable(self) -> bool:
+        return not self._readonly
+
+    def seekable(self) -> bool:
+        return True
+
+    def read(self, size: int | None = -1) -> bytes:
+        """
+        Lee hasta ``size`` bytes desde la posición actual.
+
+        Args:
+            size (int | None): Bytes a leer. Si es negativo o None se lee hasta el final.
+
+        Returns:
+            bytes: Datos leídos; vacío al final del BLOB.
+        """
+        self._checkClosed()
+        return self._blob.read(-1 if size is None else size)
+
+    def readinto(self, buffer: any) -> int:
+        """
+        Lee en un búfer del llamador (bytearray, memoryview, array...) tantos bytes como quepan, reutilizando
+        su memoria en lugar de crear un objeto por lectura.
+
+        Args:
+            buffer: Objeto con protocolo de búfer escribible.
+
+        Returns:
+            int: Bytes leídos; 0 al final del BLOB.
+        """
+        self._checkClosed()
+        view = memoryview(buffer).cast('B')
+        data = self._blob.read(len(view))
+        view[:len(data)] = data
+        return len(data)
+
+    def write(self, data: any) -> int:
+        """
+        Escribe datos desde la posición actual.
+
+        Args:
+            data: bytes u otro objeto con protocolo de búfer.
+
+        Returns:
+            int: Bytes escritos.
+        """
+        self._checkClosed()
+        if self._readonly:
+            raise ValueError("El BLOB está abierto en solo lectura")
+        self._blob.write(data)
+        return memoryview(data).nbytes
+
+    def seek(self, offset: int, whence: int = SEEK_SET) -> int:
+        """
+        Cambia la posición actual.
+
+        Args:
+            offset (int): Desplazamiento.
+            whence (int): Referencia: SEEK_SET, SEEK_CUR o SEEK_END. Por defecto es SEEK_SET.
+
+        Returns:
+            int: Nueva posición.
+        """
+        self._checkClosed()
+        self._blob.seek(offset, whence)
+        return self._blob.tell()
+
+    def tell(self) -> int:
+        self._checkClosed()
+        return self._blob.tell()
+
+    def close(self) -> None:
+        """
+        Cierra el BLOB. Las escrituras ya están en la base de datos y se confirman con la transacción en curso.
+        """
+        if not self.closed:
+            self._blob.close()
+        super().close()
@@ -0,0 +1,376 @@
+from sqlite3 import Connection
+from collections import OrderedDict
+from sys import getsizeof
+from threading import Lock
+from time import monotonic
+from typing import Any as any, Callable, Hashable, cast
+
+
+class StatementCache:
+    """
+    Caché LRU del texto SQL generado por los métodos CRUD de Connect.
+
+    La clave describe la forma de la sentencia (operación, tabla y columnas), de modo que las llamadas
+    con la misma forma reutilizan exactamente la misma cadena SQL, lo que además permite que el caché
+    de sentencias preparadas de sqlite3 la encuentre sin volver a compilarla.
+
+    Args:
+        build (Callable[..., str]): Función que genera el SQL a partir de los elementos de la clave.
+        max_size (int): Número máximo de sentencias guardadas. Por defecto es 256.
+    """
+    max_size: int
+    hits: int
+    misses: int
+
+    def __init__(self, build: Callable[..., str], max_size: int = 256) -> None:
+        """
+        Inicializa un caché vacío.
+
+        Args:
+            build (Callable[..., str]): Función que genera el SQL a partir de los elementos de la clave.
+            max_size (int): Número máximo de sentencias guardadas. Por defecto es 256.
+        """
+        if max_size < 1:
+            raise ValueError("max_size debe ser mayor que cero")
+        self.max_size = max_size
+        self._build = build
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Hashable, str] = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: tuple[Hashable, ...]) -> str:
+        """
+        Devuelve la sentencia guardada para la clave, generándola si no existe.
+
+        Args:
+            key (tuple): Forma de la sentencia, que se pasa tal cual a la función generadora.
+
+        Returns:
+            str: Texto SQL de la sentencia.
+        """
+        with self._lock:
+            sql = self._entries.get(key)
+            if sql is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return sql
+            self.misses += 1
+        sql = self._build(*key)
+        with self._lock:
+            self._entries[key] = sql
+            if len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        return sql
+
+    def clear(self) -> None:
+        """
+        Vacía el caché sin reiniciar los contadores.
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def info(self) -> dict[str, any]:
+        """
+        Informa del uso del caché.
+
+        Returns:
+            dict: Aciertos, fallos, tamaño actual y tamaño máximo.
+        """
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'size': len(self._entries), 'max_size': self.max_size}
+
+
+class SchemaCache:
+    """
+    Caché de los metadatos del esquema (tablas, columnas, tipos, claves primarias e índices) de una conexión.
+
+    Antes de responder compara ``PRAGMA schema_version``, una lectura de la cabecera de la base de datos
+    sin coste apreciable, con la versión de la última carga; si el esquema cambió, incluso desde otra
+    conexión o proceso, los metadatos se descartan y se vuelven a leer bajo demanda.
+
+    Args:
+        connection (Connection): Conexión cuyos metadatos se guardan.
+        static (bool): Indica que el esquema no puede cambiar (bases de datos inmutables), por lo que no se
+            comprueba la versión. Por defecto es False.
+    """
+
+    def __init__(self, connection: Connection, static: bool = False) -> None:
+        """
+        Inicializa un caché vacío para la conexión.
+
+        Args:
+            connection (Connection): Conexión cuyos metadatos se guardan.
+            static (bool): Indica que el esquema no puede cambiar. Por defecto es False.
+        """
+        self._connection = connection
+        self._static = static
+        self._version: int | None = None
+        self._tables: list[str] | None = None
+        self._objects: set[str] | None = None
+        self._table_info: dict[str, dict[str, any]] = {}
+
+    def _check(self) -> None:
+        """
+        Descarta los metadatos guardados si la versión del esquema cambió.
+        """
+        if self._static and self._version is not None:
+            return
+        version = self._connection.execute("PRAGMA schema_version").fetchone()[0]
+        if version != self._version:
+            self.invalidate()
+            self._version = version
+
+    def invalidate(self) -> None:
+        """
+        Descarta todos los metadatos guardados.
+        """
+        self._version = None
+        self._tables = None
+        self._objects = None
+        self._table_info.clear()
+
+    def tables(self) -> list[str]:
+        """
+        Lista las tablas de la base de datos.
+
+        Returns:
+            list[str]: Nombres de las tablas en el orden de sqlite_master.
+        """
+        self._check()
+        if self._tables is None:
+            rows = self._connection.execute("SELECT name, type FROM sqlite_master WHERE type IN ('table', 'view')").fetchall()
+            self._tables = [str(name) for name, kind in rows if kind == 'table']
+            self._objects = {str(name).lower() for name, _ in rows}
+        return self._tables
+
+    def has_table(self, table_name: str) -> bool:
+        """
+        Indica si existe una tabla o vista con ese nombre en el esquema principal.
+
+        Args:
+            table_name (str): El nombre de la tabla.
+
+        Returns:
+            bool: True si existe.
+        """
+        self.tables()
+        return table_name.lower() in cast(set[str], self._objects)
+
+    def table(self, table_name: str) -> dict[str, any]:
+        """
+        Obtiene los metadatos de una tabla.
+
+        Args:
+            table_name (str): El nombre de la tabla.
+
+        Returns:
+            dict: Con las claves 'columns' (list[str]), 'types' (dict[str, str]),
+                'primary_key' (list[str]) e 'indexes' (list[str]).
+        """
+        self._check()
+        key = table_name.lower()
+        info = self._table_info.get(key)
+        if info is None:
+            columns = self._connection.execute(f"PRAGMA table_info({table_name})").fetchall()
+            indexes = self._connection.execute(f"PRAGMA index_list({table_name})").fetchall() if columns else []
+            info = {
+                'columns': [str(column[1]) for column in columns],
+                'types': {str(column[1]): str(column[2]) for column in columns},
+                'primary_key': [str(column[1]) for column in sorted(columns, key=lambda column: column[5]) if column[5]],
+                'indexes': [str(index[1]) for index in indexes],
+            }
+            self._table_info[key] = info
+        return info
+
+    def columns(self, table_name: str) -> list[str]:
+        """
+        Lista las columnas de una tabla.
+
+        Args:
+            table_name (str): El nombre de la tabla.
+
+        Returns:
+            list[str]: Nombres de las columnas. Lista vacía si la tabla no existe.
+        """
+        return self.table(table_name)['columns']
+
+
+class ResultCache:
+    """
+    Caché LRU de resultados de lectura con invalidación por tabla.
+
+    Cada entrada se guarda con la lista de tablas de las que depende. Connect invalida esas tablas cada vez
+    que escribe en ellas y vacía el caché completo cuando ``PRAGMA data_version`` indica que otra conexión
+    o proceso confirmó cambios. Los límites se aplican por número de entradas, por bytes aproximados y,
+    opcionalmente, por antigüedad.
+
+    Args:
+        max_entries (int): Número máximo de resultados guardados. Por defecto es 1024.
+        max_bytes (int): Tamaño aproximado máximo en bytes de todos los resultados. Por defecto es 64 MiB.
+        ttl (float | None): Segundos que vive cada entrada. None indica que no caducan. Por defecto es None.
+    """
+    max_entries: int
+    max_bytes: int
+    ttl: float | None
+    hits: int
+    misses: int
+    evictions: int
+
+    def __init__(self, max_entries: int = 1024, max_bytes: int = 64 * 1024 * 1024, ttl: float | None = None) -> None:
+        """
+        Inicializa un caché vacío.
+
+        Args:
+            max_entries (int): Número máximo de resultados guardados. Por defecto es 1024.
+            max_bytes (int): Tamaño aproximado máximo en bytes de todos los resultados. Por defecto es 64 MiB.
+            ttl (float | None): Segundos que vive cada entrada. None indica que no caducan. Por defecto es None.
+        """
+        if max_entries < 1 or max_bytes < 1:
+            raise ValueError("max_entries y max_bytes deben ser mayores que cero")
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[Hashable, tuple[list[any], int, float | None, tuple[str, ...]]] = OrderedDict()
+        self._by_table: dict[str, set[Hashable]] = {}
+        self._bytes = 0
+        self._writes = 0
+        self._lock = Lock()
+
+    @staticmethod
+    def _size_of(rows: list[any]) -> int:
+        """
+        Estima la memoria que ocupa un resultado.
+
+        Args:
+            rows (list): Filas del resultado.
+
+        Returns:
+            int: Tamaño aproximado en bytes.
+        """
+        size = getsizeof(rows)
+        for row in rows:
+            size += getsizeof(row)
+            for value in row.values() if isinstance(row, dict) else row:
+                size += getsizeof(value)
+        return size
+
+    def _remove(self, key: Hashable) -> None:
+        """
+        Elimina una entrada. Debe llamarse con ``_lock`` adquirido.
+
+        Args:
+            key (Hashable): Clave de la entrada.
+        """
+        _, size, _, tables = self._entries.pop(key)
+        self._bytes -= size
+        for table in tables:
+            keys = self._by_table.get(table)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._by_table[table]
+
+    def get(self, key: Hashable) -> list[any] | None:
+        """
+        Busca un resultado guardado.
+
+        Args:
+            key (Hashable): Consulta normalizada y sus parámetros.
+
+        Returns:
+            list | None: Copia de las filas guardadas, o None si no hay una entrada vigente.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[2] is not None and entry[2] < monotonic():
+                self._remove(key)
+                self.evictions += 1
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return list(entry[0])
+
+    def write_token(self) -> int:
+        """
+        Devuelve un valor que cambia con cada invalidación. Se toma antes de ejecutar una lectura y se pasa
+        a put() para descartar resultados que pudieron quedar obsoletos mientras se leían.
+
+        Returns:
+            int: Contador de invalidaciones.
+        """
+        return self._writes
+
+    def put(self, key: Hashable, rows: list[any], tables: tuple[str, ...], token: int) -> None:
+        """
+        Guarda un resultado, expulsando las entradas menos usadas si se superan los límites.
+
+        Args:
+            key (Hashable): Consulta normalizada y sus parámetros.
+            rows (list): Filas del resultado.
+            tables (tuple[str, ...]): Tablas de las que depende el resultado.
+            token (int): Valor de write_token() tomado antes de la lectura.
+        """
+        size = self._size_of(rows)
+        if size > self.max_bytes:
+            return
+        tables = tuple(table.lower() for table in tables)
+        expires = monotonic() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            if token != self._writes:
+                return
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (list(rows), size, expires, tables)
+            self._bytes += size
+            for table in tables:
+                self._by_table.setdefault(table, set()).add(key)
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def invalidate_table(self, table_name: str) -> None:
+        """
+        Descarta los resultados que dependen de una tabla.
+
+        Args:
+            table_name (str): El nombre de la tabla modificada.
+        """
+        with self._lock:
+            self._writes += 1
+            for key in list(self._by_table.get(table_name.lower(), ())):
+                self._remove(key)
+
+    def clear(self) -> None:
+        """
+        Descarta todos los resultados guardados.
+        """
+        with self._lock:
+            self._writes += 1
+            self._entries.clear()
+            self._by_table.clear()
+            self._bytes = 0
+
+    def info(self) -> dict[str, any]:
+        """
+        Informa del uso del caché.
+
+        Returns:
+            dict: Aciertos, fallos, expulsiones, entradas y bytes actuales y sus límites.
+        """
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+                'max_entries': self.max_entries,
+                'max_bytes': self.max_bytes,
+            }
@@ -0,0 +1,101 @@
+from sqlite3 import Cursor
+from array import array
+from typing import Any as any, Sequence
+
+
+def column_typecode(declared_type: str) -> str | None:
+    """
+    Elige el typecode de array.array para una columna según la afinidad de su tipo declarado,
+    siguiendo las reglas de SQLite: INTEGER para tipos con 'INT' y REAL para 'REAL', 'FLOA' o 'DOUB'.
+    Las columnas de texto, BLOB o afinidad NUMERIC (DATETIME, DECIMAL, BOOLEAN...) no tienen typecode,
+    porque SQLite guarda en ellas tal cual los valores que no son números, como las fechas en texto.
+
+    Args:
+        declared_type (str): Tipo declarado en el CREATE TABLE.
+
+    Returns:
+        str | None: 'q' para enteros, 'd' para reales o None si los valores se guardan en una lista.
+
+    Example:
+        >>> column_typecode('BIGINT')
+        'q'
+        >>> column_typecode('DATETIME')
+    """
+    declared = declared_type.upper()
+    if 'INT' in declared:
+        return 'q'
+    if 'CHAR' in declared or 'CLOB' in declared or 'TEXT' in declared:
+        return None
+    if 'REAL' in declared or 'FLOA' in declared or 'DOUB' in declared:
+        return 'd'
+    return None
+
+
+def fetch_columns(cursor: Cursor, names: Sequence[str], typecodes: Sequence[str | None], batch_size: int) -> tuple[dict[str, array | list[any]], dict[str, bytearray]]:
+    """
+    Lee un cursor ya ejecutado por lotes y reparte los valores por columnas sin guardar las filas.
+
+    Los NULL se sustituyen por 0 en las columnas numéricas (o se dejan como None en las listas) y se marcan
+    con un 1 en la máscara de la columna. Si una columna numérica contiene un valor que su array no admite
+    (por ejemplo texto en una columna INTEGER de una tabla sin STRICT), la columna pasa a ser una lista.
+
+    Args:
+        cursor (Cursor): Cursor dedicado con la consulta ya ejecutada. Se cierra al terminar.
+        names (Sequence[str]): Nombres de las columnas, en el orden de la consulta.
+        typecodes (Sequence[str | None]): Typecode de array.array de cada columna, o None para usar una lista.
+        batch_size (int): Filas leídas por cada llamada a fetchmany.
+
+    Returns:
+        tuple[dict, dict]: Valores y máscaras de NULL de cada columna.
+    """
+    typecodes = list(typecodes)
+    values: list[array | list[any]] = [array(code) if code else [] for code in typecodes]
+    masks = [bytearray() for _ in names]
+    try:
+        while batch := cursor.fetchmany(batch_size):
+            for index, column in enumerate(zip(*batch)):
+                nulls = bytearray(value is None for value in column) if None in column else bytes(len(column))
+                if not typecodes[index]:
+                    values[index].extend(column)
+                else:
+                    size = len(values[index])
+                    try:
+                        values[index].extend(column if 1 not in nulls else tuple(0 if value is None else value for value in column))
+                    except (TypeError, OverflowError):
+                        # Valor no admitido por el array: la columna continúa como lista, con None en los NULL ya leídos.
+                        del values[index][size:]
+                        values[index] = [None if null else value for value, null in zip(values[index], masks[index])] + list(column)
+                        typecodes[index] = None
+                masks[index] += nulls
+    finally:
+        cursor.close()
+    return dict(zip(names, values)), dict(zip(names, masks))
+
+
+def to_numpy(columns: dict[str, array | list[any]], masks: dict[str, bytearray], dtypes: dict[str, any]) -> tuple[dict[str, any], dict[str, any]]:
+    """
+    Convierte el resultado de fetch_columns en arrays de NumPy. Requiere el extra opcional ``numpy``.
+
+    Args:
+        columns (dict): Valores de cada columna.
+        masks (dict): Máscaras de NULL de cada columna.
+        dtypes (dict): dtype de NumPy para las columnas que no deban usar el tipo por defecto.
+
+    Returns:
+        tuple[dict, dict]: Arrays de valores y arrays booleanos de NULL de cada columna.
+    """
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError("El modo NumPy requiere numpy: pip install sqlite3-manager[numpy]") from None
+
+    arrays = {}
+    for name, values in columns.items():
+        if isinstance(values, array):
+            dtype = numpy.int64 if values.typecode == 'q' else numpy.float64
+            result = numpy.frombuffer(values, dtype=dtype) if len(values) else numpy.empty(0, dtype=dtype)
+        else:
+            result = numpy.empty(len(values), dtype=object)
+            result[:] = values
+        arrays[name] = result.astype(dtypes[name]) if name in dtypes else result
+    return arrays, {name: numpy.frombuffer(bytes(mask), dtype=numpy.bool_) for name, mask in masks.items()}
@@ -0,0 +1,189 @@
+from collections import deque
+from math import inf
+from threading import Lock, local
+from typing import Any as any, Callable
+
+# Límites superiores, en segundos, de los intervalos del histograma de latencias.
+LATENCY_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, inf)
+
+
+class Instrumentation:
+    """
+    Punto central de mensajes y métricas de Connect.
+
+    Sustituye a los ``print`` de cada método: los mensajes solo se escriben si ``verbose`` es True y se
+    envían a la función ``log`` indicada. Además puede medir cada llamada a los métodos públicos (tiempo,
+    filas devueltas o afectadas y errores), guardar un histograma de latencias por método, registrar el
+    SQL ejecutado mediante ``set_trace_callback`` y anotar las llamadas que superen un umbral de lentitud.
+
+    Args:
+        verbose (bool): Indica si se escriben los mensajes informativos y de error. Por defecto es True.
+        collect_stats (bool): Indica si se miden las llamadas. Por defecto es True.
+        slow_query_threshold (float | None): Segundos a partir de los cuales una llamada se considera lenta. Por defecto es None.
+        trace_sql (bool): Indica si se registra el SQL ejecutado en cada llamada. Por defecto es False.
+        log (Callable[[str], None] | None): Función que recibe los mensajes. Por defecto es print.
+        on_slow_query (Callable[[dict], None] | None): Función que recibe cada llamada lenta. Por defecto es None.
+        max_slow_queries (int): Llamadas lentas que se conservan en slow_queries. Por defecto es 100.
+    """
+    verbose: bool
+    collect_stats: bool
+    slow_query_threshold: float | None
+    trace_sql: bool
+    slow_queries: deque[dict[str, any]]
+
+    def __init__(self, verbose: bool = True, collect_stats: bool = True, slow_query_threshold: float | None = None, trace_sql: bool = False,
+                 log: Callable[[str], None] | None = None, on_slow_query: Callable[[dict[str, any]], None] | None = None, max_slow_queries: int = 100) -> None:
+        """
+        Inicializa la instrumentación sin métricas acumuladas.
+
+        Args:
+            verbose (bool): Indica si se escriben los mensajes informativos y de error. Por defecto es True.
+            collect_stats (bool): Indica si se miden las llamadas. Por defecto es True.
+            slow_query_threshold (float | None): Segundos a partir de los cuales una llamada se considera lenta. Por defecto es None.
+            trace_sql (bool): Indica si se registra el SQL ejecutado en cada llamada. Por defecto es False.
+            log (Callable[[str], None] | None): Función que recibe los mensajes. Por defecto es print.
+            on_slow_query (Callable[[dict], None] | None): Función que recibe cada llamada lenta. Por defecto es None.
+            max_slow_queries (int): Llamadas lentas que se conservan en slow_queries. Por defecto es 100.
+        """
+        self.verbose = verbose
+        self.collect_stats = collect_stats
+        self.slow_query_threshold = slow_query_threshold
+        self.trace_sql = trace_sql
+        self.slow_queries = deque(maxlen=max_slow_queries)
+        self._log = log or print
+        self._on_slow_query = on_slow_query
+        self._stats: dict[str, dict[str, any]] = {}
+        self._lock = Lock()
+        self._local = local()
+
+    @property
+    def active(self) -> bool:
+        """
+        Indica si hay que medir las llamadas.
+
+        Returns:
+            bool: True si se recogen métricas o se vigilan las llamadas lentas.
+        """
+        return self.collect_stats or self.slow_query_threshold is not None
+
+    def message(self, text: str) -> None:
+        """
+        Escribe un mensaje informativo o de error si el modo detallado está activo.
+
+        Args:
+            text (str): Mensaje a escribir.
+        """
+        if self.verbose:
+            self._log(text)
+
+    def trace(self, sql: str) -> None:
+        """
+        Registra una sentencia ejecutada durante la llamada en curso. Se instala como
+        ``set_trace_callback`` de cada conexión cuando ``trace_sql`` es True.
+
+        Args:
+            sql (str): Texto de la sentencia.
+        """
+        statements = getattr(self._local, 'statements', None)
+        if statements is not None and len(statements) < 50:
+            statements.append(sql)
+
+    def begin(self) -> None:
+        """
+        Marca el inicio de una llamada. Las llamadas anidadas comparten el registro de SQL de la externa.
+        """
+        depth = getattr(self._local, 'depth', 0)
+        if depth == 0:
+            self._local.statements = []
+        self._local.depth = depth + 1
+
+    def end(self, method: str, seconds: float, rows: int, failed: bool) -> None:
+        """
+        Registra el final de una llamada.
+
+        Args:
+            method (str): Nombre del método de Connect.
+            seconds (float): Duración de la llamada.
+            rows (int): Filas devueltas o afectadas.
+            failed (bool): Indica si la llamada terminó con una excepción.
+        """
+        self._local.depth -= 1
+        statements = list(self._local.statements) if self._local.depth == 0 else []
+
+        if self.collect_stats:
+            with self._lock:
+                stats = self._stats.get(method)
+                if stats is None:
+                    stats = self._stats[method] = {'calls': 0, 'errors': 0, 'rows': 0, 'total_seconds': 0.0, 'max_seconds': 0.0, 'buckets': [0] * len(LATENCY_BUCKETS)}
+                stats['calls'] += 1
+                stats['errors'] += failed
+                stats['rows'] += rows
+                stats['total_seconds'] += seconds
+                stats['max_seconds'] = max(stats['max_seconds'], seconds)
+                stats['buckets'][next(i for i, limit in enumerate(LATENCY_BUCKETS) if seconds <= limit)] += 1
+
+        if self.slow_query_threshold is not None and seconds >= self.slow_query_threshold:
+            entry = {'method': method, 'seconds': seconds, 'rows': rows, 'failed': failed, 'sql': statements}
+            self.slow_queries.append(entry)
+            self.message(f"[!] Llamada lenta a {method}: {seconds:.3f} s")
+            if self._on_slow_query is not None:
+                self._on_slow_query(entry)
+
+    @staticmethod
+    def _percentile(buckets: list[int], calls: int, fraction: float, maximum: float) -> float:
+        """
+        Estima un percentil como el límite superior del intervalo del histograma que lo contiene.
+
+        Args:
+            buckets (list[int]): Llamadas por intervalo.
+            calls (int): Total de llamadas.
+            fraction (float): Percentil entre 0 y 1.
+            maximum (float): Duración máxima observada, usada para el último intervalo.
+
+        Returns:
+            float: Percentil estimado en segundos.
+        """
+        target = fraction * calls
+        accumulated = 0
+        for limit, count in zip(LATENCY_BUCKETS, buckets):
+            accumulated += count
+            if accumulated >= target:
+                return min(limit, maximum)
+        return maximum
+
+    def stats(self) -> dict[str, dict[str, any]]:
+        """
+        Devuelve las métricas acumuladas por método.
+
+        Returns:
+            dict: Por cada método, llamadas, errores, filas, tiempos total, medio, máximo, p50 y p99,
+                y el histograma de latencias como {límite en segundos: llamadas}.
+
+        Example:
+            >>> conn.instrumentation.stats()['insert']
+            {'calls': 1000, 'errors': 0, 'rows': 1000, 'total_seconds': 0.021, 'mean_seconds': 2.1e-05, ...}
+        """
+        with self._lock:
+            result = {}
+            for method, stats in self._stats.items():
+                calls = stats['calls']
+                result[method] = {
+                    'calls': calls,
+                    'errors': stats['errors'],
+                    'rows': stats['rows'],
+                    'total_seconds': stats['total_seconds'],
+                    'mean_seconds': stats['total_seconds'] / calls,
+                    'max_seconds': stats['max_seconds'],
+                    'p50_seconds': self._percentile(stats['buckets'], calls, 0.5, stats['max_seconds']),
+                    'p99_seconds': self._percentile(stats['buckets'], calls, 0.99, stats['max_seconds']),
+                    'histogram': {limit: count for limit, count in zip(LATENCY_BUCKETS, stats['buckets']) if count},
+                }
+            return result
+
+    def reset(self) -> None:
+        """
+        Descarta las métricas acumuladas y el registro de llamadas lentas.
+        """
+        with self._lock:
+            self._stats.clear()
+            self.slow_queries.clear()
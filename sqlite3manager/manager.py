@@ -1,9 +1,305 @@
-from sqlite3 import connect, Cursor, Connection
-from typing import Any as any, Callable, TypeVar, cast
-from threading import local
+from sqlite3 import connect, Cursor, Connection, Error, OperationalError
+from sqlite3 import sqlite_version_info
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+import csv
+import io
+import json
+from functools import reduce, wraps
+from itertools import chain, count, groupby, islice
+from typing import Any as any, BinaryIO, Callable, IO, Iterable, Iterator, Sequence, TypeVar, cast
+from os import cpu_count, fstat
+from pathlib import Path
+from time import perf_counter
+from urllib.parse import parse_qsl, quote, urlencode
+from threading import Event, Lock, Thread, current_thread, enumerate as enumerate_threads, get_ident, local
+
+from .advisor import IndexAdvisor
+from .cache import ResultCache, SchemaCache, StatementCache
+from .columnar import column_typecode, fetch_columns, to_numpy
+from .transfer import coercer, infer_type, json_default, open_text
+from .instrumentation import Instrumentation
+from .rows import ROW_FACTORIES, row_maker
+from .migrations import ALTER_OPERATIONS, mentions, parse_create_table, retype_definition
+from .parallel import partition_bounds, scan_partition
+from .blob import BlobStream, open_binary
 
 FuncType = TypeVar('FuncType', bound=Callable)
 
+TRANSACTION_MODES = ('DEFERRED', 'IMMEDIATE', 'EXCLUSIVE')
+
+# Perfiles de ajuste para connect(). 'bulk_load' no cambia journal_mode para poder activarse de forma
+# temporal sobre una base de datos en uso, y 'durable' mantiene synchronous=FULL aunque use WAL.
+PRAGMA_PROFILES: dict[str, dict[str, int | str]] = {
+    'durable': {
+        'journal_mode': 'WAL',
+        'synchronous': 'FULL',
+    },
+    'throughput': {
+        'journal_mode': 'WAL',
+        'synchronous': 'NORMAL',
+        'cache_size': -65536,
+        'mmap_size': 268435456,
+        'temp_store': 'MEMORY',
+    },
+    'bulk_load': {
+        'synchronous': 'OFF',
+        'cache_size': -262144,
+        'temp_store': 'MEMORY',
+        'wal_autocheckpoint': 0,
+    },
+    'read_only_analytics': {
+        'cache_size': -131072,
+        'mmap_size': 1073741824,
+        'temp_store': 'MEMORY',
+    },
+}
+
+# PRAGMAs que se pueden ajustar, en el orden en que deben aplicarse: page_size solo surte efecto
+# antes de crear la base de datos y antes de pasar a WAL.
+TUNABLE_PRAGMAS = ('page_size', 'journal_mode', 'synchronous', 'cache_size', 'mmap_size', 'temp_store', 'wal_autocheckpoint')
+
+# Columnas implícitas que SQLite acepta en cualquier tabla con rowid.
+ROWID_ALIASES = frozenset({'rowid', 'oid', '_rowid_'})
+
+# Operadores admitidos en las condiciones como (operador, valor). IN y NOT IN reciben una secuencia
+# de valores; BETWEEN y NOT BETWEEN, dos valores: ('BETWEEN', mínimo, máximo).
+CONDITION_OPERATORS = frozenset({'=', '==', '!=', '<>', '<', '<=', '>', '>=', 'IN', 'NOT IN', 'BETWEEN', 'NOT BETWEEN',
+                                 'LIKE', 'NOT LIKE', 'GLOB', 'NOT GLOB', 'IS', 'IS NOT'})
+
+# Funciones de agregado admitidas por aggregate() como (función, columna). Solo COUNT admite la columna '*'.
+AGGREGATE_FUNCTIONS = ('count', 'sum', 'total', 'avg', 'min', 'max', 'group_concat')
+
+# Palabras de las formas de sentencia que no son nombres de columna.
+SHAPE_KEYWORDS = CONDITION_OPERATORS | {'OR', 'ASC', 'DESC', '*'}
+
+Condition = dict[str, any] | Sequence[dict[str, any]]
+
+# Tabla en la que enable_change_tracking() registra los cambios y prefijo de sus disparadores.
+CHANGELOG_TABLE = 'sqlite3manager_changes'
+CHANGE_TRIGGER_PREFIX = 'sqlite3manager_cdc'
+
+# Modos de apertura de SQLite para las URI: solo lectura, lectura y escritura, creación si no existe y en memoria.
+OPEN_MODES = ('ro', 'rw', 'rwc', 'memory')
+
+# Numeración de las bases de datos en memoria creadas por load_into_memory() y deserialize().
+_MEMORY_DATABASES = count()
+
+# Equivale a sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER, que solo existe desde Python 3.11.
+SQLITE_LIMIT_VARIABLE_NUMBER = 9
+
+
+def database_uri(path: str, params: dict[str, str | None]) -> str:
+    """
+    Genera la URI de SQLite de una base de datos con los parámetros indicados. Si la ruta ya es una URI
+    (empieza por ``file:``), los parámetros se añaden a los que tenga.
+
+    Args:
+        path (str): Ruta del archivo, URI o, con ``mode=memory``, nombre de la base de datos en memoria.
+        params (dict): Parámetros de la URI. Los que valen None se omiten.
+
+    Returns:
+        str: URI de la base de datos.
+
+    Example:
+        >>> database_uri('/data/ref.sqlite3', {'mode': 'ro', 'immutable': '1'})
+        'file:///data/ref.sqlite3?mode=ro&immutable=1'
+    """
+    if path.startswith('file:'):
+        base, _, query = path.partition('?')
+        values = dict(parse_qsl(query, keep_blank_values=True))
+    elif params.get('mode') == 'memory':
+        base, values = f"file:{quote(path)}", {}
+    else:
+        base, values = Path(path).absolute().as_uri(), {}
+    values.update({name: value for name, value in params.items() if value is not None})
+    return f"{base}?{urlencode(values)}" if values else base
+
+
+def build_where(condition: Condition | None) -> tuple[tuple[any, ...], tuple[any, ...]]:
+    """
+    Separa una condición en su forma, que identifica la sentencia en el caché, y sus parámetros.
+
+    Cada columna se compara por igualdad con su valor o con un operador de CONDITION_OPERATORS si el valor es
+    una tupla ``(operador, valor)``. Las columnas de un diccionario se combinan con AND y una lista de
+    diccionarios se combina con OR. La forma de un diccionario de igualdades es la tupla de sus columnas.
+
+    Args:
+        condition (dict | Sequence[dict] | None): Condición de búsqueda.
+
+    Returns:
+        tuple[tuple, tuple]: Forma de la condición y valores de sus parámetros.
+
+    Example:
+        >>> build_where({'name': 'John', 'age': ('>=', 18)})
+        (('name', ('age', '>=', 1)), ('John', 18))
+        >>> build_where([{'country': ('IN', ['ES', 'MX'])}, {'vip': 1}])
+        (('OR', ((('country', 'IN', 2),), ('vip',))), ('ES', 'MX', 1))
+    """
+    if not condition:
+        return (), ()
+    if not isinstance(condition, dict):
+        if len(condition) == 1:
+            return build_where(condition[0])
+        groups = [build_where(group) for group in condition]
+        if [group for group, _ in groups if not group]:
+            raise ValueError("Los grupos de una condición OR no pueden estar vacíos")
+        return ('OR', tuple(group for group, _ in groups)), tuple(chain.from_iterable(params for _, params in groups))
+
+    shape: list[any] = []
+    params: list[any] = []
+    for column, value in condition.items():
+        if not isinstance(value, tuple):
+            shape.append(column)
+            params.append(value)
+            continue
+        if not value or not isinstance(value[0], str) or value[0].upper() not in CONDITION_OPERATORS:
+            raise ValueError(f"Condición no válida para '{column}': {value!r}. Usa (operador, valor) con uno de {', '.join(sorted(CONDITION_OPERATORS))}")
+        operator, args = value[0].upper(), value[1:]
+        if operator in ('IN', 'NOT IN'):
+            if len(args) != 1 or isinstance(args[0], (str, bytes)):
+                raise ValueError(f"{operator} requiere una secuencia de valores para '{column}'")
+            args = tuple(args[0])
+        elif len(args) != (2 if operator in ('BETWEEN', 'NOT BETWEEN') else 1):
+            raise ValueError(f"Número de valores no válido para '{column}' con {operator}")
+        shape.append((column, operator, len(args)))
+        params.extend(args)
+    return tuple(shape), tuple(params)
+
+
+def where_sql(shape: tuple[any, ...]) -> str:
+    """
+    Genera el texto SQL de la forma de una condición creada por build_where().
+
+    Args:
+        shape (tuple): Forma de la condición.
+
+    Returns:
+        str: Expresión SQL con parámetros ``?``.
+    """
+    if shape and shape[0] == 'OR':
+        return ' OR '.join([f"({where_sql(group)})" for group in shape[1]])
+    terms = []
+    for term in shape:
+        if isinstance(term, str):
+            terms.append(f"{term} = ?")
+            continue
+        column, operator, count = term
+        if operator in ('IN', 'NOT IN'):
+            terms.append(f"{column} {operator} ({', '.join(['?'] * count)})" if count else ('0' if operator == 'IN' else '1'))
+        elif operator in ('BETWEEN', 'NOT BETWEEN'):
+            terms.append(f"{column} {operator} ? AND ?")
+        else:
+            terms.append(f"{column} {operator} ?")
+    return ' AND '.join(terms)
+
+
+def build_statement(operation: str, table_name: str, *shape: any) -> str:
+    """
+    Genera el SQL de las operaciones CRUD a partir de su forma. Es la función que usa el
+    StatementCache de Connect, por lo que solo se ejecuta la primera vez que aparece cada forma.
+
+    Args:
+        operation (str): 'select', 'search', 'read_columns', 'scan', 'count', 'exists', 'distinct', 'aggregate', 'insert',
+            'insert_blob', 'bulk_insert', 'upsert', 'update' o 'delete'.
+        table_name (str): El nombre de la tabla.
+        *shape: Columnas (y en 'bulk_insert' el número de filas) que definen la sentencia. Las condiciones se indican con
+            la forma de build_where(). En 'upsert' son las columnas insertadas, las del objetivo del conflicto y las que
+            se actualizan; en 'search', la condición y, opcionalmente, la proyección, el orden como ((columna, dirección), ...),
+            si hay paginación por clave y si hay LIMIT y OFFSET; en 'scan', las columnas, la clave como (columna,), la condición
+            y si el rango tiene límite superior; en 'aggregate', los agregados como ((alias, función, columna), ...), la condición,
+            las columnas de agrupación y la condición HAVING sobre los alias.
+
+    Returns:
+        str: Texto SQL de la sentencia.
+
+    Example:
+        >>> build_statement('update', 'users', ('email',), ('name',))
+        'UPDATE users SET email = ? WHERE name = ?'
+        >>> build_statement('search', 'users', (('age', '>', 1),), ('id', 'name'), (('id', 'ASC'),), True, True, False)
+        'SELECT id, name FROM users WHERE (age > ?) AND id > ? ORDER BY id ASC LIMIT ?'
+    """
+    match operation:
+        case 'select':
+            return f"SELECT * FROM {table_name}"
+        case 'search':
+            condition, columns, order, after, limit, offset = shape + (None, (), False, False, False)[len(shape) - 1:]
+            where = where_sql(condition)
+            if after:
+                names = [column for column, _ in order]
+                comparison = '<' if order[0][1] == 'DESC' else '>'
+                seek = f"{names[0]} {comparison} ?" if len(names) == 1 else f"({', '.join(names)}) {comparison} ({', '.join(['?'] * len(names))})"
+                where = f"({where}) AND {seek}" if where else seek
+            query = f"SELECT {', '.join(columns) if columns else '*'} FROM {table_name}"
+            if where:
+                query += f" WHERE {where}"
+            if order:
+                query += " ORDER BY " + ', '.join([f"{column} {direction}" for column, direction in order])
+            if limit or offset:
+                query += " LIMIT ?" if limit else " LIMIT -1"
+            if offset:
+                query += " OFFSET ?"
+            return query
+        case 'read_columns':
+            columns, condition = shape
+            query = f"SELECT {', '.join(columns)} FROM {table_name}"
+            if condition:
+                query += f" WHERE {where_sql(condition)}"
+            return query
+        case 'scan':
+            columns, (key,), condition, bounded = shape
+            query = f"SELECT {', '.join(columns) if columns else '*'} FROM {table_name} WHERE {key} >= ?"
+            if bounded:
+                query += f" AND {key} < ?"
+            if condition:
+                query += f" AND ({where_sql(condition)})"
+            return query
+        case 'count' | 'exists':
+            query = f"SELECT {'COUNT(*)' if operation == 'count' else '1'} FROM {table_name}"
+            if shape[0]:
+                query += f" WHERE {where_sql(shape[0])}"
+            return query + (" LIMIT 1" if operation == 'exists' else '')
+        case 'distinct':
+            columns, condition = shape
+            query = f"SELECT DISTINCT {', '.join(columns)} FROM {table_name}"
+            if condition:
+                query += f" WHERE {where_sql(condition)}"
+            return query + f" ORDER BY {', '.join(columns)}"
+        case 'aggregate':
+            aggregates, condition, group_by, having = shape
+            expressions = list(group_by) + [f"{function}({column}) AS {alias}" for alias, function, column in aggregates]
+            query = f"SELECT {', '.join(expressions)} FROM {table_name}"
+            if condition:
+                query += f" WHERE {where_sql(condition)}"
+            if group_by:
+                query += f" GROUP BY {', '.join(group_by)}"
+            if having:
+                query += f" HAVING {where_sql(having)}"
+            if group_by:
+                query += f" ORDER BY {', '.join(group_by)}"
+            return query
+        case 'insert':
+            columns, values = ', '.join(shape[0]), ', '.join(['?'] * len(shape[0]))
+            return f"INSERT INTO {table_name} ({columns}) VALUES ({values})"
+        case 'insert_blob':
+            columns, (blob_column,) = shape
+            values = ', '.join(['?'] * len(columns) + ['zeroblob(?)'])
+            return f"INSERT INTO {table_name} ({', '.join(columns + (blob_column,))}) VALUES ({values})"
+        case 'bulk_insert':
+            columns, rows = shape
+            placeholders = f"({', '.join(['?'] * len(columns))})"
+            return f"INSERT INTO {table_name} ({', '.join(columns)}) VALUES {', '.join([placeholders] * rows)}"
+        case 'upsert':
+            columns, conflict, update = shape
+            action = "UPDATE SET " + ', '.join([f"{column} = excluded.{column}" for column in update]) if update else "NOTHING"
+            return f"INSERT INTO {table_name} ({', '.join(columns)}) VALUES ({', '.join(['?'] * len(columns))}) ON CONFLICT ({', '.join(conflict)}) DO {action}"
+        case 'update':
+            set_clause = ', '.join([f"{key} = ?" for key in shape[0]])
+            return f"UPDATE {table_name} SET {set_clause} WHERE {where_sql(shape[1])}"
+        case 'delete':
+            return f"DELETE FROM {table_name} WHERE {where_sql(shape[0])}"
+    raise ValueError(f"Operación desconocida: '{operation}'")
+
 
 def handle_exception(function: FuncType) -> FuncType:
     """
@@ -16,13 +312,30 @@ def handle_exception(function: FuncType) -> FuncType:
         FuncType: La función decorada.
     """
     def wrapper(self: 'Connect', *args, **kwargs) -> any:
+        instrumentation = self.instrumentation
+        measure = instrumentation.active
+        if measure:
+            changes = self._total_changes()
+            instrumentation.begin()
+            start = perf_counter()
+        result = None
+        failed = False
         try:
-            return function(self, *args, **kwargs)
+            result = function(self, *args, **kwargs)
+            return result
         except Exception as e:
+            failed = True
             if self.raise_exceptions:
                 raise e
-            print(f"[!] Error en {function.__name__}: {e}")
+            instrumentation.message(f"[!] Error en {function.__name__}: {e}")
+            # Dentro de transaction() el error no se propaga, así que se anota para revertir el bloque al salir.
+            if getattr(self._local, 'transaction_depth', 0):
+                self._local.transaction_failed = True
             return None
+        finally:
+            if measure:
+                rows = len(result) if isinstance(result, list) else self._total_changes() - changes
+                instrumentation.end(function.__name__, perf_counter() - start, rows, failed)
     return cast(FuncType, wrapper)
 
 
@@ -38,12 +351,30 @@ def require_connection(function: FuncType) -> FuncType:
     """
     def wrapper(self: 'Connect', *args, **kwargs) -> any:
         if not self.get_status():
-            print("[!] Debes conectarte primero a una base de datos.")
+            self.instrumentation.message("[!] Debes conectarte primero a una base de datos.")
             return None
         return function(self, *args, **kwargs)
     return cast(FuncType, wrapper)
 
 
+def require_writable(function: FuncType) -> FuncType:
+    """
+    Decorador que rechaza los métodos de escritura en las instancias de solo lectura sin llegar a la base de datos.
+
+    Args:
+        function (FuncType): La función a la que se aplica el decorador.
+
+    Returns:
+        FuncType: La función decorada.
+    """
+    @wraps(function)
+    def wrapper(self: 'Connect', *args, **kwargs) -> any:
+        if self.read_only:
+            raise ValueError(f"La base de datos está abierta en modo de solo lectura: {function.__name__}() no está disponible")
+        return function(self, *args, **kwargs)
+    return cast(FuncType, wrapper)
+
+
 class Connect:
     """
     Clase para manejar conexiones y operaciones CRUD en una base de datos SQLite.
@@ -51,22 +382,110 @@ class Connect:
     Args:
         path (str): Ruta de la base de datos SQLite.
         raise_exceptions (bool): Indica si se deben levantar excepciones en caso de error. Por defecto es False.
+        fetch_size (int): Cantidad de filas que los iteradores leen por cada llamada a fetchmany. Por defecto es 1000.
+        cached_statements (int): Sentencias preparadas que sqlite3 guarda por conexión. Por defecto es 256.
+        statement_cache_size (int): Sentencias SQL generadas que se memorizan por forma. Por defecto es 256.
+        result_cache (ResultCache | None): Caché de resultados para read_table() y search(). Por defecto está desactivado.
+        profile (str | None): Perfil de PRAGMA_PROFILES aplicado a cada conexión. Por defecto se usan los valores de SQLite.
+        pragmas (dict | None): Valores de TUNABLE_PRAGMAS que se aplican por encima del perfil.
+        verbose (bool): Indica si se escriben mensajes por consola. Por defecto es True.
+        instrumentation (Instrumentation | None): Destino de los mensajes y métricas. Si se indica, ``verbose`` se ignora.
+        advisor (IndexAdvisor | None): Asesor que detecta búsquedas sin índice. Por defecto está desactivado.
+        row_factory (str): Formato de las filas leídas: 'tuple', 'row' (sqlite3.Row), 'dict' o 'record'. Por defecto es 'tuple'.
+        mode (str | None): Modo de apertura de OPEN_MODES: 'ro', 'rw', 'rwc' o 'memory'. Por defecto se abre la ruta tal cual.
+        immutable (bool): Indica que el archivo no cambia nunca, ni desde otros procesos: se abre en solo lectura sin
+            bloqueos ni detección de cambios. Por defecto es False.
+        shared_cache (bool | None): Indica si las conexiones comparten la caché de páginas (``cache=shared``). Por defecto
+            es True con ``mode='memory'``, para que todos los hilos vean la misma base de datos, y el valor de SQLite en
+            el resto de casos.
     """
     path: str
+    mode: str | None
+    immutable: bool
+    read_only: bool
     raise_exceptions: bool
+    fetch_size: int
+    cached_statements: int
+    result_cache: ResultCache | None
+    pragmas: dict[str, int | str]
+    instrumentation: Instrumentation
+    advisor: IndexAdvisor | None
+    row_factory: str
+    _statements: StatementCache
     _local: local
-
-    def __init__(self, path: str, raise_exceptions: bool = False) -> None:
+    _connections: dict[int, Connection]
+    _connections_lock: Lock
+    _generation: int
+    _database: str
+    _uri: bool
+    _memory: Connection | None
+
+    def __init__(self, path: str, raise_exceptions: bool = False, fetch_size: int = 1000, cached_statements: int = 256, statement_cache_size: int = 256, result_cache: ResultCache | None = None, profile: str | None = None, pragmas: dict[str, int | str] | None = None,
+                 verbose: bool = True, instrumentation: Instrumentation | None = None, advisor: IndexAdvisor | None = None,
+                 row_factory: str = 'tuple', mode: str | None = None, immutable: bool = False, shared_cache: bool | None = None) -> None:
         """
         Inicializa una instancia de la clase Connect.
 
         Args:
             path (str): Ruta de la base de datos.
             raise_exceptions (bool): Indica si se deben levantar excepciones en caso de error. Por defecto es False.
+            fetch_size (int): Cantidad de filas que los iteradores leen por cada llamada a fetchmany. Por defecto es 1000.
+            cached_statements (int): Sentencias preparadas que sqlite3 guarda por conexión. Por defecto es 256.
+            statement_cache_size (int): Sentencias SQL generadas que se memorizan por forma. Por defecto es 256.
+            result_cache (ResultCache | None): Caché de resultados para read_table() y search(). Por defecto está desactivado.
+            profile (str | None): Perfil de PRAGMA_PROFILES aplicado a cada conexión. Por defecto se usan los valores de SQLite.
+            pragmas (dict | None): Valores de TUNABLE_PRAGMAS que se aplican por encima del perfil.
+            verbose (bool): Indica si se escriben mensajes por consola. Por defecto es True.
+            instrumentation (Instrumentation | None): Destino de los mensajes y métricas. Si se indica, ``verbose`` se ignora.
+            advisor (IndexAdvisor | None): Asesor que detecta búsquedas sin índice. Por defecto está desactivado.
+            row_factory (str): Formato de las filas leídas: 'tuple', 'row' (sqlite3.Row), 'dict' o 'record'. Por defecto es 'tuple'.
+            mode (str | None): Modo de apertura: 'ro', 'rw', 'rwc' o 'memory'. Por defecto se abre la ruta tal cual.
+            immutable (bool): Indica que el archivo no cambia nunca: se abre en solo lectura sin bloqueos ni detección de cambios. Por defecto es False.
+            shared_cache (bool | None): Indica si las conexiones comparten la caché de páginas. Por defecto es True con ``mode='memory'``.
         """
+        if fetch_size < 1:
+            raise ValueError("fetch_size debe ser mayor que cero")
+        if row_factory not in ROW_FACTORIES:
+            raise ValueError(f"Formato de fila no válido: '{row_factory}'. Usa uno de {', '.join(ROW_FACTORIES)}")
+        if mode is not None and mode not in OPEN_MODES:
+            raise ValueError(f"Modo de apertura no válido: '{mode}'. Usa uno de {', '.join(OPEN_MODES)}")
+        if immutable and mode not in (None, 'ro'):
+            raise ValueError("immutable solo se puede usar con mode='ro'")
         self._local = local()
+        self._connections = {}
+        self._connections_lock = Lock()
+        self._generation = 0
         self.path = path
+        self.mode = 'ro' if immutable else mode
+        self.immutable = immutable
+        self.read_only = self.mode == 'ro'
+        if self.mode is not None or shared_cache is not None or path.startswith('file:'):
+            if shared_cache is None and self.mode == 'memory':
+                shared_cache = True
+            cache = None if shared_cache is None else ('shared' if shared_cache else 'private')
+            self._database = database_uri(path, {'mode': self.mode, 'immutable': '1' if immutable else None, 'cache': cache})
+            self._uri = True
+        else:
+            self._database = path
+            self._uri = False
+        self._source = (self._database, self._uri)
+        self._memory = None
+        self._flusher: Thread | None = None
+        self._flush_stop = Event()
+        self._flush_lock = Lock()
+        self._flushed_version: int | None = None
         self.raise_exceptions = raise_exceptions
+        self.fetch_size = fetch_size
+        self.cached_statements = cached_statements
+        self._statements = StatementCache(self._build_statement, statement_cache_size)
+        self.result_cache = result_cache
+        self.pragmas = self._resolve_pragmas(profile, pragmas or {})
+        if self.read_only:
+            # Un lector no puede cambiar el modo de journal ni el tamaño de página del archivo.
+            self.pragmas = {name: value for name, value in self.pragmas.items() if name not in ('page_size', 'journal_mode', 'wal_autocheckpoint')}
+        self.instrumentation = instrumentation or Instrumentation(verbose=verbose, collect_stats=False)
+        self.advisor = advisor
+        self.row_factory = row_factory
 
     def __str__(self) -> str:
         """
@@ -83,6 +502,115 @@ class Connect:
         """
         return f"Base de datos: {self.path}\nEstado: {('Sin conexión', 'Conexión establecida')[self.get_status()]}"
     
+    def _open_connection(self) -> Connection:
+        """
+        Abre una conexión nueva para el hilo actual con la configuración de la instancia y la registra,
+        de forma que se pueda contar y cerrar aunque el hilo que la abrió ya no exista.
+
+        Las conexiones de hilos que ya terminaron se cierran aquí mismo.
+
+        Returns:
+            Connection: Conexión a la base de datos.
+        """
+        connection = connect(
+            self._database,
+            uri=self._uri,
+            check_same_thread=False,
+            timeout=10.0,
+            isolation_level=None,
+            cached_statements=self.cached_statements,
+        )
+        try:
+            self._apply_pragmas(connection, self.pragmas)
+        except Exception:
+            connection.close()
+            raise
+        if self.instrumentation.trace_sql:
+            connection.set_trace_callback(self.instrumentation.trace)
+        # Registra en threading los hilos no creados con threading (_DummyThread) para que
+        # _prune_connections() los vea vivos y no cierre su conexión.
+        current_thread()
+        with self._connections_lock:
+            self._prune_connections()
+            stale = self._connections.pop(get_ident(), None)
+            if stale is not None:
+                stale.close()
+            self._connections[get_ident()] = connection
+        self._local.generation = self._generation
+        return connection
+
+    @staticmethod
+    def _resolve_pragmas(profile: str | None, overrides: dict[str, int | str]) -> dict[str, int | str]:
+        """
+        Combina un perfil con valores explícitos y los valida.
+
+        Args:
+            profile (str | None): Nombre del perfil en PRAGMA_PROFILES.
+            overrides (dict): Valores que sustituyen a los del perfil.
+
+        Returns:
+            dict[str, int | str]: PRAGMAs a aplicar, en el orden de TUNABLE_PRAGMAS.
+        """
+        if profile is not None and profile not in PRAGMA_PROFILES:
+            raise ValueError(f"Perfil desconocido: '{profile}'. Usa uno de {', '.join(PRAGMA_PROFILES)}")
+        values = {**(PRAGMA_PROFILES[profile] if profile else {}), **overrides}
+        for name, value in values.items():
+            if name not in TUNABLE_PRAGMAS:
+                raise ValueError(f"PRAGMA no admitido: '{name}'. Usa uno de {', '.join(TUNABLE_PRAGMAS)}")
+            if not isinstance(value, int) and not str(value).isalnum():
+                raise ValueError(f"Valor no válido para el PRAGMA '{name}': {value!r}")
+        return {name: values[name] for name in TUNABLE_PRAGMAS if name in values}
+
+    @staticmethod
+    def _apply_pragmas(connection: Connection, pragmas: dict[str, int | str]) -> None:
+        """
+        Aplica PRAGMAs ya validados sobre una conexión.
+
+        Args:
+            connection (Connection): Conexión a ajustar.
+            pragmas (dict): PRAGMAs a aplicar.
+        """
+        for name, value in pragmas.items():
+            connection.execute(f"PRAGMA {name}={value}").fetchall()
+
+    def _total_changes(self) -> int:
+        """
+        Obtiene el total de filas modificadas por la conexión del hilo actual, sin abrir una si no existe.
+
+        Returns:
+            int: Valor de Connection.total_changes, o 0 si no hay una conexión utilizable.
+        """
+        connection = getattr(self._local, 'connection', None)
+        try:
+            return connection.total_changes if connection else 0
+        except Error:
+            return 0
+
+    def _prune_connections(self) -> None:
+        """
+        Cierra y olvida las conexiones registradas por hilos que ya terminaron.
+        Debe llamarse con ``_connections_lock`` adquirido.
+        """
+        alive = {thread.ident for thread in enumerate_threads()}
+        for ident in [ident for ident in self._connections if ident not in alive]:
+            self._connections.pop(ident).close()
+
+    def _reset_connections(self) -> int:
+        """
+        Cierra las conexiones de todos los hilos y obliga a que se vuelvan a abrir.
+
+        Returns:
+            int: Número de conexiones cerradas.
+        """
+        with self._connections_lock:
+            connections = list(self._connections.values())
+            self._connections.clear()
+            self._generation += 1
+        for connection in connections:
+            connection.close()
+        self._local.__dict__.clear()
+        return len(connections)
+
     def _get_connection(self) -> Connection:
         """
         Obtiene la conexión a la base de datos. Si no existe, la crea.
@@ -96,8 +624,9 @@ class Connect:
             >>> print(connection)
             <sqlite3.Connection object at 0x...>
         """
-        if not hasattr(self._local, 'connection') or not self._local.connection:
-            self._local.connection = connect(self.path)
+        if not getattr(self._local, 'connection', None) or getattr(self._local, 'generation', None) != self._generation:
+            self._local.__dict__.clear()
+            self._local.connection = self._open_connection()
             self._local.connection_status = True
         return self._local.connection
     
@@ -118,6 +647,368 @@ class Connect:
             self._local.cursor = self._get_connection().cursor()
         return self._local.cursor
 
+    def _stream_cursor(self, cursor: Cursor, batch_size: int | None, row_factory: str = 'tuple', table_name: str = '') -> Iterator[tuple[int | float | str, ...]]:
+        """
+        Recorre un cursor ya ejecutado en lotes de fetchmany y lo cierra al terminar.
+
+        Args:
+            cursor (Cursor): Cursor dedicado sobre el que ya se ejecutó la consulta.
+            batch_size (int | None): Filas por lote. Si es None se usa fetch_size.
+            row_factory (str): Formato de las filas. Por defecto es 'tuple'.
+            table_name (str): Tabla consultada, para elegir la clase de registro.
+
+        Yields:
+            tuple: Cada fila del resultado.
+        """
+        size = batch_size or self.fetch_size
+        make = row_maker(row_factory, cursor, table_name)
+        try:
+            while True:
+                rows = cursor.fetchmany(size)
+                if not rows:
+                    break
+                yield from (rows if make is None else map(make, rows))
+        finally:
+            cursor.close()
+
+    def _resolve_row_factory(self, row_factory: str | None) -> str:
+        """
+        Elige el formato de fila de una llamada: el indicado o, si es None, el de la instancia.
+
+        Args:
+            row_factory (str | None): Formato pedido en la llamada.
+
+        Returns:
+            str: Formato de ROW_FACTORIES.
+        """
+        if row_factory is None:
+            return self.row_factory
+        if row_factory not in ROW_FACTORIES:
+            raise ValueError(f"Formato de fila no válido: '{row_factory}'. Usa uno de {', '.join(ROW_FACTORIES)}")
+        return row_factory
+
+    def _fetch_rows(self, cursor: Cursor, row_factory: str, table_name: str) -> list[any]:
+        """
+        Lee todas las filas de un cursor ya ejecutado en el formato pedido. Si hay que convertirlas, se leen en
+        lotes de fetch_size para no tener a la vez en memoria todas las tuplas y todas las filas convertidas.
+
+        Args:
+            cursor (Cursor): Cursor con la consulta ya ejecutada.
+            row_factory (str): Formato de las filas.
+            table_name (str): Tabla consultada, para elegir la clase de registro.
+
+        Returns:
+            list: Filas del resultado.
+        """
+        make = row_maker(row_factory, cursor, table_name)
+        if make is None:
+            return cursor.fetchall()
+        rows: list[any] = []
+        while batch := cursor.fetchmany(self.fetch_size):
+            rows.extend(map(make, batch))
+        return rows
+
+    def _get_schema(self) -> SchemaCache:
+        """
+        Obtiene el caché de esquema de la conexión del hilo actual. Si no existe, lo crea.
+
+        Returns:
+            SchemaCache: Caché de metadatos del esquema.
+        """
+        connection = self._get_connection()
+        schema = getattr(self._local, 'schema', None)
+        if schema is None:
+            schema = self._local.schema = SchemaCache(connection, static=self.immutable)
+        return schema
+
+    def _build_statement(self, operation: str, table_name: str, *shape: any) -> str:
+        """
+        Genera el SQL de una operación CRUD la primera vez que aparece su forma, comprobando antes contra
+        el caché de esquema que las columnas existan en la tabla. Las tablas que el caché no conoce
+        (temporales o de bases adjuntas) se dejan para que las valide SQLite.
+
+        Args:
+            operation (str): Operación CRUD.
+            table_name (str): El nombre de la tabla.
+            *shape: Columnas que definen la sentencia.
+
+        Returns:
+            str: Texto SQL de la sentencia.
+        """
+        schema = self._get_schema()
+        if schema.has_table(table_name):
+            known = {column.lower() for column in schema.columns(table_name)} | ROWID_ALIASES
+            checked = shape
+            if operation == 'aggregate':
+                # Los alias y la condición HAVING no son columnas de la tabla.
+                checked = (tuple(column for _, _, column in shape[0]),) + shape[1:3]
+            parts = [part for part in checked if isinstance(part, tuple)]
+            while parts:
+                part = parts.pop()
+                if isinstance(part, tuple):
+                    parts.extend(part)
+                elif isinstance(part, str) and part not in SHAPE_KEYWORDS and part.lower() not in known:
+                    raise ValueError(f"La columna '{part}' no existe en la tabla '{table_name}'")
+        return build_statement(operation, table_name, *shape)
+
+    def _cached_rows(self, table_name: str, query: str, params: tuple[any, ...], row_factory: str = 'tuple') -> list[tuple[int | float | str, ...]]:
+        """
+        Ejecuta una lectura sobre una tabla pasando por el caché de resultados, si está activado.
+        El formato de fila forma parte de la clave; los diccionarios se copian al devolverlos para que
+        quien los modifique no altere el caché. Dentro de transaction() el caché no se usa, porque lo que se
+        lee puede incluir cambios sin confirmar que otros hilos no deben ver.
+
+        Args:
+            table_name (str): Tabla de la que depende el resultado.
+            query (str): Consulta SQL normalizada.
+            params (tuple): Parámetros de la consulta.
+            row_factory (str): Formato de las filas. Por defecto es 'tuple'.
+
+        Returns:
+            list: Filas del resultado.
+        """
+        cursor = self._get_cursor()
+        cache = self.result_cache
+        if cache is None or self._in_transaction():
+            cursor.execute(query, params)
+            return self._fetch_rows(cursor, row_factory, table_name)
+
+        if not self.immutable:
+            version = self._get_connection().execute("PRAGMA data_version").fetchone()[0]
+            if getattr(self._local, 'data_version', version) != version:
+                cache.clear()
+            self._local.data_version = version
+
+        key = (query, params) if row_factory == 'tuple' else (query, params, row_factory)
+        rows = cache.get(key)
+        if rows is None:
+            token = cache.write_token()
+            cursor.execute(query, params)
+            rows = self._fetch_rows(cursor, row_factory, table_name)
+            cache.put(key, rows, (table_name,), token)
+        if row_factory == 'dict':
+            return [row.copy() for row in rows]
+        return rows
+
+    def _invalidate_results(self, table_name: str) -> None:
+        """
+        Descarta los resultados en caché que dependen de una tabla modificada. Dentro de una transacción
+        la tabla se vuelve a invalidar al cerrarla, para descartar lo que otros hilos hayan leído mientras tanto.
+
+        Args:
+            table_name (str): El nombre de la tabla modificada.
+        """
+        if self.result_cache is None:
+            return
+        self.result_cache.invalidate_table(table_name)
+        if self._in_transaction():
+            if not hasattr(self._local, 'written_tables'):
+                self._local.written_tables = set()
+            self._local.written_tables.add(table_name)
+
+    def _search_query(self, table_name: str, condition: Condition | None, columns: Sequence[str] | None = None, order_by: str | Sequence[str] | None = None,
+                      limit: int | None = None, offset: int | None = None, after: Sequence[any] | None = None) -> tuple[str, tuple[any, ...], tuple[any, ...]]:
+        """
+        Genera la consulta de search() y sus variantes a partir del caché de sentencias.
+
+        Args:
+            table_name (str): El nombre de la tabla.
+            condition (dict | Sequence[dict] | None): Condición de búsqueda.
+            columns (Sequence[str] | None): Columnas a devolver. Si es None se devuelven todas.
+            order_by (str | Sequence[str] | None): Columnas de orden, con ``DESC`` opcional, p. ej. ``['age DESC', 'id DESC']``.
+            limit (int | None): Máximo de filas.
+            offset (int | None): Filas que se saltan.
+            after (Sequence | None): Valores de las columnas de ``order_by`` en la última fila de la página anterior.
+
+        Returns:
+            tuple[str, tuple, tuple]: Consulta, parámetros y forma de la condición.
+        """
+        where, params = build_where(condition)
+        order = []
+        for item in [order_by] if isinstance(order_by, str) else order_by or ():
+            column, *direction = item.split()
+            direction = direction[0].upper() if direction else 'ASC'
+            if direction not in ('ASC', 'DESC') or len(item.split()) > 2:
+                raise ValueError(f"Orden no válido: '{item}'. Usa 'columna', 'columna ASC' o 'columna DESC'")
+            order.append((column, direction))
+        if after is not None:
+            if not order or len(after) != len(order):
+                raise ValueError("after debe tener un valor por cada columna de order_by")
+            if len({direction for _, direction in order}) > 1:
+                raise ValueError("La paginación por clave requiere que todas las columnas de order_by tengan la misma dirección")
+            params += tuple(after)
+        if limit is not None:
+            params += (limit,)
+        if offset is not None:
+            params += (offset,)
+
+        if columns is None and not order and after is None and limit is None and offset is None:
+            key: tuple[any, ...] = ('search', table_name, where) if where else ('select', table_name)
+        else:
+            key = ('search', table_name, where, tuple(columns or ()), tuple(order), after is not None, limit is not None, offset is not None)
+        return self._statements.get(key), params, where
+
+    def _advise(self, table_name: str, condition: tuple[any, ...], query: str) -> None:
+        """
+        Pasa una condición al asesor de índices, si está activado, y muestra o aplica su recomendación.
+        Las condiciones con grupos OR no se analizan.
+
+        Args:
+            table_name (str): El nombre de la tabla.
+            condition (tuple): Forma de la condición, creada por build_where().
+            query (str): Sentencia generada para la condición.
+        """
+        if self.advisor is None or not condition or condition[0] == 'OR':
+            return
+        columns = tuple(dict.fromkeys(term if isinstance(term, str) else term[0] for term in condition))
+        advice = self.advisor.observe(self._get_connection(), table_name, columns, query)
+        if advice is None:
+            return
+        action, sql = advice
+        if action == 'create' and not self.read_only:
+            self._get_connection().execute(sql)
+            self._get_schema().invalidate()
+            self.instrumentation.message(f"[i] Índice creado por el asesor: {sql}")
+        else:
+            self.instrumentation.message(f"[!] Las búsquedas por {', '.join(columns)} recorren toda la tabla '{table_name}'. Sugerencia: {sql}")
+
+    def _max_variables(self) -> int:
+        """
+        Obtiene el número máximo de parámetros '?' que admite una sentencia en la conexión actual.
+
+        Returns:
+            int: Valor de SQLITE_MAX_VARIABLE_NUMBER.
+        """
+        connection = self._get_connection()
+        if hasattr(connection, 'getlimit'):
+            return connection.getlimit(SQLITE_LIMIT_VARIABLE_NUMBER)
+        return 32766 if sqlite_version_info >= (3, 32, 0) else 999
+
+    @staticmethod
+    def _chunks(items: Iterable[any], size: int) -> Iterator[list[any]]:
+        """
+        Divide un iterable en listas de como máximo ``size`` elementos sin materializarlo completo.
+
+        Args:
+            items (Iterable): Elementos a dividir.
+            size (int): Tamaño máximo de cada bloque.
+
+        Yields:
+            list: Cada bloque de elementos.
+        """
+        iterator = iter(items)
+        while chunk := list(islice(iterator, size)):
+            yield chunk
+
+    def _insert_rows(self, table_name: str, data_list: Iterable[dict[str, any] | Sequence[any]], columns: Sequence[str] | None, chunk_size: int) -> int:
+        """
+        Inserta registros con sentencias ``INSERT ... VALUES`` de varias filas, sin abrir ni confirmar
+        ninguna transacción. Es el núcleo de bulk_insert() y de las importaciones.
+
+        Args:
+            table_name (str): El nombre de la tabla.
+            data_list (Iterable[dict | Sequence]): Registros a insertar.
+            columns (Sequence[str] | None): Columnas a insertar. Si es None se toman las claves del primer diccionario.
+            chunk_size (int): Cantidad máxima de filas por sentencia.
+
+        Returns:
+            int: Número de registros insertados.
+        """
+        rows = iter(data_list)
+        first = next(rows, None)
+        if first is None:
+            return 0
+
+        if columns is None:
+            if not isinstance(first, dict):
+                raise ValueError("Debes indicar las columnas cuando los registros no son diccionarios")
+            columns = tuple(first.keys())
+        columns = tuple(columns)
+        width = len(columns)
+        if not width:
+            raise ValueError("No hay columnas para insertar")
+
+        def row_values(row: dict[str, any] | Sequence[any]) -> Sequence[any]:
+            if len(row) != width:
+                raise ValueError(f"El registro {row!r} no coincide con las columnas {columns}")
+            if isinstance(row, dict):
+                try:
+                    return [row[column] for column in columns]
+                except KeyError as e:
+                    raise ValueError(f"Al registro {row!r} le falta la columna {e}") from None
+            return row
+
+        rows_per_statement = max(1, min(chunk_size, self._max_variables() // width))
+
+        cursor = self._get_cursor()
+        count = 0
+        for chunk in self._chunks(chain((first,), rows), rows_per_statement):
+            query = self._statements.get(('bulk_insert', table_name, columns, len(chunk)))
+            params: list[any] = []
+            for row in chunk:
+                params.extend(row_values(row))
+            cursor.execute(query, params)
+            count += len(chunk)
+        return count
+
+    def _execute_grouped(self, statements: Iterable[tuple[tuple[any, ...], Sequence[any]]], chunk_size: int) -> int:
+        """
+        Ejecuta sentencias por bloques agrupando las consecutivas con la misma forma en una sola llamada a
+        ``executemany``. Se respeta el orden de entrada, así que si un registro aparece varias veces gana
+        la última escritura. No abre ni confirma ninguna transacción.
+
+        Args:
+            statements (Iterable[tuple[tuple, Sequence]]): Pares de clave del caché de sentencias y parámetros.
+            chunk_size (int): Cantidad máxima de sentencias leídas antes de ejecutarlas.
+
+        Returns:
+            int: Número total de filas afectadas.
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size debe ser mayor que cero")
+        cursor = self._get_cursor()
+        affected = 0
+        for chunk in self._chunks(statements, chunk_size):
+            for key, run in groupby(chunk, key=lambda statement: statement[0]):
+                cursor.executemany(self._statements.get(key), [params for _, params in run])
+                affected += max(cursor.rowcount, 0)
+        return affected
+
+    def _key_columns(self, table_name: str, key: str | Sequence[str] | None) -> tuple[str, ...]:
+        """
+        Normaliza las columnas clave de una operación masiva. Por defecto se usa la clave primaria de la tabla.
+
+        Args:
+            table_name (str): El nombre de la tabla.
+            key (str | Sequence[str] | None): Columna o columnas clave.
+
+        Returns:
+            tuple[str, ...]: Columnas clave.
+        """
+        if key is None:
+            columns = tuple(self._get_schema().table(table_name)['primary_key'])
+            if not columns:
+                raise ValueError(f"La tabla '{table_name}' no tiene clave primaria; indica las columnas clave")
+            return columns
+        return (key,) if isinstance(key, str) else tuple(key)
+
+    def _in_transaction(self) -> bool:
+        """
+        Indica si el hilo actual está dentro de un bloque transaction().
+
+        Returns:
+            bool: True si hay una transacción explícita abierta.
+        """
+        return getattr(self._local, 'transaction_depth', 0) > 0
+
+    def _commit(self) -> None:
+        """
+        Confirma los cambios pendientes salvo que haya una transacción explícita abierta,
+        en cuyo caso el commit se realiza una sola vez al cerrar el bloque.
+        """
+        if not self._in_transaction():
+            self._get_connection().commit()
+
     def get_status(self) -> bool:
         """
         Verifica el estado de la conexión.
@@ -129,7 +1020,35 @@ class Connect:
             >>> conn.get_status()
             False
         """
-        return getattr(self._local, 'connection_status', False)
+        return getattr(self._local, 'connection_status', False) and getattr(self._local, 'generation', None) == self._generation
+
+    def statement_cache_info(self) -> dict[str, any]:
+        """
+        Informa del uso del caché de sentencias generadas.
+
+        Returns:
+            dict: Aciertos, fallos, tamaño actual y tamaño máximo.
+
+        Example:
+            >>> conn.statement_cache_info()
+            {'hits': 998, 'misses': 2, 'size': 2, 'max_size': 256}
+        """
+        return self._statements.info()
+
+    def connection_count(self) -> int:
+        """
+        Cuenta las conexiones abiertas por la instancia en todos los hilos que siguen vivos.
+
+        Returns:
+            int: Número de conexiones abiertas.
+
+        Example:
+            >>> conn.connection_count()
+            1
+        """
+        with self._connections_lock:
+            self._prune_connections()
+            return len(self._connections)
 
     @handle_exception
     def connect(self) -> bool:
@@ -145,21 +1064,131 @@ class Connect:
             True
         """
         if self.get_status():
-            print("[!] Ya estás conectado a una base de datos")
+            self.instrumentation.message("[!] Ya estás conectado a una base de datos")
             return False
 
-        self._local.connection = connect(
-            self.path,
-            check_same_thread=False,
-            timeout=10.0,
-            isolation_level=None,
-        )
+        self._local.__dict__.clear()
+        self._local.connection = self._open_connection()
         self._local.cursor = self._local.connection.cursor()
         self._local.connection_status = True
         
-        print("[i] Conexión exitosa")
+        self.instrumentation.message("[i] Conexión exitosa")
         return True
 
+    @contextmanager
+    def transaction(self, mode: str = 'DEFERRED') -> Iterator['Connect']:
+        """
+        Abre una transacción explícita. Dentro del bloque los métodos CRUD no hacen commit
+        por su cuenta: todo se confirma una sola vez al salir, o se revierte si ocurre una excepción.
+        Con ``raise_exceptions=False`` los errores de los métodos no salen del bloque, así que si alguno
+        falla dentro de él el bloque también se revierte al salir.
+
+        Los bloques anidados se implementan con SAVEPOINT, de modo que un error en un bloque
+        interno solo revierte los cambios de ese bloque.
+
+        Args:
+            mode (str): Tipo de bloqueo de la transacción externa: 'DEFERRED', 'IMMEDIATE' o 'EXCLUSIVE'. Por defecto es 'DEFERRED'.
+
+        Yields:
+            Connect: La propia instancia.
+
+        Example:
+            >>> with conn.transaction('IMMEDIATE'):
+            ...     conn.insert('users', {'name': 'John'})
+            ...     conn.insert('users', {'name': 'Jane'})
+        """
+        mode = mode.upper()
+        if mode not in TRANSACTION_MODES:
+            raise ValueError(f"Modo de transacción no válido: '{mode}'. Usa uno de {', '.join(TRANSACTION_MODES)}")
+        if not self.get_status():
+            raise RuntimeError("Debes conectarte primero a una base de datos.")
+
+        connection = self._get_connection()
+        depth = getattr(self._local, 'transaction_depth', 0)
+        failed = getattr(self._local, 'transaction_failed', False)
+        savepoint = f"sqlite3manager_sp_{depth}"
+
+        if depth == 0:
+            connection.execute(f"BEGIN {mode}")
+        else:
+            connection.execute(f"SAVEPOINT {savepoint}")
+        self._local.transaction_depth = depth + 1
+        self._local.transaction_failed = False
+
+        try:
+            yield self
+        except BaseException:
+            self._local.transaction_depth = depth
+            self._local.transaction_failed = failed
+            self._rollback_transaction(connection, depth, savepoint)
+            raise
+
+        self._local.transaction_depth = depth
+        block_failed, self._local.transaction_failed = self._local.transaction_failed, failed
+        if block_failed:
+            self._rollback_transaction(connection, depth, savepoint)
+            self.instrumentation.message("[!] Transacción revertida: falló una operación dentro del bloque")
+        elif depth == 0:
+            try:
+                connection.commit()
+            finally:
+                self._flush_written_tables()
+        else:
+            connection.execute(f"RELEASE {savepoint}")
+
+    def _rollback_transaction(self, connection: Connection, depth: int, savepoint: str) -> None:
+        """
+        Revierte la transacción externa o, en un bloque anidado, su SAVEPOINT.
+
+        Args:
+            connection (Connection): Conexión del hilo actual.
+            depth (int): Nivel de anidamiento del bloque; 0 es la transacción externa.
+            savepoint (str): Nombre del SAVEPOINT del bloque.
+        """
+        if depth == 0:
+            if connection.in_transaction:
+                connection.rollback()
+            self._flush_written_tables()
+        elif connection.in_transaction:
+            connection.execute(f"ROLLBACK TO {savepoint}")
+            connection.execute(f"RELEASE {savepoint}")
+
+    def _flush_written_tables(self) -> None:
+        """
+        Invalida en el caché de resultados las tablas escritas durante la transacción que acaba de cerrarse.
+        """
+        for table_name in getattr(self._local, 'written_tables', ()):
+            cast(ResultCache, self.result_cache).invalidate_table(table_name)
+        self._local.written_tables = set()
+
+    @contextmanager
+    def temporary_pragmas(self, profile: str | None = None, **pragmas: int | str) -> Iterator['Connect']:
+        """
+        Cambia temporalmente los PRAGMAs de la conexión del hilo actual y restaura los valores anteriores al salir.
+        Es útil, por ejemplo, para hacer una carga masiva con el perfil 'bulk_load'.
+
+        Args:
+            profile (str | None): Perfil de PRAGMA_PROFILES a aplicar.
+            **pragmas: Valores de TUNABLE_PRAGMAS que se aplican por encima del perfil.
+
+        Yields:
+            Connect: La propia instancia.
+
+        Example:
+            >>> with conn.temporary_pragmas('bulk_load'):
+            ...     conn.bulk_insert('events', rows)
+        """
+        if not self.get_status():
+            raise RuntimeError("Debes conectarte primero a una base de datos.")
+        values = self._resolve_pragmas(profile, pragmas)
+        connection = self._get_connection()
+        previous = {name: connection.execute(f"PRAGMA {name}").fetchone()[0] for name in values}
+        self._apply_pragmas(connection, values)
+        try:
+            yield self
+        finally:
+            self._apply_pragmas(connection, previous)
+
     @require_connection
     @handle_exception
     def list_table_names(self) -> list[str]:
@@ -173,17 +1202,13 @@ class Connect:
             >>> conn.list_table_names()
             ['users', 'products']
         """
-        cursor = self._get_cursor()
-        
-        query = "SELECT name FROM sqlite_master WHERE type='table';"
-        cursor.execute(query)
-        tables = cursor.fetchall()
+        tables = self._get_schema().tables()
 
         if not tables:
-            print("[i] No se encontraron tablas en la base de datos.")
+            self.instrumentation.message("[i] No se encontraron tablas en la base de datos.")
             return []
 
-        return [str(table[0]) for table in tables]
+        return list(tables)
 
     @require_connection
     @handle_exception
@@ -201,26 +1226,50 @@ class Connect:
             >>> conn.get_column_names('users')
             ['id', 'name', 'email']
         """
-        cursor = self._get_cursor()
-        
-        query = f"PRAGMA table_info({table_name});"
-        cursor.execute(query)
-        columns = cursor.fetchall()
+        columns = self._get_schema().columns(table_name)
 
         if not columns:
-            print("[i] No se encontraron columnas en la tabla.")
+            self.instrumentation.message("[i] No se encontraron columnas en la tabla.")
             return []
 
-        return [str(column[1]) for column in columns]
+        return list(columns)
+
+    @require_connection
+    @handle_exception
+    def get_table_info(self, table_name: str) -> dict[str, any]:
+        """
+        Obtiene los metadatos de una tabla: columnas, tipos declarados, clave primaria e índices.
+
+        Args:
+            table_name (str): El nombre de la tabla.
+
+        Returns:
+            dict: Con las claves 'columns', 'types', 'primary_key' e 'indexes'.
+
+        Example:
+            >>> conn.get_table_info('users')
+            {'columns': ['id', 'name'], 'types': {'id': 'INTEGER', 'name': 'TEXT'}, 'primary_key': ['id'], 'indexes': []}
+        """
+        info = self._get_schema().table(table_name)
+        if not info['columns']:
+            raise ValueError(f"La tabla '{table_name}' no existe")
+
+        return {key: value.copy() for key, value in info.items()}
 
     @require_connection
     @handle_exception
-    def read_table(self, table_name: str) -> list[tuple[int | float | str, ...]]:
+    def read_table(self, table_name: str, columns: Sequence[str] | None = None, order_by: str | Sequence[str] | None = None,
+                   limit: int | None = None, offset: int | None = None, row_factory: str | None = None) -> list[tuple[int | float | str, ...]]:
         """
-        Lee todos los registros de una tabla.
+        Lee los registros de una tabla.
 
         Args:
             table_name (str): El nombre de la tabla.
+            columns (Sequence[str] | None): Columnas a devolver. Si es None se devuelven todas.
+            order_by (str | Sequence[str] | None): Columnas de orden, con ``DESC`` opcional. Por defecto es None.
+            limit (int | None): Máximo de filas a devolver. Por defecto es None.
+            offset (int | None): Filas que se saltan antes de devolver resultados. Por defecto es None.
+            row_factory (str | None): Formato de las filas: 'tuple', 'row', 'dict' o 'record'. Si es None se usa el de la instancia.
 
         Returns:
             list[tuple]: Lista de filas de la tabla.
@@ -228,28 +1277,47 @@ class Connect:
         Example:
             >>> conn.read_table('users')
             [(1, 'John', 'john@example.com'), (2, 'Jane', 'jane@example.com')]
+            >>> conn.read_table('users', columns=['name'], order_by='name DESC', limit=1)
+            [('John',)]
+            >>> conn.read_table('users', row_factory='record')[0].name
+            'John'
         """
-        cursor = self._get_cursor()
-        
-        query = f"SELECT * FROM {table_name}"
-        cursor.execute(query)
-        rows = cursor.fetchall()
+        query, params, _ = self._search_query(table_name, None, columns, order_by, limit, offset)
+        rows = self._cached_rows(table_name, query, params, self._resolve_row_factory(row_factory))
 
         if not rows:
-            print("[i] No se encontraron registros en la tabla.")
+            self.instrumentation.message("[i] No se encontraron registros en la tabla.")
             return []
 
         return rows
 
     @require_connection
     @handle_exception
-    def search(self, table_name: str, condition: dict[str, any]) -> list[tuple[int | float | str, ...]]:
+    def search(self, table_name: str, condition: Condition | None = None, columns: Sequence[str] | None = None, order_by: str | Sequence[str] | None = None,
+               limit: int | None = None, offset: int | None = None, after: Sequence[any] | None = None, row_factory: str | None = None) -> list[tuple[int | float | str, ...]]:
         """
-        Busca registros en una tabla que coincidan con una condición.
+        Busca registros en una tabla que coincidan con una condición. El filtrado, el orden y la paginación
+        se hacen en SQLite, de modo que solo se leen las filas devueltas.
+
+        Cada columna de la condición se compara por igualdad con su valor o, si el valor es una tupla
+        ``(operador, valor)``, con uno de CONDITION_OPERATORS: ``=``, ``!=``, ``<``, ``<=``, ``>``, ``>=``,
+        ``IN``, ``NOT IN``, ``BETWEEN`` (con dos valores), ``LIKE``, ``GLOB``, ``IS`` o ``IS NOT`` (``('IS', None)``
+        equivale a IS NULL). Las columnas de un diccionario se combinan con AND y una lista de diccionarios, con OR.
+
+        Para recorrer resultados grandes es preferible la paginación por clave (``after``) a ``offset``: ``after``
+        recibe los valores de las columnas de ``order_by`` en la última fila de la página anterior y SQLite salta
+        directamente a la siguiente usando el índice de esas columnas, mientras que ``offset`` lee y descarta las
+        filas saltadas. ``order_by`` debe identificar las filas de forma única, p. ej. terminando en la clave primaria.
 
         Args:
             table_name (str): El nombre de la tabla.
-            condition (dict): Condiciones de búsqueda.
+            condition (dict | Sequence[dict] | None): Condiciones de búsqueda. Por defecto no se filtra.
+            columns (Sequence[str] | None): Columnas a devolver. Si es None se devuelven todas.
+            order_by (str | Sequence[str] | None): Columnas de orden, con ``DESC`` opcional, p. ej. ``['age DESC', 'id DESC']``.
+            limit (int | None): Máximo de filas a devolver. Por defecto es None.
+            offset (int | None): Filas que se saltan antes de devolver resultados. Por defecto es None.
+            after (Sequence | None): Valores de ``order_by`` en la última fila de la página anterior. Por defecto es None.
+            row_factory (str | None): Formato de las filas: 'tuple', 'row', 'dict' o 'record'. Si es None se usa el de la instancia.
 
         Returns:
             list[tuple]: Lista de registros que cumplen con la condición.
@@ -257,23 +1325,388 @@ class Connect:
         Example:
             >>> conn.search('users', {'name': 'John'})
             [(1, 'John', 'john@example.com')]
+            >>> conn.search('users', [{'age': ('BETWEEN', 18, 30)}, {'email': ('LIKE', '%@example.com')}], columns=['id'], order_by='id', limit=2)
+            [(1,), (2,)]
+            >>> conn.search('users', {'age': ('>=', 18)}, columns=['id'], order_by='id', limit=2, after=(2,))
+            [(3,), (5,)]
         """
-        cursor = self._get_cursor()
-        
-        conditions = ' AND '.join([f"{column} = ?" for column in condition.keys()])
-        query = f"SELECT * FROM {table_name} WHERE {conditions}"
-
-        cursor.execute(query, tuple(condition.values()))
-        rows = cursor.fetchall()
+        query, params, where = self._search_query(table_name, condition, columns, order_by, limit, offset, after)
+        self._advise(table_name, where, query)
+        rows = self._cached_rows(table_name, query, params, self._resolve_row_factory(row_factory))
 
         if not rows:
-            print("[i] No se encontraron registros en la tabla que coincidan con los parámetros de búsqueda.")
+            self.instrumentation.message("[i] No se encontraron registros en la tabla que coincidan con los parámetros de búsqueda.")
             return []
 
         return rows
 
     @require_connection
     @handle_exception
+    def iter_table(self, table_name: str, batch_size: int | None = None, row_factory: str | None = None) -> Iterator[tuple[int | float | str, ...]]:
+        """
+        Recorre todos los registros de una tabla sin cargarlos completos en memoria.
+
+        Cada iterador usa su propio cursor, por lo que se pueden anidar varios iteradores.
+
+        Args:
+            table_name (str): El nombre de la tabla.
+            batch_size (int | None): Filas leídas por cada llamada a fetchmany. Si es None se usa fetch_size.
+            row_factory (str | None): Formato de las filas: 'tuple', 'row', 'dict' o 'record'. Si es None se usa el de la instancia.
+
+        Returns:
+            Iterator[tuple]: Iterador sobre las filas de la tabla.
+
+        Example:
+            >>> for row in conn.iter_table('users', batch_size=500):
+            ...     print(row)
+            (1, 'John', 'john@example.com')
+            (2, 'Jane', 'jane@example.com')
+        """
+        row_factory = self._resolve_row_factory(row_factory)
+        cursor = self._get_connection().cursor()
+        cursor.execute(self._statements.get(('select', table_name)))
+        return self._stream_cursor(cursor, batch_size, row_factory, table_name)
+
+    @require_connection
+    @handle_exception
+    def iter_search(self, table_name: str, condition: Condition, batch_size: int | None = None, row_factory: str | None = None) -> Iterator[tuple[int | float | str, ...]]:
+        """
+        Recorre los registros que coincidan con una condición sin cargarlos completos en memoria.
+
+        Args:
+            table_name (str): El nombre de la tabla.
+            condition (dict | Sequence[dict]): Condiciones de búsqueda, igual que en search().
+            batch_size (int | None): Filas leídas por cada llamada a fetchmany. Si es None se usa fetch_size.
+            row_factory (str | None): Formato de las filas: 'tuple', 'row', 'dict' o 'record'. Si es None se usa el de la instancia.
+
+        Returns:
+            Iterator[tuple]: Iterador sobre los registros que cumplen con la condición.
+
+        Example:
+            >>> list(conn.iter_search('users', {'name': 'John'}))
+            [(1, 'John', 'john@example.com')]
+        """
+        row_factory = self._resolve_row_factory(row_factory)
+        query, params, where = self._search_query(table_name, condition)
+        self._advise(table_name, where, query)
+        cursor = self._get_connection().cursor()
+        cursor.execute(query, params)
+        return self._stream_cursor(cursor, batch_size, row_factory, table_name)
+
+    @require_connection
+    @handle_exception
+    def iter_pages(self, table_name: str, order_by: str | Sequence[str], page_size: int = 1000, condition: Condition | None = None,
+                   columns: Sequence[str] | None = None, row_factory: str | None = None) -> Iterator[list[tuple[int | float | str, ...]]]:
+        """
+        Recorre el resultado de una búsqueda por páginas con paginación por clave: cada página continúa tras los
+        valores de ``order_by`` de la última fila de la anterior, así que el coste de cada página no depende de
+        su posición, a diferencia de LIMIT/OFFSET. ``order_by`` debe identificar las filas de forma única y sus
+        columnas deben estar entre las devueltas.
+
+        Args:
+            table_name (str): El nombre de la tabla.
+            order_by (str | Sequence[str]): Columnas de orden, todas en la misma dirección, p. ej. ``['country', 'id']``.
+            page_size (int): Filas por página. Por defecto es 1000.
+            condition (dict | Sequence[dict] | None): Condiciones de búsqueda, igual que en search().
+            columns (Sequence[str] | None): Columnas a devolver. Si es None se devuelven todas.
+            row_factory (str | None): Formato de las filas: 'tuple', 'row', 'dict' o 'record'. Si es None se usa el de la instancia.
+
+        Returns:
+            Iterator[list[tuple]]: Iterador sobre las páginas.
+
+        Example:
+            >>> for page in conn.iter_pages('users', 'id', page_size=500, condition={'active': 1}):
+            ...     process(page)
+        """
+        if page_size < 1:
+            raise ValueError("page_size debe ser mayor que cero")
+        row_factory = self._resolve_row_factory(row_factory)
+        names = [name.lower() for name in (columns or self._get_schema().columns(table_name))]
+        positions = []
+        for item in [order_by] if isinstance(order_by, str) else order_by:
+            column = item.split()[0].lower()
+            if column not in names:
+                raise ValueError(f"La columna de orden '{column}' debe estar entre las columnas devueltas")
+            positions.append(names.index(column))
+        query, params, _ = self._search_query(table_name, condition, columns, order_by, page_size)
+
+        def pages() -> Iterator[list[tuple[int | float | str, ...]]]:
+            cursor = self._get_connection().cursor()
+            try:
+                rows = cursor.execute(query, params).fetchall()
+                while rows:
+                    make = row_maker(row_factory, cursor, table_name)
+                    yield rows if make is None else list(map(make, rows))
+                    if len(rows) < page_size:
+                        return
+                    after = tuple(rows[-1][position] for position in positions)
+                    next_query, next_params, _ = self._search_query(table_name, condition, columns, order_by, page_size, None, after)
+                    rows = cursor.execute(next_query, next_params).fetchall()
+            finally:
+                cursor.close()
+        return pages()
+
+    @require_connection
+    @handle_exception
+    def parallel_scan(self, table_name: str, map_function: Callable[[Iterator[tuple]], any], reduce_function: Callable[[any, any], any] | None = None,
+                      workers: int | None = None, key: str = 'rowid', condition: Condition | None = None, columns: Sequence[str] | None = None,
+                      partitions: int | None = None, batch_size: int | None = None, initial: any = None) -> any:
+        """
+        Recorre una tabla en paralelo con un pool de procesos. La tabla se divide en rangos de ``key`` y cada
+        proceso abre su propia conexión de solo lectura (``mode=ro``), recorre un rango por lotes y lo pasa a
+        ``map_function``. Los resultados parciales se combinan con ``reduce_function`` en el orden de los rangos.
+
+        ``key`` debe ser el rowid o una columna indexada para que cada rango se lea con una búsqueda en el índice.
+        Las funciones se envían a otros procesos, así que deben poder serializarse con pickle (funciones definidas
+        a nivel de módulo, no lambdas). Cada rango se lee en su propia transacción: en modo WAL los procesos leen
+        sin bloquear a los escritores, pero el conjunto no es una instantánea única de la tabla y no ve los cambios
+        sin confirmar de la transacción en curso.
+
+        Args:
+            table_name (str): El nombre de la tabla.
+            map_function (Callable[[Iterator[tuple]], any]): Función que recibe un iterador sobre las filas (tuplas) de un rango.
+            reduce_function (Callable[[any, any], any] | None): Función que combina dos resultados parciales. Si es None se
+                devuelve la lista de resultados parciales.
+            workers (int | None): Procesos del pool. Si es None se usa el número de CPUs.
+            key (str): Columna por la que se divide la tabla. Por defecto es 'rowid'.
+            condition (dict | Sequence[dict] | None): Condiciones de búsqueda, igual que en search(). Por defecto se lee toda la tabla.
+            columns (Sequence[str] | None): Columnas a leer. Si es None se leen todas.
+            partitions (int | None): Número de rangos. Si es None se usan cuatro por proceso para repartir mejor la carga.
+            batch_size (int | None): Filas leídas por cada llamada a fetchmany. Si es None se usa fetch_size.
+            initial (any): Valor inicial de la reducción. Si es None se parte del primer resultado parcial.
+
+        Returns:
+            any: Resultado combinado, o la lista de resultados parciales si no se indica ``reduce_function``.
+
+        Example:
+            >>> def total(rows):
+            ...     return sum(row[0] for row in rows)
+            >>> conn.parallel_scan('orders', total, operator.add, workers=4, columns=['amount'])
+            1523400.5
+        """
+        if self._memory is not None or self._is_memory_path():
+            raise ValueError("parallel_scan() requiere una base de datos en disco: los otros procesos no pueden abrir una base de datos en memoria")
+        workers = workers or cpu_count() or 1
+        if workers < 1:
+            raise ValueError("workers debe ser mayor que cero")
+        partitions = partitions or workers * 4
+        if partitions < 1:
+            raise ValueError("partitions debe ser mayor que cero")
+        if not self._get_schema().has_table(table_name):
+            raise ValueError(f"La tabla '{table_name}' no existe")
+        if key.lower() not in ROWID_ALIASES | {column.lower() for column in self._get_schema().columns(table_name)}:
+            raise ValueError(f"La columna clave '{key}' no existe en la tabla '{table_name}'")
+
+        where, params = build_where(condition)
+        columns = tuple(columns or ())
+        bounds = partition_bounds(self._get_connection(), table_name, key, partitions)
+        queries = {bounded: self._statements.get(('scan', table_name, columns, (key,), where, bounded)) for bounded in (True, False)}
+        uri = database_uri(self.path, {'mode': 'ro', 'immutable': '1' if self.immutable else None})
+
+        start = perf_counter()
+        with ProcessPoolExecutor(max_workers=min(workers, len(bounds) or 1)) as pool:
+            futures = [
+                pool.submit(scan_partition, uri, queries[high is not None], (low, high, *params) if high is not None else (low, *params),
+                            map_function, batch_size or self.fetch_size)
+                for low, high in bounds
+            ]
+            results = [future.result() for future in futures]
+        self.instrumentation.message(f"[i] {len(bounds)} rangos de '{table_name}' recorridos en {perf_counter() - start:.2f} s")
+
+        if reduce_function is None:
+            return results
+        if initial is not None:
+            return reduce(reduce_function, results, initial)
+        return reduce(reduce_function, results) if results else None
+
+    @require_connection
+    @handle_exception
+    def read_columns(self, table_name: str, columns: Sequence[str] | None = None, condition: Condition | None = None, batch_size: int | None = None,
+                     numpy: bool = False, dtypes: dict[str, any] | None = None) -> tuple[dict[str, any], dict[str, any]]:
+        """
+        Lee columnas completas de una tabla directamente en arrays tipados, sin crear una tupla por fila.
+
+        Las filas se leen por lotes y cada valor se añade al array de su columna: ``array.array('q')`` para
+        columnas de afinidad entera, ``array.array('d')`` para reales, y listas para texto, BLOB y afinidad
+        NUMERIC (fechas, DECIMAL...). Una columna cuyos valores no caben en su array, como un INTEGER que guarda
+        texto, se devuelve como lista. Los NULL se marcan en una máscara por columna (1 o True significa NULL) y
+        en los arrays numéricos se guardan como 0. Con ``numpy=True`` se devuelven arrays de NumPy, que es una
+        dependencia opcional.
+
+        Args:
+            table_name (str): El nombre de la tabla.
+            columns (Sequence[str] | None): Columnas a leer. Si es None se leen todas.
+            condition (dict | Sequence[dict] | None): Condiciones de búsqueda, igual que en search(). Por defecto se lee toda la tabla.
+            batch_size (int | None): Filas leídas por cada llamada a fetchmany. Si es None se usa fetch_size.
+            numpy (bool): Indica si se devuelven arrays de NumPy. Por defecto es False.
+            dtypes (dict | None): Tipo de cada columna que no deba deducirse del tipo declarado: un typecode de
+                array.array (o None para usar una lista) o, con ``numpy=True``, un dtype de NumPy.
+
+        Returns:
+            tuple[dict, dict]: Valores y máscaras de NULL de cada columna.
+
+        Example:
+            >>> values, nulls = conn.read_columns('users', ['id', 'age'])
+            >>> values['age']
+            array('q', [30, 0, 28])
+            >>> nulls['age']
+            bytearray(b'\\x00\\x01\\x00')
+        """
+        dtypes = dtypes or {}
+        types = self._get_schema().table(table_name)['types']
+        if not types:
+            raise ValueError(f"La tabla '{table_name}' no existe")
+        columns = tuple(columns or types)
+        declared = {name.lower(): declared_type for name, declared_type in types.items()}
+
+        typecodes = []
+        for column in columns:
+            if not numpy and column in dtypes:
+                typecodes.append(dtypes[column])
+            else:
+                typecodes.append(column_typecode(declared.get(column.lower(), '')))
+
+        where, params = build_where(condition)
+        cursor = self._get_connection().cursor()
+        cursor.execute(self._statements.get(('read_columns', table_name, columns, where)), params)
+        values, masks = fetch_columns(cursor, columns, typecodes, batch_size or self.fetch_size)
+
+        if numpy:
+            return to_numpy(values, masks, dtypes)
+        return values, masks
+
+    @require_connection
+    @handle_exception
+    def count(self, table_name: str, condition: Condition | None = None) -> int:
+        """
+        Cuenta las filas de una tabla que cumplen una condición sin leerlas.
+
+        Args:
+            table_name (str): El nombre de la tabla.
+            condition (dict | Sequence[dict] | None): Condiciones de búsqueda, igual que en search(). Por defecto se cuenta toda la tabla.
+
+        Returns:
+            int: Número de filas.
+
+        Example:
+            >>> conn.count('users', {'age': ('>=', 18)})
+            42
+        """
+        where, params = build_where(condition)
+        query = self._statements.get(('count', table_name, where))
+        self._advise(table_name, where, query)
+        return self._cached_rows(table_name, query, params)[0][0]
+
+    @require_connection
+    @handle_exception
+    def exists(self, table_name: str, condition: Condition | None = None) -> bool:
+        """
+        Indica si alguna fila cumple una condición. La consulta usa ``LIMIT 1``, así que SQLite se detiene en la
+        primera coincidencia.
+
+        Args:
+            table_name (str): El nombre de la tabla.
+            condition (dict | Sequence[dict] | None): Condiciones de búsqueda, igual que en search(). Por defecto indica si la tabla tiene filas.
+
+        Returns:
+            bool: True si hay al menos una fila.
+
+        Example:
+            >>> conn.exists('users', {'email': 'john@example.com'})
+            True
+        """
+        where, params = build_where(condition)
+        query = self._statements.get(('exists', table_name, where))
+        self._advise(table_name, where, query)
+        return bool(self._cached_rows(table_name, query, params))
+
+    @require_connection
+    @handle_exception
+    def distinct(self, table_name: str, columns: str | Sequence[str], condition: Condition | None = None) -> list[any]:
+        """
+        Obtiene los valores distintos de una o varias columnas, ordenados.
+
+        Args:
+            table_name (str): El nombre de la tabla.
+            columns (str | Sequence[str]): Columna o columnas.
+            condition (dict | Sequence[dict] | None): Condiciones de búsqueda, igual que en search().
+
+        Returns:
+            list: Los valores si ``columns`` es una columna, o tuplas de valores si es una secuencia.
+
+        Example:
+            >>> conn.distinct('users', 'country')
+            ['AR', 'ES', 'MX']
+            >>> conn.distinct('users', ['country', 'active'], {'age': ('>=', 18)})
+            [('AR', 1), ('ES', 0), ('ES', 1)]
+        """
+        names = (columns,) if isinstance(columns, str) else tuple(columns)
+        if not names:
+            raise ValueError("Debes indicar al menos una columna")
+        where, params = build_where(condition)
+        query = self._statements.get(('distinct', table_name, names, where))
+        self._advise(table_name, where, query)
+        rows = self._cached_rows(table_name, query, params)
+        return [row[0] for row in rows] if isinstance(columns, str) else rows
+
+    @require_connection
+    @handle_exception
+    def aggregate(self, table_name: str, aggregates: dict[str, tuple[str, str]], condition: Condition | None = None,
+                  group_by: str | Sequence[str] | None = None, having: Condition | None = None) -> dict[str, any] | list[dict[str, any]]:
+        """
+        Calcula agregados dentro de SQLite y devuelve solo el resultado, opcionalmente agrupado.
+
+        Args:
+            table_name (str): El nombre de la tabla.
+            aggregates (dict[str, tuple[str, str]]): Alias de cada agregado y su (función, columna), con una función de
+                AGGREGATE_FUNCTIONS. ``('count', '*')`` cuenta filas.
+            condition (dict | Sequence[dict] | None): Condiciones de búsqueda que filtran las filas, igual que en search().
+            group_by (str | Sequence[str] | None): Columnas de agrupación. Por defecto se agrega toda la tabla.
+            having (dict | Sequence[dict] | None): Condiciones sobre los alias o las columnas de agrupación, con los mismos
+                operadores que ``condition``, que filtran los grupos.
+
+        Returns:
+            dict | list[dict]: Los agregados por alias, o una lista con las columnas de agrupación y los agregados de cada
+                grupo, ordenada por las columnas de agrupación.
+
+        Example:
+            >>> conn.aggregate('orders', {'total': ('sum', 'amount'), 'orders': ('count', '*')}, {'status': 'paid'})
+            {'total': 1523400.5, 'orders': 812}
+            >>> conn.aggregate('orders', {'total': ('sum', 'amount')}, group_by='country', having={'total': ('>', 1000)})
+            [{'country': 'ES', 'total': 80450.0}, {'country': 'MX', 'total': 12020.5}]
+        """
+        if not aggregates:
+            raise ValueError("Debes indicar al menos un agregado")
+        terms = []
+        for alias, spec in aggregates.items():
+            if not alias.isidentifier():
+                raise ValueError(f"Alias no válido: '{alias}'")
+            if not isinstance(spec, tuple) or len(spec) != 2 or str(spec[0]).lower() not in AGGREGATE_FUNCTIONS:
+                raise ValueError(f"Agregado no válido para '{alias}': {spec!r}. Usa (función, columna) con una de {', '.join(AGGREGATE_FUNCTIONS)}")
+            function, column = spec[0].upper(), spec[1]
+            if column == '*' and function != 'COUNT':
+                raise ValueError(f"Solo COUNT admite '*' como columna ('{alias}')")
+            terms.append((alias, function, column))
+        group_by = (group_by,) if isinstance(group_by, str) else tuple(group_by or ())
+
+        allowed = {name.lower() for name in (*aggregates, *group_by)}
+        for group in [having] if isinstance(having, dict) else having or ():
+            for name in group:
+                if name.lower() not in allowed:
+                    raise ValueError(f"HAVING solo admite alias o columnas de agrupación, no '{name}'")
+        where, params = build_where(condition)
+        having_shape, having_params = build_where(having)
+        query = self._statements.get(('aggregate', table_name, tuple(terms), where, group_by, having_shape))
+        self._advise(table_name, where, query)
+        rows = self._cached_rows(table_name, query, params + having_params)
+
+        names = (*group_by, *aggregates)
+        results = [dict(zip(names, row)) for row in rows]
+        return results if group_by else results[0]
+
+    @require_connection
+    @handle_exception
+    @require_writable
     def insert(self, table_name: str, data: dict[str, any]) -> bool:
         """
         Inserta un registro en una tabla.
@@ -293,28 +1726,36 @@ class Connect:
         if not data:
             raise ValueError("No hay datos para insertar")
         
-        connection = self._get_connection()
         cursor = self._get_cursor()
         
-        columns = ', '.join(data.keys())
-        values = ', '.join(['?' for _ in range(len(data))])
-        query = f"INSERT INTO {table_name} ({columns}) VALUES ({values})"
+        query = self._statements.get(('insert', table_name, tuple(data)))
 
         cursor.execute(query, tuple(data.values()))
-        connection.commit()
+        self._commit()
+        self._invalidate_results(table_name)
 
-        print("[i] Datos insertados exitosamente")
+        self.instrumentation.message("[i] Datos insertados exitosamente")
         return True
 
     @require_connection
     @handle_exception
-    def bulk_insert(self, table_name: str, data_list: list[dict[str, any]]) -> bool:
+    @require_writable
+    def bulk_insert(self, table_name: str, data_list: Iterable[dict[str, any] | Sequence[any]], columns: Sequence[str] | None = None, chunk_size: int = 500) -> bool:
         """
         Inserta múltiples registros en una tabla.
 
+        Acepta cualquier iterable (incluidos generadores) y lo inserta por bloques dentro de una sola
+        transacción, usando sentencias ``INSERT ... VALUES (...), (...)`` de varias filas cuyo número de
+        parámetros nunca supera el límite SQLITE_MAX_VARIABLE_NUMBER de la conexión. Solo se mantiene
+        en memoria un bloque a la vez.
+
         Args:
             table_name (str): El nombre de la tabla.
-            data_list (list[dict]): Lista de diccionarios con los datos a insertar.
+            data_list (Iterable[dict | Sequence]): Registros a insertar. Pueden ser diccionarios, cuyos valores se toman por
+                nombre de columna, o tuplas/listas con los valores en el orden de ``columns``.
+            columns (Sequence[str] | None): Columnas a insertar. Es obligatorio si los registros no son diccionarios; si es None
+                se toman las claves del primer diccionario.
+            chunk_size (int): Cantidad máxima de filas por sentencia. Por defecto es 500.
 
         Returns:
             bool: True si la inserción fue exitosa.
@@ -323,35 +1764,33 @@ class Connect:
             >>> conn.bulk_insert('users', [{'name': 'John', 'email': 'john@example.com'}, {'name': 'Jane', 'email': 'jane@example.com'}])
             [i] Registros insertados exitosamente
             True
+            >>> conn.bulk_insert('users', ((f'user{i}', None) for i in range(10**6)), columns=('name', 'email'))
+            [i] Registros insertados exitosamente
+            True
         """
-        if not data_list:
-            raise ValueError("No hay datos para insertar")
-        
-        connection = self._get_connection()
-        cursor = self._get_cursor()
+        if chunk_size < 1:
+            raise ValueError("chunk_size debe ser mayor que cero")
 
-        columns = ', '.join(data_list[0].keys())
-        values = ', '.join(['?' for _ in data_list[0].keys()])
-        query = f"INSERT INTO {table_name} ({columns}) VALUES ({values})"
+        with self.transaction():
+            if not self._insert_rows(table_name, data_list, columns, chunk_size):
+                raise ValueError("No hay datos para insertar")
 
-        values_list = [tuple(data.values()) for data in data_list]
+        self._invalidate_results(table_name)
 
-        cursor.executemany(query, values_list)
-        connection.commit()
-
-        print("[i] Registros insertados exitosamente")
+        self.instrumentation.message("[i] Registros insertados exitosamente")
         return True
 
     @require_connection
     @handle_exception
-    def update(self, table_name: str, data: dict[str, any], condition: dict[str, any]) -> bool:
+    @require_writable
+    def update(self, table_name: str, data: dict[str, any], condition: Condition) -> bool:
         """
         Actualiza registros en una tabla que coincidan con una condición.
 
         Args:
             table_name (str): El nombre de la tabla.
             data (dict): Diccionario con los datos a actualizar.
-            condition (dict): Condición para seleccionar los registros a actualizar.
+            condition (dict | Sequence[dict]): Condición para seleccionar los registros a actualizar, con los operadores de search().
 
         Returns:
             bool: True si la actualización fue exitosa.
@@ -361,29 +1800,30 @@ class Connect:
             [i] Datos actualizados exitosamente
             True
         """
-        connection = self._get_connection()
         cursor = self._get_cursor()
         
-        set_clause = ', '.join([f"{key} = ?" for key in data.keys()])
-        where_clause = ' AND '.join([f"{key} = ?" for key in condition.keys()])
-        query = f"UPDATE {table_name} SET {set_clause} WHERE {where_clause}"
-        values = tuple(data.values()) + tuple(condition.values())
+        where, params = build_where(condition)
+        query = self._statements.get(('update', table_name, tuple(data), where))
+        self._advise(table_name, where, query)
+        values = tuple(data.values()) + params
 
         cursor.execute(query, values)
-        connection.commit()
+        self._commit()
+        self._invalidate_results(table_name)
 
-        print("[i] Datos actualizados exitosamente")
+        self.instrumentation.message("[i] Datos actualizados exitosamente")
         return True
 
     @require_connection
     @handle_exception
-    def delete(self, table_name: str, condition: dict[str, any]) -> bool:
+    @require_writable
+    def delete(self, table_name: str, condition: Condition) -> bool:
         """
         Elimina registros en una tabla que coincidan con una condición.
 
         Args:
             table_name (str): El nombre de la tabla.
-            condition (dict): Condición para seleccionar los registros a eliminar.
+            condition (dict | Sequence[dict]): Condición para seleccionar los registros a eliminar, con los operadores de search().
 
         Returns:
             bool: True si la eliminación fue exitosa.
@@ -393,19 +1833,206 @@ class Connect:
             [i] Datos eliminados exitosamente
             True
         """
-        connection = self._get_connection()
         cursor = self._get_cursor()
         
-        query = f"DELETE FROM {table_name} WHERE " + " AND ".join([f"{field} = ?" for field in condition.keys()])
+        where, params = build_where(condition)
+        query = self._statements.get(('delete', table_name, where))
+        self._advise(table_name, where, query)
 
-        cursor.execute(query, tuple(condition.values()))
-        connection.commit()
+        cursor.execute(query, params)
+        self._commit()
+        self._invalidate_results(table_name)
 
-        print("[i] Datos eliminados exitosamente")
+        self.instrumentation.message("[i] Datos eliminados exitosamente")
         return True
 
     @require_connection
     @handle_exception
+    @require_writable
+    def bulk_update(self, table_name: str, data_list: Iterable[dict[str, any]], key: str | Sequence[str] | None = None, chunk_size: int = 10000) -> int:
+        """
+        Actualiza múltiples registros identificados por sus columnas clave en una sola transacción.
+
+        Cada registro es un diccionario con los valores de las columnas clave y de las columnas a actualizar.
+        Los registros se agrupan según las columnas que traen y cada grupo se ejecuta con ``executemany``.
+
+        Args:
+            table_name (str): El nombre de la tabla.
+            data_list (Iterable[dict]): Registros a actualizar.
+            key (str | Sequence[str] | None): Columna o columnas que identifican cada registro. Por defecto es la clave primaria.
+            chunk_size (int): Registros leídos por bloque. Por defecto es 10000.
+
+        Returns:
+            int: Número de filas actualizadas.
+
+        Example:
+            >>> conn.bulk_update('users', [{'id': 1, 'email': 'john@example.com'}, {'id': 2, 'name': 'Jane'}])
+            [i] 2 registros actualizados exitosamente
+            2
+        """
+        key_columns = self._key_columns(table_name, key)
+
+        def statements() -> Iterator[tuple[tuple[any, ...], tuple[any, ...]]]:
+            for row in data_list:
+                try:
+                    key_values = tuple(row[column] for column in key_columns)
+                except KeyError as e:
+                    raise ValueError(f"Al registro {row!r} le falta la columna clave {e}") from None
+                columns = tuple(column for column in row if column not in key_columns)
+                if not columns:
+                    raise ValueError(f"El registro {row!r} no tiene columnas para actualizar")
+                yield ('update', table_name, columns, key_columns), tuple(row[column] for column in columns) + key_values
+
+        with self.transaction():
+            affected = self._execute_grouped(statements(), chunk_size)
+        self._invalidate_results(table_name)
+
+        self.instrumentation.message(f"[i] {affected} registros actualizados exitosamente")
+        return affected
+
+    @require_connection
+    @handle_exception
+    @require_writable
+    def bulk_delete(self, table_name: str, conditions: Iterable[dict[str, any]], chunk_size: int = 10000) -> int:
+        """
+        Elimina los registros que coincidan con cada una de las condiciones en una sola transacción.
+        Las condiciones se agrupan según su forma y cada grupo se ejecuta con ``executemany``.
+
+        Args:
+            table_name (str): El nombre de la tabla.
+            conditions (Iterable[dict]): Condiciones para seleccionar los registros a eliminar, con los operadores de search().
+            chunk_size (int): Condiciones leídas por bloque. Por defecto es 10000.
+
+        Returns:
+            int: Número de filas eliminadas.
+
+        Example:
+            >>> conn.bulk_delete('users', [{'id': 1}, {'id': 2}, {'name': 'John'}])
+            [i] 3 registros eliminados exitosamente
+            3
+        """
+        def statements() -> Iterator[tuple[tuple[any, ...], tuple[any, ...]]]:
+            for condition in conditions:
+                if not condition:
+                    raise ValueError("Cada condición debe tener al menos una columna")
+                where, params = build_where(condition)
+                yield ('delete', table_name, where), params
+
+        with self.transaction():
+            affected = self._execute_grouped(statements(), chunk_size)
+        self._invalidate_results(table_name)
+
+        self.instrumentation.message(f"[i] {affected} registros eliminados exitosamente")
+        return affected
+
+    def _upsert_rows(self, table_name: str, data_list: Iterable[dict[str, any] | Sequence[any]], columns: Sequence[str] | None,
+                     conflict: str | Sequence[str] | None, update: Sequence[str] | None, chunk_size: int) -> int:
+        """
+        Inserta o actualiza registros con ``INSERT ... ON CONFLICT DO UPDATE`` en una sola transacción.
+
+        Args:
+            table_name (str): El nombre de la tabla.
+            data_list (Iterable[dict | Sequence]): Registros a insertar o actualizar.
+            columns (Sequence[str] | None): Columnas de los registros que no son diccionarios.
+            conflict (str | Sequence[str] | None): Columnas del objetivo del conflicto. Por defecto es la clave primaria.
+            update (Sequence[str] | None): Columnas que se actualizan al haber conflicto. Por defecto, todas las demás.
+            chunk_size (int): Registros leídos por bloque.
+
+        Returns:
+            int: Número de filas insertadas o actualizadas.
+        """
+        if sqlite_version_info < (3, 24, 0):
+            raise ValueError("upsert requiere SQLite 3.24.0 o superior")
+        conflict_columns = self._key_columns(table_name, conflict)
+        update_columns = tuple(update) if update is not None else None
+
+        def statements() -> Iterator[tuple[tuple[any, ...], Sequence[any]]]:
+            for row in data_list:
+                if isinstance(row, dict):
+                    row_columns, values = tuple(row), tuple(row.values())
+                elif columns is None:
+                    raise ValueError("Debes indicar las columnas cuando los registros no son diccionarios")
+                else:
+                    row_columns, values = tuple(columns), row
+                if len(values) != len(row_columns):
+                    raise ValueError(f"El registro {row!r} no coincide con las columnas {row_columns}")
+                changes = update_columns if update_columns is not None else tuple(column for column in row_columns if column not in conflict_columns)
+                yield ('upsert', table_name, row_columns, conflict_columns, changes), values
+
+        with self.transaction():
+            affected = self._execute_grouped(statements(), chunk_size)
+        self._invalidate_results(table_name)
+        return affected
+
+    @require_connection
+    @handle_exception
+    @require_writable
+    def upsert(self, table_name: str, data: dict[str, any], conflict: str | Sequence[str] | None = None, update: Sequence[str] | None = None) -> int:
+        """
+        Inserta un registro o, si ya existe uno con la misma clave, lo actualiza (``INSERT ... ON CONFLICT DO UPDATE``).
+        Requiere SQLite 3.24.0 o superior.
+
+        Args:
+            table_name (str): El nombre de la tabla.
+            data (dict): Diccionario con los datos a insertar.
+            conflict (str | Sequence[str] | None): Columnas de la restricción UNIQUE o PRIMARY KEY que detecta el conflicto.
+                Por defecto es la clave primaria.
+            update (Sequence[str] | None): Columnas que se actualizan al haber conflicto. Por defecto, todas las que no forman
+                parte de ``conflict``; con una secuencia vacía el registro existente se deja como está.
+
+        Returns:
+            int: 1 si el registro se insertó o actualizó, 0 si se dejó como estaba.
+
+        Example:
+            >>> conn.upsert('users', {'id': 1, 'name': 'John', 'email': 'john@example.com'})
+            [i] Datos insertados o actualizados exitosamente
+            1
+        """
+        if not data:
+            raise ValueError("No hay datos para insertar")
+
+        affected = self._upsert_rows(table_name, (data,), None, conflict, update, 1)
+
+        self.instrumentation.message("[i] Datos insertados o actualizados exitosamente")
+        return affected
+
+    @require_connection
+    @handle_exception
+    @require_writable
+    def bulk_upsert(self, table_name: str, data_list: Iterable[dict[str, any] | Sequence[any]], columns: Sequence[str] | None = None,
+                    conflict: str | Sequence[str] | None = None, update: Sequence[str] | None = None, chunk_size: int = 10000) -> int:
+        """
+        Inserta o actualiza múltiples registros en una sola transacción con ``INSERT ... ON CONFLICT DO UPDATE``.
+        Los registros se agrupan según sus columnas y cada grupo se ejecuta con ``executemany``.
+        Requiere SQLite 3.24.0 o superior.
+
+        Args:
+            table_name (str): El nombre de la tabla.
+            data_list (Iterable[dict | Sequence]): Registros a insertar o actualizar. Pueden ser diccionarios o tuplas/listas con
+                los valores en el orden de ``columns``.
+            columns (Sequence[str] | None): Columnas de los registros que no son diccionarios.
+            conflict (str | Sequence[str] | None): Columnas de la restricción UNIQUE o PRIMARY KEY que detecta el conflicto.
+                Por defecto es la clave primaria.
+            update (Sequence[str] | None): Columnas que se actualizan al haber conflicto. Por defecto, todas las que no forman
+                parte de ``conflict``; con una secuencia vacía los registros existentes se dejan como están.
+            chunk_size (int): Registros leídos por bloque. Por defecto es 10000.
+
+        Returns:
+            int: Número de filas insertadas o actualizadas.
+
+        Example:
+            >>> conn.bulk_upsert('users', [(1, 'John'), (2, 'Jane')], columns=('id', 'name'))
+            [i] 2 registros insertados o actualizados exitosamente
+            2
+        """
+        affected = self._upsert_rows(table_name, data_list, columns, conflict, update, chunk_size)
+
+        self.instrumentation.message(f"[i] {affected} registros insertados o actualizados exitosamente")
+        return affected
+
+    @require_connection
+    @handle_exception
+    @require_writable
     def create_table(self, table_name: str, columns: dict[str, any], apply_constraints: bool = False) -> bool:
         """
         Crea una nueva tabla en la base de datos.
@@ -446,12 +2073,15 @@ class Connect:
         query = f"CREATE TABLE {table_name} ({columns_sql})"
 
         cursor.execute(query)
+        self._get_schema().invalidate()
+        self._invalidate_results(table_name)
 
-        print(f"[i] Tabla '{table_name}' creada exitosamente")
+        self.instrumentation.message(f"[i] Tabla '{table_name}' creada exitosamente")
         return True
 
     @require_connection
     @handle_exception
+    @require_writable
     def add_column(self, table_name: str, column_name: str, column_type: str) -> bool:
         """
         Añade una nueva columna a una tabla existente.
@@ -469,23 +2099,30 @@ class Connect:
             [i] Columna 'age' añadida exitosamente a la tabla 'users'
             True
         """
-        connection = self._get_connection()
         cursor = self._get_cursor()
         
         query = f"ALTER TABLE {table_name} ADD COLUMN {column_name} {column_type}"
 
         cursor.execute(query)
-        connection.commit()
+        self._commit()
+        self._get_schema().invalidate()
+        self._invalidate_results(table_name)
 
-        print(f"[i] Columna '{column_name}' añadida exitosamente a la tabla '{table_name}'")
+        self.instrumentation.message(f"[i] Columna '{column_name}' añadida exitosamente a la tabla '{table_name}'")
         return True
     
     @require_connection
     @handle_exception
+    @require_writable
     def drop_column(self, table_name: str, column_name: str) -> bool:
         """
         Elimina una columna de una tabla.
 
+        Con SQLite 3.35.0 o superior usa ``ALTER TABLE ... DROP COLUMN``. Si la versión es anterior o SQLite
+        no admite eliminar la columna de forma nativa (por ejemplo, porque tiene un índice o una restricción
+        UNIQUE), reconstruye la tabla con alter_table(), conservando el resto de restricciones, índices y triggers.
+        Los índices que usan la columna se eliminan y se informa de ello; cualquier otro error se propaga.
+
         Args:
             table_name (str): El nombre de la tabla.
             column_name (str): El nombre de la columna a eliminar.
@@ -498,33 +2135,213 @@ class Connect:
             [i] Columna 'age' eliminada exitosamente de la tabla 'users'
             True
         """
-        connection = self._get_connection()
-        cursor = self._get_cursor()
-        
         columns = self.get_column_names(table_name)
         if column_name not in columns:
             raise ValueError(f"La columna '{column_name}' no existe en la tabla '{table_name}'")
 
-        new_columns = [col for col in columns if col != column_name]
-        new_columns_sql = ', '.join(new_columns)
+        dropped = False
+        if sqlite_version_info >= (3, 35, 0):
+            try:
+                self._get_cursor().execute(f"ALTER TABLE {table_name} DROP COLUMN {column_name}")
+                dropped = True
+            except OperationalError as e:
+                # SQLite no elimina de forma nativa columnas con PRIMARY KEY, UNIQUE o índices; solo esos casos se reconstruyen.
+                message = str(e).lower()
+                if not message.startswith('cannot drop') and 'after drop column' not in message:
+                    raise
+        if dropped:
+            self._commit()
+            self._get_schema().invalidate()
+        else:
+            self._alter_table(table_name, [('drop', column_name)])
+        self._invalidate_results(table_name)
+
+        self.instrumentation.message(f"[i] Columna '{column_name}' eliminada exitosamente de la tabla '{table_name}'")
+        return True
+
+    def _alter_table(self, table_name: str, operations: Sequence[tuple[str, ...]]) -> bool:
+        """
+        Aplica las operaciones de alter_table(). Los cambios de nombre se hacen con ``ALTER TABLE ... RENAME COLUMN``,
+        que no copia filas y actualiza índices, triggers y vistas; el resto, con una única reconstrucción de la tabla
+        salvo que solo se añadan columnas.
+
+        Args:
+            table_name (str): El nombre de la tabla.
+            operations (Sequence[tuple]): Operaciones a aplicar.
+
+        Returns:
+            bool: True si la tabla se reconstruyó.
+        """
+        schema = self._get_schema()
+        if not schema.has_table(table_name):
+            raise ValueError(f"La tabla '{table_name}' no existe")
+        original = schema.columns(table_name)
+
+        entries: list[dict[str, any]] = [{'source': column, 'name': column, 'type': None, 'definition': None} for column in original]
+
+        def find(column_name: str) -> dict[str, any] | None:
+            for entry in entries:
+                if entry['name'].lower() == column_name.lower():
+                    return entry
+            return None
+
+        def existing(column_name: str) -> dict[str, any]:
+            entry = find(column_name)
+            if entry is None:
+                raise ValueError(f"La columna '{column_name}' no existe en la tabla '{table_name}'")
+            return entry
+
+        for operation in operations:
+            kind, *args = operation
+            if kind not in ALTER_OPERATIONS or len(args) != (1 if kind == 'drop' else 2):
+                raise ValueError(f"Operación no válida: {operation!r}. Usa ('add', columna, tipo), ('drop', columna), ('rename', columna, nombre) o ('retype', columna, tipo)")
+            if kind in ('add', 'rename') and find(args[-1 if kind == 'rename' else 0]) is not None:
+                raise ValueError(f"La columna '{args[-1 if kind == 'rename' else 0]}' ya existe en la tabla '{table_name}'")
+            match kind:
+                case 'add':
+                    entries.append({'source': None, 'name': args[0], 'type': None, 'definition': args[1]})
+                case 'drop':
+                    entries.remove(existing(args[0]))
+                case 'rename':
+                    existing(args[0])['name'] = args[1]
+                case 'retype':
+                    existing(args[0])['type'] = args[1]
+        if not entries:
+            raise ValueError(f"La tabla '{table_name}' debe conservar al menos una columna")
+
+        kept = [entry for entry in entries if entry['source']]
+        renames = [(entry['source'], entry['name']) for entry in kept if entry['name'] != entry['source']]
+        taken = {column.lower() for column in original}
+        for source, name in renames:
+            if name.lower() in taken and name.lower() != source.lower():
+                raise ValueError(f"No se puede renombrar '{source}' a '{name}' porque la tabla ya tiene esa columna; hazlo en dos llamadas")
+        rebuild = len(kept) < len(original) or len([entry for entry in kept if entry['type']]) > 0
+
+        connection = self._get_connection()
+        foreign_keys = rebuild and connection.execute("PRAGMA foreign_keys").fetchone()[0]
+        if foreign_keys:
+            if self._in_transaction():
+                raise ValueError("Con foreign_keys activado, alter_table debe ejecutarse fuera de una transacción")
+            connection.execute("PRAGMA foreign_keys = OFF")
+        try:
+            with self.transaction('IMMEDIATE'):
+                cursor = self._get_cursor()
+                for source, name in renames:
+                    cursor.execute(f"ALTER TABLE {table_name} RENAME COLUMN {source} TO {name}")
+                if rebuild:
+                    self._rebuild_table(table_name, entries)
+                else:
+                    for entry in entries:
+                        if not entry['source']:
+                            cursor.execute(f"ALTER TABLE {table_name} ADD COLUMN {entry['name']} {entry['definition']}")
+                if foreign_keys and connection.execute("PRAGMA foreign_key_check").fetchone() is not None:
+                    raise ValueError(f"La migración de '{table_name}' incumple alguna clave foránea")
+        finally:
+            if foreign_keys:
+                connection.execute("PRAGMA foreign_keys = ON")
+            schema.invalidate()
+        return rebuild
+
+    def _rebuild_table(self, table_name: str, entries: list[dict[str, any]]) -> None:
+        """
+        Reescribe una tabla con sus nuevas columnas siguiendo el procedimiento recomendado por SQLite: crea la
+        tabla nueva a partir del CREATE TABLE original, copia las filas (y el rowid) con un solo INSERT ... SELECT,
+        elimina la original, renombra la nueva con ``legacy_alter_table`` activado para no tocar las vistas y
+        vuelve a crear sus índices y triggers. Debe ejecutarse dentro de una transacción.
+
+        Los índices que usan columnas eliminadas se descartan; las restricciones de tabla y los triggers que las
+        usan impiden la migración.
+
+        Args:
+            table_name (str): El nombre de la tabla.
+            entries (list[dict]): Columnas finales, con su columna de origen (o None si es nueva), nombre, tipo nuevo y definición.
+        """
+        connection = self._get_connection()
+        cursor = self._get_cursor()
+        sql = connection.execute("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = ? COLLATE NOCASE", (table_name,)).fetchone()[0]
+        definition = parse_create_table(sql)
+
+        current = {name.lower(): column_sql for name, column_sql in definition.columns}
+        kept = {entry['name'].lower() for entry in entries if entry['source']}
+        dropped = [name for name, _ in definition.columns if name.lower() not in kept]
+        objects = connection.execute("SELECT type, name, sql FROM sqlite_master WHERE type IN ('index', 'trigger') AND tbl_name = ? COLLATE NOCASE AND sql IS NOT NULL",
+                                     (table_name,)).fetchall()
+        for column in dropped:
+            for constraint in definition.constraints:
+                if mentions(constraint, column):
+                    raise ValueError(f"La columna '{column}' forma parte de la restricción '{constraint}' de la tabla '{table_name}'")
+            for kind, name, object_sql in objects:
+                if kind == 'trigger' and mentions(object_sql, column):
+                    raise ValueError(f"La columna '{column}' se usa en el trigger '{name}' de la tabla '{table_name}'")
+
+        column_defs = []
+        for entry in entries:
+            if entry['source']:
+                column_sql = current[entry['name'].lower()]
+                column_defs.append(retype_definition(column_sql, entry['type']) if entry['type'] else column_sql)
+            else:
+                column_defs.append(f"{entry['name']} {entry['definition']}")
+
+        copied = [entry['name'] for entry in entries if entry['source']]
+        if 'WITHOUT ROWID' not in definition.options.upper() and not {column.lower() for column in copied} & ROWID_ALIASES:
+            copied.insert(0, 'rowid')
+
+        new_table = f"{table_name}_sqlite3manager_new"
+        legacy_alter_table = connection.execute("PRAGMA legacy_alter_table").fetchone()[0]
+        connection.execute("PRAGMA legacy_alter_table = ON")
+        try:
+            cursor.execute(f"CREATE TABLE {new_table} ({', '.join(column_defs + definition.constraints)}) {definition.options}".rstrip())
+            cursor.execute(f"INSERT INTO {new_table} ({', '.join(copied)}) SELECT {', '.join(copied)} FROM {table_name}")
+            cursor.execute(f"DROP TABLE {table_name}")
+            cursor.execute(f"ALTER TABLE {new_table} RENAME TO {table_name}")
+            skipped = []
+            for kind, name, object_sql in objects:
+                if kind == 'index' and [column for column in dropped if mentions(object_sql, column)]:
+                    skipped.append(name)
+                    continue
+                cursor.execute(object_sql)
+        finally:
+            connection.execute(f"PRAGMA legacy_alter_table = {legacy_alter_table}")
+        if skipped:
+            self.instrumentation.message(f"[i] Índices eliminados de la tabla '{table_name}' por usar columnas eliminadas: {', '.join(skipped)}")
+
+    @require_connection
+    @handle_exception
+    @require_writable
+    def alter_table(self, table_name: str, operations: Sequence[tuple[str, ...]]) -> bool:
+        """
+        Aplica varias modificaciones a una tabla en una sola transacción, reescribiéndola como mucho una vez.
+
+        Las operaciones se aplican en orden y pueden ser ``('add', columna, tipo)``, ``('drop', columna)``,
+        ``('rename', columna, nombre)`` o ``('retype', columna, tipo)``. Los cambios de nombre y las columnas
+        añadidas usan ``ALTER TABLE`` sin copiar filas; si hay columnas eliminadas o cambios de tipo, la tabla se
+        reconstruye una sola vez conservando la clave primaria, las restricciones, los valores por defecto, los
+        rowid, los índices y los triggers. Con ``foreign_keys`` activado debe ejecutarse fuera de una transacción.
 
-        temp_table_name = f"{table_name}_temp"
-        create_temp_table_query = f"CREATE TABLE {temp_table_name} AS SELECT {new_columns_sql} FROM {table_name}"
-        cursor.execute(create_temp_table_query)
+        Args:
+            table_name (str): El nombre de la tabla.
+            operations (Sequence[tuple]): Operaciones a aplicar.
 
-        drop_table_query = f"DROP TABLE {table_name}"
-        cursor.execute(drop_table_query)
+        Returns:
+            bool: True si la tabla fue modificada exitosamente.
 
-        rename_table_query = f"ALTER TABLE {temp_table_name} RENAME TO {table_name}"
-        cursor.execute(rename_table_query)
+        Example:
+            >>> conn.alter_table('users', [('drop', 'age'), ('rename', 'mail', 'email'), ('retype', 'score', 'REAL'), ('add', 'active', 'INTEGER DEFAULT 1')])
+            [i] Tabla 'users' modificada exitosamente
+            True
+        """
+        if not operations:
+            raise ValueError("No hay operaciones que aplicar")
 
-        connection.commit()
+        self._alter_table(table_name, operations)
+        self._invalidate_results(table_name)
 
-        print(f"[i] Columna '{column_name}' eliminada exitosamente de la tabla '{table_name}'")
+        self.instrumentation.message(f"[i] Tabla '{table_name}' modificada exitosamente")
         return True
 
     @require_connection
     @handle_exception
+    @require_writable
     def drop_table(self, table_name: str) -> bool:
         """
         Elimina una tabla de la base de datos.
@@ -540,58 +2357,1029 @@ class Connect:
             [i] Tabla 'users' eliminada exitosamente
             True
         """
-        connection = self._get_connection()
         cursor = self._get_cursor()
         
         query = f"DROP TABLE IF EXISTS {table_name}"
 
         cursor.execute(query)
-        connection.commit()
+        self._commit()
+        self._get_schema().invalidate()
+        self._invalidate_results(table_name)
 
-        print(f"[i] Tabla '{table_name}' eliminada exitosamente")
+        self.instrumentation.message(f"[i] Tabla '{table_name}' eliminada exitosamente")
         return True
 
     @require_connection
     @handle_exception
-    def custom_query(self, query: str) -> list[tuple[int | float | str, ...]]:
+    @require_writable
+    def create_index(self, table_name: str, columns: str | Sequence[str], index_name: str | None = None, unique: bool = False,
+                     where: str | None = None, include: Sequence[str] | None = None) -> bool:
         """
-        Ejecuta una consulta personalizada en la base de datos.
+        Crea un índice sobre una o varias columnas de una tabla, si no existe.
 
         Args:
-            query (str): Consulta SQL a ejecutar.
+            table_name (str): El nombre de la tabla.
+            columns (str | Sequence[str]): Columna o columnas del índice. Admiten ``ASC``/``DESC``, p. ej. ``'age DESC'``.
+            index_name (str | None): Nombre del índice. Por defecto es ``idx_<tabla>_<columnas>``.
+            unique (bool): Indica si el índice es UNIQUE. Por defecto es False.
+            where (str | None): Condición SQL de un índice parcial, p. ej. ``'active = 1'``. Por defecto es None.
+            include (Sequence[str] | None): Columnas que se añaden al final del índice para que cubra las consultas que las leen
+                sin acceder a la tabla (índice de cobertura). Por defecto es None.
 
         Returns:
-            list[tuple]: Resultado de la consulta.
+            bool: True si el índice fue creado exitosamente.
 
         Example:
-            >>> conn.custom_query('SELECT * FROM users WHERE age > 30')
-            [(1, 'John', 35), (2, 'Jane', 40)]
+            >>> conn.create_index('users', ['country', 'age DESC'], where='active = 1', include=['email'])
+            [i] Índice 'idx_users_country_age' creado exitosamente
+            True
         """
-        cursor = self._get_cursor()
-        cursor.execute(query)
-        results = cursor.fetchall()
-        return results
+        columns = [columns] if isinstance(columns, str) else list(columns)
+        columns += list(include or ())
+        if not columns:
+            raise ValueError("El índice debe tener al menos una columna")
+
+        schema = self._get_schema()
+        if not schema.has_table(table_name):
+            raise ValueError(f"La tabla '{table_name}' no existe")
+        known = {column.lower() for column in schema.columns(table_name)} | ROWID_ALIASES
+        names = [column.split()[0] for column in columns]
+        for name in names:
+            if name.lower() not in known:
+                raise ValueError(f"La columna '{name}' no existe en la tabla '{table_name}'")
+
+        index_name = index_name or f"idx_{table_name}_{'_'.join(names[:len(names) - len(include or ())])}"
+        query = f"CREATE {'UNIQUE ' if unique else ''}INDEX IF NOT EXISTS {index_name} ON {table_name} ({', '.join(columns)})"
+        if where:
+            query += f" WHERE {where}"
+
+        self._get_cursor().execute(query)
+        self._commit()
+        schema.invalidate()
+
+        self.instrumentation.message(f"[i] Índice '{index_name}' creado exitosamente")
+        return True
 
-    def close(self) -> None:
+    @require_connection
+    @handle_exception
+    @require_writable
+    def drop_index(self, index_name: str) -> bool:
         """
-        Cierra la conexión y el cursor de la base de datos.
+        Elimina un índice, si existe.
+
+        Args:
+            index_name (str): El nombre del índice.
 
         Returns:
-            None
+            bool: True si el índice fue eliminado exitosamente.
 
         Example:
-            >>> conn.close()
+            >>> conn.drop_index('idx_users_country_age')
+            [i] Índice 'idx_users_country_age' eliminado exitosamente
+            True
         """
-        if hasattr(self._local, 'cursor') and self._local.cursor:
-            self._local.cursor.close()
-        if hasattr(self._local, 'connection') and self._local.connection:
-            self._local.connection.close()
-        
-        if hasattr(self._local, 'connection_status'):
-            del self._local.connection_status
-        if hasattr(self._local, 'connection'):
-            del self._local.connection
-        if hasattr(self._local, 'cursor'):
-            del self._local.cursor
-        
-        print("[i] Conexión cerrada exitosamente")
+        self._get_cursor().execute(f"DROP INDEX IF EXISTS {index_name}")
+        self._commit()
+        self._get_schema().invalidate()
+
+        self.instrumentation.message(f"[i] Índice '{index_name}' eliminado exitosamente")
+        return True
+
+    @require_connection
+    @handle_exception
+    def list_indexes(self, table_name: str | None = None) -> list[dict[str, any]]:
+        """
+        Lista los índices de una tabla o de toda la base de datos, incluidos los que SQLite crea para
+        las restricciones PRIMARY KEY y UNIQUE.
+
+        Args:
+            table_name (str | None): El nombre de la tabla. Si es None se listan los índices de todas las tablas.
+
+        Returns:
+            list[dict]: Nombre, tabla, columnas, si es único, si es parcial y su origen ('c' si se creó con CREATE INDEX,
+                'u' por una restricción UNIQUE o 'pk' por la clave primaria).
+
+        Example:
+            >>> conn.list_indexes('users')
+            [{'name': 'idx_users_age', 'table': 'users', 'columns': ['age'], 'unique': False, 'partial': False, 'origin': 'c'}]
+        """
+        tables = [table_name] if table_name is not None else self._get_schema().tables()
+        connection = self._get_connection()
+        indexes = []
+        for table in tables:
+            for _, name, unique, origin, partial in connection.execute(f"PRAGMA index_list({table})").fetchall():
+                columns = [column[2] if column[2] is not None else '<expr>' for column in connection.execute(f"PRAGMA index_info({name})").fetchall()]
+                indexes.append({'name': name, 'table': table, 'columns': columns, 'unique': bool(unique), 'partial': bool(partial), 'origin': origin})
+        return indexes
+
+    @require_connection
+    @handle_exception
+    @require_writable
+    def analyze(self, table_name: str | None = None) -> bool:
+        """
+        Actualiza las estadísticas que usa el planificador de consultas para elegir índices.
+
+        Conviene llamarlo tras cargas masivas o cambios grandes en la distribución de los datos. Sin tabla
+        analiza toda la base de datos.
+
+        Args:
+            table_name (str | None): El nombre de la tabla o índice a analizar. Por defecto es None.
+
+        Returns:
+            bool: True si el análisis fue exitoso.
+
+        Example:
+            >>> conn.analyze('users')
+            [i] Estadísticas actualizadas exitosamente
+            True
+        """
+        self._get_cursor().execute(f"ANALYZE {table_name}" if table_name else "ANALYZE")
+        self._commit()
+        self._get_schema().invalidate()
+
+        self.instrumentation.message("[i] Estadísticas actualizadas exitosamente")
+        return True
+
+    def _prepare_import_table(self, table_name: str, column_types: dict[str, str], create: bool) -> None:
+        """
+        Comprueba que exista la tabla de destino de una importación o la crea con create_table().
+
+        Args:
+            table_name (str): El nombre de la tabla.
+            column_types (dict[str, str]): Tipo de cada columna para crear la tabla.
+            create (bool): Indica si se crea la tabla cuando no existe.
+        """
+        if self._get_schema().has_table(table_name):
+            return
+        if not create:
+            raise ValueError(f"La tabla '{table_name}' no existe; usa create=True para crearla")
+        if not self.create_table(table_name, column_types):
+            raise ValueError(f"No se pudo crear la tabla '{table_name}'")
+
+    def _import_records(self, table_name: str, records: Iterable[Sequence[any]], columns: tuple[str, ...], chunk_size: int,
+                        progress: Callable[[int, float], None] | None) -> dict[str, float]:
+        """
+        Inserta registros por bloques, cada uno en su propia transacción, e informa del progreso.
+
+        Args:
+            table_name (str): El nombre de la tabla.
+            records (Iterable[Sequence]): Valores de cada registro en el orden de ``columns``.
+            columns (tuple[str, ...]): Columnas a insertar.
+            chunk_size (int): Registros por transacción.
+            progress (Callable[[int, float], None] | None): Función que recibe los registros importados y los segundos transcurridos.
+
+        Returns:
+            dict: Registros importados, segundos y registros por segundo.
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size debe ser mayor que cero")
+        start = perf_counter()
+        count = 0
+        for chunk in self._chunks(records, chunk_size):
+            with self.transaction():
+                count += self._insert_rows(table_name, chunk, columns, chunk_size)
+            self._invalidate_results(table_name)
+            if progress is not None:
+                progress(count, perf_counter() - start)
+        elapsed = perf_counter() - start
+
+        self.instrumentation.message(f"[i] {count} registros importados en {elapsed:.2f} s")
+        return {'rows': count, 'seconds': elapsed, 'rows_per_second': count / elapsed if elapsed else 0.0}
+
+    def _export_rows(self, table_name: str, columns: Sequence[str] | None, condition: Condition | None, write: Callable[[tuple[str, ...], list[tuple]], None],
+                     batch_size: int | None, progress: Callable[[int, float], None] | None) -> dict[str, float]:
+        """
+        Recorre una tabla por lotes con un cursor dedicado y entrega cada lote a ``write``.
+
+        Args:
+            table_name (str): El nombre de la tabla.
+            columns (Sequence[str] | None): Columnas a exportar. Si es None se exportan todas.
+            condition (dict | Sequence[dict] | None): Condiciones de búsqueda, igual que en search().
+            write (Callable): Función que recibe los nombres de las columnas y cada lote de filas.
+            batch_size (int | None): Filas leídas por cada llamada a fetchmany. Si es None se usa fetch_size.
+            progress (Callable[[int, float], None] | None): Función que recibe las filas exportadas y los segundos transcurridos.
+
+        Returns:
+            dict: Filas exportadas, segundos y filas por segundo.
+        """
+        columns = tuple(columns or self._get_schema().columns(table_name))
+        if not columns:
+            raise ValueError(f"La tabla '{table_name}' no existe")
+
+        start = perf_counter()
+        count = 0
+        cursor = self._get_connection().cursor()
+        try:
+            where, params = build_where(condition)
+            cursor.execute(self._statements.get(('read_columns', table_name, columns, where)), params)
+            while batch := cursor.fetchmany(batch_size or self.fetch_size):
+                write(columns, batch)
+                count += len(batch)
+                if progress is not None:
+                    progress(count, perf_counter() - start)
+        finally:
+            cursor.close()
+        elapsed = perf_counter() - start
+
+        self.instrumentation.message(f"[i] {count} registros exportados en {elapsed:.2f} s")
+        return {'rows': count, 'seconds': elapsed, 'rows_per_second': count / elapsed if elapsed else 0.0}
+
+    @require_connection
+    @handle_exception
+    @require_writable
+    def import_csv(self, table_name: str, source: str | IO[str], columns: Sequence[str] | None = None, header: bool = True, create: bool = False,
+                   column_types: dict[str, str] | None = None, delimiter: str = ',', chunk_size: int = 10000,
+                   progress: Callable[[int, float], None] | None = None) -> dict[str, float]:
+        """
+        Importa un CSV en una tabla leyéndolo en streaming, con una transacción por bloque de registros.
+
+        Cada valor se convierte según el tipo declarado de su columna (o el indicado en ``column_types``):
+        entero, real o numérico, y las cadenas vacías de columnas no textuales se guardan como NULL.
+
+        Args:
+            table_name (str): El nombre de la tabla.
+            source (str | IO[str]): Ruta del archivo o archivo de texto ya abierto.
+            columns (Sequence[str] | None): Columnas de cada fila. Si es None se toman de la cabecera.
+            header (bool): Indica si la primera fila es la cabecera. Por defecto es True.
+            create (bool): Indica si se crea la tabla con create_table() cuando no existe. Por defecto es False.
+            column_types (dict[str, str] | None): Tipo de las columnas para crear la tabla y convertir los valores. Por defecto es TEXT.
+            delimiter (str): Separador de campos. Por defecto es ','.
+            chunk_size (int): Registros por transacción. Por defecto es 10000.
+            progress (Callable[[int, float], None] | None): Función que recibe los registros importados y los segundos transcurridos.
+
+        Returns:
+            dict: Registros importados ('rows'), segundos ('seconds') y registros por segundo ('rows_per_second').
+
+        Example:
+            >>> conn.import_csv('users', 'users.csv', create=True, column_types={'id': 'INTEGER PRIMARY KEY', 'age': 'INTEGER'})
+            [i] 1000000 registros importados en 2.41 s
+            {'rows': 1000000, 'seconds': 2.41, 'rows_per_second': 414937.7}
+        """
+        column_types = column_types or {}
+        with open_text(source, 'r') as file:
+            reader = csv.reader(file, delimiter=delimiter)
+            names = next(reader, None) if header else None
+            if columns is None:
+                if names is None:
+                    raise ValueError("Debes indicar las columnas cuando el CSV no tiene cabecera")
+                columns = names
+            columns = tuple(columns)
+
+            self._prepare_import_table(table_name, {column: column_types.get(column, 'TEXT') for column in columns}, create)
+            declared = {name.lower(): declared_type for name, declared_type in self._get_schema().table(table_name)['types'].items()}
+            converters = [coercer(column_types.get(column) or declared.get(column.lower(), '')) for column in columns]
+
+            records = ([convert(value) for convert, value in zip(converters, row)] if len(row) == len(converters) else row for row in reader if row)
+            return self._import_records(table_name, records, columns, chunk_size, progress)
+
+    @require_connection
+    @handle_exception
+    @require_writable
+    def import_jsonl(self, table_name: str, source: str | IO[str], columns: Sequence[str] | None = None, create: bool = False,
+                     column_types: dict[str, str] | None = None, chunk_size: int = 10000,
+                     progress: Callable[[int, float], None] | None = None) -> dict[str, float]:
+        """
+        Importa un archivo JSONL (un objeto JSON por línea) leyéndolo en streaming, con una transacción por bloque.
+
+        Los valores se toman por clave, las claves ausentes se guardan como NULL y los objetos o listas
+        anidados se guardan como texto JSON.
+
+        Args:
+            table_name (str): El nombre de la tabla.
+            source (str | IO[str]): Ruta del archivo o archivo de texto ya abierto.
+            columns (Sequence[str] | None): Columnas a importar. Si es None se toman las claves del primer objeto.
+            create (bool): Indica si se crea la tabla con create_table() cuando no existe. Por defecto es False.
+            column_types (dict[str, str] | None): Tipo de las columnas al crear la tabla. Por defecto se deduce del primer objeto.
+            chunk_size (int): Registros por transacción. Por defecto es 10000.
+            progress (Callable[[int, float], None] | None): Función que recibe los registros importados y los segundos transcurridos.
+
+        Returns:
+            dict: Registros importados ('rows'), segundos ('seconds') y registros por segundo ('rows_per_second').
+
+        Example:
+            >>> conn.import_jsonl('events', 'events.jsonl', create=True)
+            [i] 250000 registros importados en 1.10 s
+            {'rows': 250000, 'seconds': 1.1, 'rows_per_second': 227272.7}
+        """
+        column_types = column_types or {}
+        with open_text(source, 'r') as file:
+            objects = (json.loads(line) for line in file if line.strip())
+            first = next(objects, None)
+            if first is None:
+                return self._import_records(table_name, (), (), chunk_size, progress)
+            columns = tuple(columns or first)
+
+            self._prepare_import_table(table_name, {column: column_types.get(column) or infer_type(first.get(column)) for column in columns}, create)
+
+            def values(record: dict[str, any]) -> list[any]:
+                row = [record.get(column) for column in columns]
+                return [json.dumps(value) if isinstance(value, (dict, list)) else value for value in row]
+
+            return self._import_records(table_name, map(values, chain((first,), objects)), columns, chunk_size, progress)
+
+    @require_connection
+    @handle_exception
+    def export_csv(self, table_name: str, target: str | IO[str], columns: Sequence[str] | None = None, condition: Condition | None = None,
+                   header: bool = True, delimiter: str = ',', batch_size: int | None = None,
+                   progress: Callable[[int, float], None] | None = None) -> dict[str, float]:
+        """
+        Exporta una tabla a CSV escribiendo las filas por lotes, sin cargar la tabla en memoria.
+
+        Args:
+            table_name (str): El nombre de la tabla.
+            target (str | IO[str]): Ruta del archivo o archivo de texto ya abierto.
+            columns (Sequence[str] | None): Columnas a exportar. Si es None se exportan todas.
+            condition (dict | Sequence[dict] | None): Condiciones de búsqueda, igual que en search(). Por defecto se exporta toda la tabla.
+            header (bool): Indica si se escribe la cabecera. Por defecto es True.
+            delimiter (str): Separador de campos. Por defecto es ','.
+            batch_size (int | None): Filas leídas por cada llamada a fetchmany. Si es None se usa fetch_size.
+            progress (Callable[[int, float], None] | None): Función que recibe las filas exportadas y los segundos transcurridos.
+
+        Returns:
+            dict: Filas exportadas ('rows'), segundos ('seconds') y filas por segundo ('rows_per_second').
+
+        Example:
+            >>> conn.export_csv('users', 'users.csv')
+            [i] 1000000 registros exportados en 1.32 s
+            {'rows': 1000000, 'seconds': 1.32, 'rows_per_second': 757575.8}
+        """
+        with open_text(target, 'w') as file:
+            writer = csv.writer(file, delimiter=delimiter)
+            started = False
+
+            def write(names: tuple[str, ...], batch: list[tuple]) -> None:
+                nonlocal started
+                if header and not started:
+                    writer.writerow(names)
+                started = True
+                writer.writerows(batch)
+
+            stats = self._export_rows(table_name, columns, condition, write, batch_size, progress)
+            if header and not started:
+                writer.writerow(columns or self._get_schema().columns(table_name))
+            return stats
+
+    @require_connection
+    @handle_exception
+    def export_jsonl(self, table_name: str, target: str | IO[str], columns: Sequence[str] | None = None, condition: Condition | None = None,
+                     batch_size: int | None = None, progress: Callable[[int, float], None] | None = None) -> dict[str, float]:
+        """
+        Exporta una tabla a JSONL (un objeto JSON por línea) escribiendo las filas por lotes. Los BLOB se exportan en base64.
+
+        Args:
+            table_name (str): El nombre de la tabla.
+            target (str | IO[str]): Ruta del archivo o archivo de texto ya abierto.
+            columns (Sequence[str] | None): Columnas a exportar. Si es None se exportan todas.
+            condition (dict | Sequence[dict] | None): Condiciones de búsqueda, igual que en search(). Por defecto se exporta toda la tabla.
+            batch_size (int | None): Filas leídas por cada llamada a fetchmany. Si es None se usa fetch_size.
+            progress (Callable[[int, float], None] | None): Función que recibe las filas exportadas y los segundos transcurridos.
+
+        Returns:
+            dict: Filas exportadas ('rows'), segundos ('seconds') y filas por segundo ('rows_per_second').
+
+        Example:
+            >>> conn.export_jsonl('users', 'users.jsonl', condition={'country': 'ES'})
+            [i] 52000 registros exportados en 0.12 s
+            {'rows': 52000, 'seconds': 0.12, 'rows_per_second': 433333.3}
+        """
+        with open_text(target, 'w') as file:
+            def write(names: tuple[str, ...], batch: list[tuple]) -> None:
+                file.write(''.join(json.dumps(dict(zip(names, row)), ensure_ascii=False, default=json_default) + '\n' for row in batch))
+
+            return self._export_rows(table_name, columns, condition, write, batch_size, progress)
+
+    @require_connection
+    @handle_exception
+    def open_blob(self, table_name: str, column: str, rowid: int, readonly: bool = True) -> BlobStream:
+        """
+        Abre un valor BLOB como archivo binario para leerlo o escribirlo por trozos, sin cargarlo completo en
+        memoria. Requiere Python 3.11 o superior.
+
+        Args:
+            table_name (str): El nombre de la tabla.
+            column (str): Columna del BLOB.
+            rowid (int): rowid de la fila.
+            readonly (bool): Indica si el BLOB se abre en solo lectura. Por defecto es True.
+
+        Returns:
+            BlobStream: Flujo sobre el BLOB. Hay que cerrarlo, por ejemplo, usándolo como gestor de contexto.
+
+        Example:
+            >>> buffer = bytearray(65536)
+            >>> with conn.open_blob('files', 'content', 42) as blob:
+            ...     while count := blob.readinto(buffer):
+            ...         output.write(memoryview(buffer)[:count])
+        """
+        if not hasattr(Connection, 'blobopen'):
+            raise ValueError("open_blob requiere Python 3.11 o superior")
+        if not readonly and self.read_only:
+            raise ValueError("La base de datos está abierta en modo de solo lectura: el BLOB solo se puede abrir para lectura")
+        schema = self._get_schema()
+        if schema.has_table(table_name) and column.lower() not in {name.lower() for name in schema.columns(table_name)}:
+            raise ValueError(f"La columna '{column}' no existe en la tabla '{table_name}'")
+        blob = self._get_connection().blobopen(table_name, column, rowid, readonly=readonly)
+        if not readonly:
+            self._invalidate_results(table_name)
+        return BlobStream(blob, readonly)
+
+    @require_connection
+    @handle_exception
+    @require_writable
+    def insert_blob_stream(self, table_name: str, column: str, source: str | BinaryIO, data: dict[str, any] | None = None,
+                           size: int | None = None, chunk_size: int = 1048576) -> int:
+        """
+        Inserta una fila con un BLOB leído por trozos de un archivo, sin cargarlo completo en memoria. El espacio se
+        reserva con ``zeroblob()`` y se rellena con open_blob(); todo ocurre en una sola transacción. Requiere
+        Python 3.11 o superior.
+
+        Args:
+            table_name (str): El nombre de la tabla.
+            column (str): Columna del BLOB.
+            source (str | BinaryIO): Ruta o archivo binario abierto, que se lee desde su posición actual.
+            data (dict | None): Valores del resto de columnas de la fila.
+            size (int | None): Bytes a copiar. Si es None se usa lo que queda del archivo.
+            chunk_size (int): Bytes copiados por trozo. Por defecto es 1048576.
+
+        Returns:
+            int: rowid de la fila insertada.
+
+        Example:
+            >>> conn.insert_blob_stream('files', 'content', 'backup.tar', {'name': 'backup.tar'})
+            [i] BLOB de 52428800 bytes insertado en 'files'
+            42
+        """
+        if not hasattr(Connection, 'blobopen'):
+            raise ValueError("insert_blob_stream requiere Python 3.11 o superior")
+        if chunk_size < 1:
+            raise ValueError("chunk_size debe ser mayor que cero")
+        data = data or {}
+
+        with open_binary(source, 'rb') as file:
+            if size is None:
+                try:
+                    size = fstat(file.fileno()).st_size - file.tell()
+                except (AttributeError, OSError, io.UnsupportedOperation):
+                    position = file.tell()
+                    size = file.seek(0, io.SEEK_END) - position
+                    file.seek(position)
+            query = self._statements.get(('insert_blob', table_name, tuple(data), (column,)))
+            buffer = memoryview(bytearray(max(1, min(chunk_size, size))))
+
+            with self.transaction():
+                rowid = self._get_connection().execute(query, (*data.values(), size)).lastrowid
+                written = 0
+                with self._get_connection().blobopen(table_name, column, rowid) as blob:
+                    while written < size:
+                        count = file.readinto(buffer[:min(len(buffer), size - written)])
+                        if not count:
+                            raise ValueError(f"El origen terminó tras {written} de {size} bytes")
+                        blob.write(buffer[:count])
+                        written += count
+                self._invalidate_results(table_name)
+
+        self.instrumentation.message(f"[i] BLOB de {size} bytes insertado en '{table_name}'")
+        return rowid
+
+    @require_connection
+    @handle_exception
+    @require_writable
+    def enable_change_tracking(self, table_name: str) -> bool:
+        """
+        Registra los cambios de una tabla para sincronizarla de forma incremental. Instala disparadores que anotan
+        cada inserción, actualización y borrado en CHANGELOG_TABLE con su rowid y una versión creciente
+        (AUTOINCREMENT, así que nunca se reutiliza aunque se poden entradas). Los consumidores leen los cambios con
+        changes_since() y los ya procesados se eliminan con prune_changes().
+
+        Args:
+            table_name (str): El nombre de la tabla. Debe tener rowid.
+
+        Returns:
+            bool: True si el registro quedó activado.
+
+        Example:
+            >>> conn.enable_change_tracking('users')
+            [i] Registro de cambios activado en 'users'
+            True
+        """
+        if not self._get_schema().has_table(table_name):
+            raise ValueError(f"La tabla '{table_name}' no existe")
+        if table_name.lower() == CHANGELOG_TABLE:
+            raise ValueError("No se pueden registrar los cambios de la propia tabla de cambios")
+        connection = self._get_connection()
+        try:
+            connection.execute(f"SELECT rowid FROM {table_name} LIMIT 0")
+        except OperationalError:
+            raise ValueError(f"La tabla '{table_name}' no tiene rowid (WITHOUT ROWID)") from None
+
+        name = table_name.replace("'", "''")
+        log = f"INSERT INTO {CHANGELOG_TABLE} (table_name, operation, row_id) VALUES ('{name}', '{{0}}', {{1}}.rowid);"
+        with self.transaction():
+            connection.execute(
+                f"CREATE TABLE IF NOT EXISTS {CHANGELOG_TABLE} (version INTEGER PRIMARY KEY AUTOINCREMENT, "
+                f"table_name TEXT NOT NULL, operation TEXT NOT NULL, row_id INTEGER NOT NULL)"
+            )
+            connection.execute(f"CREATE INDEX IF NOT EXISTS {CHANGELOG_TABLE}_table ON {CHANGELOG_TABLE} (table_name, version)")
+            connection.execute(f"CREATE TRIGGER IF NOT EXISTS {CHANGE_TRIGGER_PREFIX}_{table_name}_insert AFTER INSERT ON {table_name} "
+                               f"BEGIN {log.format('insert', 'NEW')} END")
+            # Si cambia el rowid, la fila antigua se anota como borrada.
+            connection.execute(f"CREATE TRIGGER IF NOT EXISTS {CHANGE_TRIGGER_PREFIX}_{table_name}_update AFTER UPDATE ON {table_name} BEGIN "
+                               f"INSERT INTO {CHANGELOG_TABLE} (table_name, operation, row_id) SELECT '{name}', 'delete', OLD.rowid WHERE OLD.rowid IS NOT NEW.rowid; "
+                               f"{log.format('update', 'NEW')} END")
+            connection.execute(f"CREATE TRIGGER IF NOT EXISTS {CHANGE_TRIGGER_PREFIX}_{table_name}_delete AFTER DELETE ON {table_name} "
+                               f"BEGIN {log.format('delete', 'OLD')} END")
+        self._get_schema().invalidate()
+
+        self.instrumentation.message(f"[i] Registro de cambios activado en '{table_name}'")
+        return True
+
+    @require_connection
+    @handle_exception
+    @require_writable
+    def disable_change_tracking(self, table_name: str) -> bool:
+        """
+        Elimina los disparadores de enable_change_tracking(). Las entradas ya registradas se conservan.
+
+        Args:
+            table_name (str): El nombre de la tabla.
+
+        Returns:
+            bool: True si se eliminaron los disparadores.
+
+        Example:
+            >>> conn.disable_change_tracking('users')
+            [i] Registro de cambios desactivado en 'users'
+            True
+        """
+        connection = self._get_connection()
+        with self.transaction():
+            for operation in ('insert', 'update', 'delete'):
+                connection.execute(f"DROP TRIGGER IF EXISTS {CHANGE_TRIGGER_PREFIX}_{table_name}_{operation}")
+        self._get_schema().invalidate()
+
+        self.instrumentation.message(f"[i] Registro de cambios desactivado en '{table_name}'")
+        return True
+
+    @require_connection
+    @handle_exception
+    def changes_since(self, table_name: str, version: int = 0, limit: int | None = 1000) -> list[tuple[int, str, int, tuple | None]]:
+        """
+        Lee los cambios de una tabla posteriores a una versión, en orden, junto con el estado actual de cada fila.
+        La consulta recorre solo las entradas nuevas mediante el índice del registro, así que su coste depende del
+        número de cambios y no del tamaño de la tabla.
+
+        Args:
+            table_name (str): El nombre de la tabla.
+            version (int): Última versión ya procesada. Por defecto es 0 (todos los cambios registrados).
+            limit (int | None): Máximo de cambios a devolver. Si es None se devuelven todos. Por defecto es 1000.
+
+        Returns:
+            list[tuple]: (versión, operación, rowid, fila) de cada cambio, con la operación 'insert', 'update' o 'delete'.
+                La fila es el estado actual, o None si ya no existe.
+
+        Example:
+            >>> changes = conn.changes_since('users', last_version)
+            >>> changes
+            [(41, 'update', 7, (7, 'John', 'john@example.com')), (42, 'delete', 9, None)]
+            >>> last_version = changes[-1][0]
+        """
+        if limit is not None and limit < 1:
+            raise ValueError("limit debe ser mayor que cero")
+        if not self._get_schema().has_table(CHANGELOG_TABLE):
+            raise ValueError(f"El registro de cambios no está activado en '{table_name}'")
+        query = (f"SELECT c.version, c.operation, c.row_id, t.rowid IS NOT NULL, t.* FROM {CHANGELOG_TABLE} AS c "
+                 f"LEFT JOIN {table_name} AS t ON t.rowid = c.row_id AND c.operation != 'delete' "
+                 f"WHERE c.table_name = ? AND c.version > ? ORDER BY c.version LIMIT ?")
+        cursor = self._get_connection().cursor()
+        try:
+            cursor.execute(query, (table_name, version, -1 if limit is None else limit))
+            changes = []
+            while batch := cursor.fetchmany(self.fetch_size):
+                changes.extend((row[0], row[1], row[2], row[4:] if row[3] else None) for row in batch)
+        finally:
+            cursor.close()
+        return changes
+
+    @require_connection
+    @handle_exception
+    @require_writable
+    def prune_changes(self, before: int | None = None, keep: int | None = None, table_name: str | None = None) -> int:
+        """
+        Elimina entradas del registro de cambios para acotar su tamaño.
+
+        Args:
+            before (int | None): Se eliminan las entradas con versión menor o igual, p. ej. la última procesada por todos los consumidores.
+            keep (int | None): Se conservan solo las ``keep`` entradas más recientes.
+            table_name (str | None): Limita la poda a los cambios de una tabla. Por defecto se aplica a todas.
+
+        Returns:
+            int: Número de entradas eliminadas.
+
+        Example:
+            >>> conn.prune_changes(before=last_version)
+            [i] 1250 cambios eliminados del registro
+            1250
+        """
+        if before is None and keep is None:
+            raise ValueError("Debes indicar before, keep o ambos")
+        if keep is not None and keep < 0:
+            raise ValueError("keep no puede ser negativo")
+        if not self._get_schema().has_table(CHANGELOG_TABLE):
+            return 0
+        terms, params = [], []
+        if table_name is not None:
+            terms.append("table_name = ?")
+            params.append(table_name)
+        if before is not None:
+            terms.append("version <= ?")
+            params.append(before)
+        if keep is not None:
+            scope = "WHERE table_name = ? " if table_name is not None else ""
+            terms.append(f"version NOT IN (SELECT version FROM {CHANGELOG_TABLE} {scope}ORDER BY version DESC LIMIT ?)")
+            params.extend([table_name, keep] if table_name is not None else [keep])
+
+        cursor = self._get_connection().execute(f"DELETE FROM {CHANGELOG_TABLE} WHERE {' AND '.join(terms)}", params)
+        self._commit()
+
+        self.instrumentation.message(f"[i] {cursor.rowcount} cambios eliminados del registro")
+        return cursor.rowcount
+
+    def _is_memory_path(self) -> bool:
+        """
+        Indica si la ruta de la instancia es una base de datos en memoria, que otras conexiones no pueden abrir.
+
+        Returns:
+            bool: True si la ruta es ':memory:' o una URI en memoria.
+        """
+        return self.mode == 'memory' or self.path == ':memory:' or self.path.startswith('file::memory:') or 'mode=memory' in self.path
+
+    @staticmethod
+    def _memory_database() -> str:
+        """
+        Genera el nombre de una base de datos en memoria que pueden compartir todas las conexiones del proceso:
+        el VFS memdb desde SQLite 3.36, que bloquea igual que un archivo, o la caché compartida en versiones anteriores.
+
+        Returns:
+            str: URI de la base de datos.
+        """
+        if sqlite_version_info >= (3, 36, 0):
+            return f"file:/sqlite3manager-{next(_MEMORY_DATABASES)}?vfs=memdb"
+        return f"file:sqlite3manager-{next(_MEMORY_DATABASES)}?mode=memory&cache=shared"
+
+    def _switch_database(self, database: str, uri: bool, memory: Connection | None) -> None:
+        """
+        Cambia la base de datos que abren las conexiones de la instancia. Las conexiones de los demás hilos se
+        cierran y esos hilos deberán volver a llamar a connect(); el hilo actual queda conectado.
+
+        Args:
+            database (str): Ruta o URI de la base de datos.
+            uri (bool): Indica si ``database`` es una URI.
+            memory (Connection | None): Conexión que mantiene viva la base de datos en memoria, o None si es un archivo.
+        """
+        self._stop_flusher()
+        self._reset_connections()
+        previous, self._memory = self._memory, memory
+        self._database, self._uri = database, uri
+        self._flushed_version = None
+        if previous is not None:
+            previous.close()
+        if self.result_cache is not None:
+            self.result_cache.clear()
+        self._local.connection = self._open_connection()
+        self._local.cursor = self._local.connection.cursor()
+        self._local.connection_status = True
+
+    def _flush_memory(self, pages_per_step: int, only_changed: bool = False) -> bool:
+        """
+        Vuelca la base de datos en memoria sobre el archivo de la instancia por pasos de ``pages_per_step`` páginas.
+
+        Args:
+            pages_per_step (int): Páginas copiadas por paso.
+            only_changed (bool): Si es True, no se copia nada si no hubo commits desde el último volcado.
+
+        Returns:
+            bool: True si se copió la base de datos.
+        """
+        with self._flush_lock:
+            memory = self._memory
+            if memory is None:
+                return False
+            version = memory.execute("PRAGMA data_version").fetchone()[0]
+            if only_changed and version == self._flushed_version:
+                return False
+            target = connect(self._source[0], uri=self._source[1], timeout=10.0)
+            try:
+                memory.backup(target, pages=pages_per_step, sleep=0)
+            finally:
+                target.close()
+            self._flushed_version = version
+            return True
+
+    def _start_flusher(self, interval: float, pages_per_step: int) -> None:
+        """
+        Arranca el hilo que vuelca periódicamente la base de datos en memoria al archivo.
+
+        Args:
+            interval (float): Segundos entre volcados.
+            pages_per_step (int): Páginas copiadas por paso.
+        """
+        stop = self._flush_stop = Event()
+
+        def run() -> None:
+            while not stop.wait(interval):
+                try:
+                    self._flush_memory(pages_per_step, only_changed=True)
+                except Exception as e:
+                    self.instrumentation.message(f"[!] Error al volcar la base de datos en memoria: {e}")
+
+        self._flusher = Thread(target=run, name='sqlite3manager-flusher', daemon=True)
+        self._flusher.start()
+
+    def _stop_flusher(self) -> None:
+        """
+        Detiene el hilo de volcado periódico, si está en marcha.
+        """
+        if self._flusher is not None:
+            self._flush_stop.set()
+            self._flusher.join()
+            self._flusher = None
+
+    @require_connection
+    @handle_exception
+    def backup(self, target_path: str, pages_per_step: int = 1024, progress: Callable[[int, int], None] | None = None,
+               sleep: float = 0.01) -> dict[str, float]:
+        """
+        Crea una copia consistente de la base de datos mientras sigue en uso, con la API de backup de SQLite.
+        La copia avanza por pasos de ``pages_per_step`` páginas y entre paso y paso se libera el bloqueo de
+        lectura, así que los escritores solo esperan lo que tarda un paso. Si otra conexión modifica la base de
+        datos durante la copia, SQLite la reinicia para que el resultado sea una instantánea coherente.
+
+        Args:
+            target_path (str): Ruta del archivo de destino. Si existe, se sobrescribe.
+            pages_per_step (int): Páginas copiadas por paso. Si es 0 o negativo se copia todo en un paso. Por defecto es 1024.
+            progress (Callable[[int, int], None] | None): Función que recibe las páginas copiadas y el total tras cada paso.
+            sleep (float): Segundos de espera entre pasos. Por defecto es 0.01.
+
+        Returns:
+            dict: Páginas copiadas y segundos.
+
+        Example:
+            >>> conn.backup('copia.sqlite3', progress=lambda copied, total: print(f"{copied}/{total}"))
+            {'pages': 2048, 'seconds': 0.04}
+        """
+        if target_path == self.path:
+            raise ValueError("El destino de la copia no puede ser la propia base de datos")
+
+        def report(status: int, remaining: int, total: int) -> None:
+            progress(total - remaining, total)
+
+        start = perf_counter()
+        target = connect(target_path, timeout=10.0)
+        try:
+            self._get_connection().backup(target, pages=pages_per_step, progress=report if progress else None, sleep=sleep)
+            pages = target.execute("PRAGMA page_count").fetchone()[0]
+        finally:
+            target.close()
+        elapsed = perf_counter() - start
+
+        self.instrumentation.message(f"[i] Copia de seguridad de {pages} páginas creada en {elapsed:.2f} s")
+        return {'pages': pages, 'seconds': elapsed}
+
+    @require_connection
+    @handle_exception
+    def load_into_memory(self, flush_interval: float | None = None, pages_per_step: int = 1024) -> bool:
+        """
+        Copia la base de datos a memoria y hace que la instancia trabaje sobre esa copia, compartida por todos
+        sus hilos. Con ``flush_interval`` un hilo en segundo plano vuelca la copia al archivo cada cierto tiempo,
+        solo si hubo commits desde el volcado anterior; persist_from_memory() la vuelca en el momento.
+
+        Los cambios que no se hayan volcado se pierden si el proceso termina. Las conexiones de los demás hilos
+        se cierran y esos hilos deberán volver a llamar a connect().
+
+        Args:
+            flush_interval (float | None): Segundos entre volcados automáticos. Por defecto no se vuelca automáticamente.
+            pages_per_step (int): Páginas copiadas por paso en cada volcado. Por defecto es 1024.
+
+        Returns:
+            bool: True si la base de datos se cargó en memoria, False si ya lo estaba.
+
+        Example:
+            >>> conn.load_into_memory(flush_interval=30)
+            [i] Base de datos cargada en memoria (2048 páginas)
+            True
+        """
+        if self._memory is not None:
+            self.instrumentation.message("[!] La base de datos ya está cargada en memoria")
+            return False
+        if self._is_memory_path():
+            raise ValueError("La base de datos ya es una base de datos en memoria")
+        if flush_interval is not None and flush_interval <= 0:
+            raise ValueError("flush_interval debe ser mayor que cero")
+        if self._in_transaction():
+            raise ValueError("No se puede cargar la base de datos en memoria dentro de una transacción")
+
+        # VACUUM INTO escribe una copia en modo de journal clásico: una imagen en WAL no se puede abrir en memoria.
+        database = self._memory_database()
+        memory = connect(database, uri=True, check_same_thread=False)
+        loader = connect(self._database, uri=True, timeout=10.0)
+        try:
+            loader.execute("VACUUM INTO ?", (database,))
+        except Exception:
+            memory.close()
+            raise
+        finally:
+            loader.close()
+        self._switch_database(database, True, memory)
+        self._flushed_version = memory.execute("PRAGMA data_version").fetchone()[0]
+        if flush_interval is not None:
+            self._start_flusher(flush_interval, pages_per_step)
+
+        pages = memory.execute("PRAGMA page_count").fetchone()[0]
+        self.instrumentation.message(f"[i] Base de datos cargada en memoria ({pages} páginas)")
+        return True
+
+    @require_connection
+    @handle_exception
+    @require_writable
+    def persist_from_memory(self, pages_per_step: int = 1024, release: bool = False) -> bool:
+        """
+        Vuelca al archivo la base de datos cargada con load_into_memory() o deserialize().
+
+        Args:
+            pages_per_step (int): Páginas copiadas por paso. Por defecto es 1024.
+            release (bool): Si es True, después del volcado la instancia vuelve a trabajar sobre el archivo y se
+                libera la copia en memoria. Por defecto es False.
+
+        Returns:
+            bool: True si se completó el volcado.
+
+        Example:
+            >>> conn.persist_from_memory(release=True)
+            [i] Base de datos en memoria volcada a mi_db.sqlite
+            True
+        """
+        if self._memory is None:
+            raise ValueError("La base de datos no está cargada en memoria")
+        if self._is_memory_path():
+            raise ValueError("La instancia no tiene un archivo en el que volcar la base de datos")
+        if release and self._in_transaction():
+            raise ValueError("No se puede liberar la copia en memoria dentro de una transacción")
+
+        self._flush_memory(pages_per_step)
+        if release:
+            self._switch_database(*self._source, None)
+        self.instrumentation.message(f"[i] Base de datos en memoria volcada a {self.path}")
+        return True
+
+    @require_connection
+    @handle_exception
+    def serialize(self, schema: str = 'main') -> bytes:
+        """
+        Obtiene el contenido completo de la base de datos como bytes, por ejemplo, para enviar una instantánea
+        a otros procesos, que pueden cargarla con deserialize(). Requiere Python 3.11 o superior.
+
+        Args:
+            schema (str): Base de datos a serializar. Por defecto es 'main'.
+
+        Returns:
+            bytes: Contenido de la base de datos.
+
+        Example:
+            >>> data = conn.serialize()
+            >>> worker = Connect(':memory:')
+            >>> worker.connect()
+            >>> worker.deserialize(data)
+        """
+        if not hasattr(Connection, 'serialize'):
+            raise ValueError("serialize requiere Python 3.11 o superior")
+        return self._get_connection().serialize(name=schema)
+
+    @require_connection
+    @handle_exception
+    def deserialize(self, data: bytes) -> bool:
+        """
+        Sustituye la base de datos de la instancia por una copia en memoria creada a partir de bytes obtenidos con
+        serialize(). La copia la comparten todos los hilos de la instancia; el archivo no se modifica salvo que se
+        llame a persist_from_memory(). Requiere Python 3.11 o superior.
+
+        Args:
+            data (bytes): Contenido de la base de datos.
+
+        Returns:
+            bool: True si la base de datos se cargó.
+
+        Example:
+            >>> worker.deserialize(data)
+            True
+        """
+        if not hasattr(Connection, 'deserialize'):
+            raise ValueError("deserialize requiere Python 3.11 o superior")
+        if self._in_transaction():
+            raise ValueError("No se puede sustituir la base de datos dentro de una transacción")
+
+        # Las imágenes de bases de datos en WAL se marcan como de journal clásico para poder abrirlas en memoria.
+        if data[18:20] == b'\x02\x02':
+            data = data[:18] + b'\x01\x01' + data[20:]
+        staging = connect(':memory:')
+        database = self._memory_database()
+        memory = connect(database, uri=True, check_same_thread=False)
+        try:
+            staging.deserialize(data)
+            staging.backup(memory)
+        except Exception:
+            memory.close()
+            raise
+        finally:
+            staging.close()
+        self._switch_database(database, True, memory)
+
+        self.instrumentation.message(f"[i] Base de datos cargada desde {len(data)} bytes")
+        return True
+
+    @require_connection
+    @handle_exception
+    def custom_query(self, query: str, row_factory: str | None = None) -> list[tuple[int | float | str, ...]]:
+        """
+        Ejecuta una consulta personalizada en la base de datos.
+
+        Args:
+            query (str): Consulta SQL a ejecutar.
+            row_factory (str | None): Formato de las filas: 'tuple', 'row', 'dict' o 'record'. Si es None se usa el de la instancia.
+
+        Returns:
+            list[tuple]: Resultado de la consulta.
+
+        Example:
+            >>> conn.custom_query('SELECT * FROM users WHERE age > 30')
+            [(1, 'John', 35), (2, 'Jane', 40)]
+        """
+        row_factory = self._resolve_row_factory(row_factory)
+        cursor = self._get_cursor()
+        cursor.execute(query)
+        results = self._fetch_rows(cursor, row_factory, 'query')
+        if cursor.description is None and self.result_cache is not None:
+            self.result_cache.clear()
+        return results
+
+    @require_connection
+    @handle_exception
+    def iter_query(self, query: str, params: tuple | dict = (), batch_size: int | None = None, row_factory: str | None = None) -> Iterator[tuple[int | float | str, ...]]:
+        """
+        Ejecuta una consulta personalizada y recorre su resultado por lotes.
+
+        Args:
+            query (str): Consulta SQL a ejecutar.
+            params (tuple | dict): Parámetros de la consulta. Por defecto no hay parámetros.
+            batch_size (int | None): Filas leídas por cada llamada a fetchmany. Si es None se usa fetch_size.
+            row_factory (str | None): Formato de las filas: 'tuple', 'row', 'dict' o 'record'. Si es None se usa el de la instancia.
+
+        Returns:
+            Iterator[tuple]: Iterador sobre el resultado de la consulta.
+
+        Example:
+            >>> list(conn.iter_query('SELECT name FROM users WHERE age > ?', (30,)))
+            [('John',), ('Jane',)]
+        """
+        row_factory = self._resolve_row_factory(row_factory)
+        cursor = self._get_connection().cursor()
+        cursor.execute(query, params)
+        if cursor.description is None and self.result_cache is not None:
+            self.result_cache.clear()
+        return self._stream_cursor(cursor, batch_size, row_factory, 'query')
+
+    def close(self) -> None:
+        """
+        Cierra la conexión y el cursor de la base de datos.
+
+        Returns:
+            None
+
+        Example:
+            >>> conn.close()
+        """
+        if hasattr(self._local, 'cursor') and self._local.cursor:
+            self._local.cursor.close()
+        if hasattr(self._local, 'connection') and self._local.connection:
+            with self._connections_lock:
+                if self._connections.get(get_ident()) is self._local.connection:
+                    del self._connections[get_ident()]
+            self._local.connection.close()
+
+        self._local.__dict__.clear()
+
+        self.instrumentation.message("[i] Conexión cerrada exitosamente")
+
+    def close_all(self) -> None:
+        """
+        Cierra las conexiones abiertas por la instancia en todos los hilos.
+
+        Los hilos que sigan usando la instancia deberán volver a llamar a connect().
+
+        Returns:
+            None
+
+        Example:
+            >>> conn.close_all()
+            [i] Se cerraron 3 conexiones
+        """
+        closed = self._reset_connections()
+        self.instrumentation.message(f"[i] Se cerraron {closed} conexiones")
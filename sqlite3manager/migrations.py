@@ -0,0 +1,192 @@
+import re
+from typing import NamedTuple
+
+ALTER_OPERATIONS = ('add', 'drop', 'rename', 'retype')
+
+# Palabras con las que empiezan las restricciones de tabla y las de columna que siguen al tipo.
+TABLE_CONSTRAINTS = ('CONSTRAINT', 'PRIMARY', 'UNIQUE', 'CHECK', 'FOREIGN')
+_COLUMN_TYPE = re.compile(
+    r"\s*((?:(?!(?:CONSTRAINT|PRIMARY|NOT|NULL|UNIQUE|CHECK|DEFAULT|COLLATE|REFERENCES|GENERATED|AS)\b)[A-Za-z_]\w*\s*)*(?:\([^)]*\)\s*)?)",
+    re.IGNORECASE,
+)
+
+
+class TableDefinition(NamedTuple):
+    """
+    Partes de una sentencia CREATE TABLE.
+
+    Attributes:
+        columns (list[tuple[str, str]]): Nombre sin comillas y definición completa de cada columna.
+        constraints (list[str]): Restricciones de tabla (PRIMARY KEY, UNIQUE, CHECK, FOREIGN KEY).
+        options (str): Texto tras el paréntesis de cierre, como ``WITHOUT ROWID`` o ``STRICT``.
+    """
+    columns: list[tuple[str, str]]
+    constraints: list[str]
+    options: str
+
+
+def unquote(identifier: str) -> str:
+    """
+    Quita las comillas de un identificador SQL.
+
+    Args:
+        identifier (str): Identificador, entre comillas dobles, corchetes o acentos graves, o sin ellas.
+
+    Returns:
+        str: El identificador sin comillas.
+
+    Example:
+        >>> unquote('"first name"')
+        'first name'
+    """
+    if len(identifier) >= 2 and (identifier[0], identifier[-1]) in (('"', '"'), ('`', '`'), ('[', ']')):
+        return identifier[1:-1].replace(identifier[0] * 2, identifier[0]) if identifier[0] != '[' else identifier[1:-1]
+    return identifier
+
+
+def _split_top_level(text: str) -> list[str]:
+    """
+    Separa un texto por las comas que no están entre paréntesis ni entre comillas.
+
+    Args:
+        text (str): Texto a separar.
+
+    Returns:
+        list[str]: Partes sin espacios en los extremos.
+    """
+    parts: list[str] = []
+    depth = 0
+    quote = ''
+    start = 0
+    for index, char in enumerate(text):
+        if quote:
+            if char == quote:
+                quote = ''
+        elif char in '\'"`':
+            quote = char
+        elif char == '[':
+            quote = ']'
+        elif char == '(':
+            depth += 1
+        elif char == ')':
+            depth -= 1
+        elif char == ',' and depth == 0:
+            parts.append(text[start:index].strip())
+            start = index + 1
+    parts.append(text[start:].strip())
+    return [part for part in parts if part]
+
+
+def _leading_identifier(definition: str) -> tuple[str, str]:
+    """
+    Separa el primer identificador de una definición de columna.
+
+    Args:
+        definition (str): Definición de la columna.
+
+    Returns:
+        tuple[str, str]: El identificador tal cual aparece y el resto de la definición.
+    """
+    closing = {'"': '"', '`': '`', '[': ']'}.get(definition[0])
+    if closing:
+        end = definition.index(closing, 1)
+        while closing != ']' and definition[end + 1:end + 2] == closing:
+            end = definition.index(closing, end + 2)
+        return definition[:end + 1], definition[end + 1:]
+    match = re.match(r"[^\s(]+", definition)
+    name = match.group(0) if match else definition
+    return name, definition[len(name):]
+
+
+def parse_create_table(sql: str) -> TableDefinition:
+    """
+    Descompone el SQL de un CREATE TABLE, tal como lo guarda sqlite_master, en columnas y restricciones.
+
+    Args:
+        sql (str): Sentencia CREATE TABLE.
+
+    Returns:
+        TableDefinition: Columnas, restricciones de tabla y opciones de la tabla.
+
+    Example:
+        >>> parse_create_table("CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT NOT NULL, UNIQUE (name))")
+        TableDefinition(columns=[('id', 'id INTEGER PRIMARY KEY'), ('name', 'name TEXT NOT NULL')], constraints=['UNIQUE (name)'], options='')
+    """
+    start = sql.index('(')
+    depth = 0
+    quote = ''
+    end = len(sql)
+    for index in range(start, len(sql)):
+        char = sql[index]
+        if quote:
+            if char == quote:
+                quote = ''
+        elif char in '\'"`':
+            quote = char
+        elif char == '[':
+            quote = ']'
+        elif char == '(':
+            depth += 1
+        elif char == ')':
+            depth -= 1
+            if depth == 0:
+                end = index
+                break
+
+    columns: list[tuple[str, str]] = []
+    constraints: list[str] = []
+    for part in _split_top_level(sql[start + 1:end]):
+        if part.split(None, 1)[0].upper().rstrip('(') in TABLE_CONSTRAINTS:
+            constraints.append(part)
+        else:
+            columns.append((unquote(_leading_identifier(part)[0]), part))
+    return TableDefinition(columns, constraints, sql[end + 1:].strip())
+
+
+def _type_end(rest: str) -> int:
+    """
+    Calcula dónde termina el tipo al principio de una definición de columna sin su nombre.
+
+    Args:
+        rest (str): Definición de la columna sin el nombre.
+
+    Returns:
+        int: Posición del primer carácter tras el tipo.
+    """
+    match = _COLUMN_TYPE.match(rest)
+    return match.end() if match else 0
+
+
+def retype_definition(definition: str, column_type: str) -> str:
+    """
+    Cambia el tipo de una definición de columna conservando sus restricciones (NOT NULL, DEFAULT, etc.).
+
+    Args:
+        definition (str): Definición de la columna.
+        column_type (str): Nuevo tipo.
+
+    Returns:
+        str: La definición con el nuevo tipo.
+
+    Example:
+        >>> retype_definition("age TEXT NOT NULL DEFAULT 0", "INTEGER")
+        'age INTEGER NOT NULL DEFAULT 0'
+    """
+    name, rest = _leading_identifier(definition)
+    constraints = rest[_type_end(rest):].strip()
+    return ' '.join(part for part in (name, column_type, constraints) if part)
+
+
+def mentions(sql: str, column_name: str) -> bool:
+    """
+    Indica si un fragmento de SQL menciona una columna como identificador.
+
+    Args:
+        sql (str): Fragmento de SQL.
+        column_name (str): El nombre de la columna.
+
+    Returns:
+        bool: True si aparece el nombre, con o sin comillas.
+    """
+    escaped = re.escape(column_name)
+    return re.search(rf"(?<![\w$]){escaped}(?![\w$])|[\"`\[]{escaped}[\"`\]]", sql, re.IGNORECASE) is not None
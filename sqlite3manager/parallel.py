@@ -0,0 +1,68 @@
+from sqlite3 import connect, Connection
+from typing import Any as any, Callable, Iterator
+
+
+def partition_bounds(connection: Connection, table_name: str, key: str, partitions: int) -> list[tuple[any, any]]:
+    """
+    Divide una tabla en rangos contiguos de una columna clave para recorrerlos por separado.
+
+    Con claves enteras (como el rowid) los rangos se calculan a partir del mínimo y el máximo, que SQLite
+    obtiene del índice sin recorrer la tabla. Con otras claves los límites se toman de los cuantiles del
+    índice de la columna.
+
+    Args:
+        connection (Connection): Conexión a la base de datos.
+        table_name (str): El nombre de la tabla.
+        key (str): Columna clave, normalmente rowid o una columna indexada.
+        partitions (int): Número de rangos deseado.
+
+    Returns:
+        list[tuple]: Límites (inferior incluido, superior excluido) de cada rango. El superior del último es None.
+
+    Example:
+        >>> partition_bounds(connection, 'events', 'rowid', 4)
+        [(1, 251), (251, 501), (501, 751), (751, None)]
+    """
+    low, high = connection.execute(f"SELECT MIN({key}), MAX({key}) FROM {table_name}").fetchone()
+    if low is None:
+        return []
+    if isinstance(low, int) and isinstance(high, int):
+        step = max(1, -(-(high - low + 1) // partitions))
+        starts = list(range(low, high + 1, step))
+    else:
+        total = connection.execute(f"SELECT COUNT({key}) FROM {table_name}").fetchone()[0]
+        step = max(1, -(-total // partitions))
+        query = f"SELECT {key} FROM {table_name} WHERE {key} IS NOT NULL ORDER BY {key} LIMIT 1 OFFSET ?"
+        starts = [low]
+        for offset in range(step, total, step):
+            start = connection.execute(query, (offset,)).fetchone()[0]
+            if start != starts[-1]:
+                starts.append(start)
+    return list(zip(starts, starts[1:] + [None]))
+
+
+def scan_partition(uri: str, query: str, params: tuple[any, ...], map_function: Callable[[Iterator[tuple]], any], batch_size: int) -> any:
+    """
+    Recorre un rango de una tabla en un proceso del pool con una conexión de solo lectura propia y
+    aplica la función de mapeo a sus filas. Es la función que ejecuta cada proceso de parallel_scan().
+
+    Args:
+        uri (str): URI de la base de datos con ``mode=ro``.
+        query (str): Consulta del rango.
+        params (tuple): Parámetros de la consulta.
+        map_function (Callable[[Iterator[tuple]], any]): Función que recibe un iterador sobre las filas del rango.
+        batch_size (int): Filas leídas por cada llamada a fetchmany.
+
+    Returns:
+        any: Resultado parcial de la función de mapeo.
+    """
+    connection = connect(uri, uri=True, check_same_thread=False)
+    try:
+        cursor = connection.execute(query, params)
+
+        def rows() -> Iterator[tuple]:
+            while batch := cursor.fetchmany(batch_size):
+                yield from batch
+        return map_function(rows())
+    finally:
+        connection.close()
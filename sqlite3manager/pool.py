@@ -0,0 +1,311 @@
+from sqlite3 import connect, Connection, Error
+from contextlib import contextmanager
+from queue import Empty, Full, Queue
+from threading import Lock, RLock
+from typing import Any as any, Iterable, Iterator, Sequence
+
+
+class ConnectionPool:
+    """
+    Pool de conexiones seguro entre hilos con un único escritor y varios lectores en modo WAL.
+
+    Las lecturas se reparten entre un conjunto acotado de conexiones de solo lectura que se reutilizan,
+    mientras que todas las escrituras se serializan a través de una sola conexión. En modo WAL los
+    lectores no bloquean al escritor ni el escritor a los lectores, lo que evita los errores
+    "database is locked" cuando muchos hilos acceden a la vez.
+
+    Args:
+        path (str): Ruta de la base de datos SQLite. No se admite ':memory:'.
+        max_readers (int): Número máximo de conexiones de lectura. Por defecto es 4.
+        timeout (float): Segundos que una conexión espera a que se libere un bloqueo. Por defecto es 10.0.
+        wal (bool): Indica si se activa el modo WAL al abrir el escritor. Por defecto es True.
+        health_check (bool): Indica si se comprueba cada lector con 'SELECT 1' antes de entregarlo. Por defecto es True.
+    """
+    path: str
+    max_readers: int
+    timeout: float
+    wal: bool
+    health_check: bool
+
+    def __init__(self, path: str, max_readers: int = 4, timeout: float = 10.0, wal: bool = True, health_check: bool = True) -> None:
+        """
+        Inicializa el pool y abre la conexión de escritura.
+
+        Args:
+            path (str): Ruta de la base de datos SQLite.
+            max_readers (int): Número máximo de conexiones de lectura. Por defecto es 4.
+            timeout (float): Segundos que una conexión espera a que se libere un bloqueo. Por defecto es 10.0.
+            wal (bool): Indica si se activa el modo WAL al abrir el escritor. Por defecto es True.
+            health_check (bool): Indica si se comprueba cada lector antes de entregarlo. Por defecto es True.
+        """
+        if path == ':memory:':
+            raise ValueError("Un pool no puede compartir una base de datos ':memory:' entre conexiones")
+        if max_readers < 1:
+            raise ValueError("max_readers debe ser mayor que cero")
+        self.path = path
+        self.max_readers = max_readers
+        self.timeout = timeout
+        self.wal = wal
+        self.health_check = health_check
+        self._idle: Queue[Connection] = Queue(max_readers)
+        self._created = 0
+        self._lock = Lock()
+        self._writer_lock = RLock()
+        self._closed = False
+        self._writer = self._open()
+        if wal:
+            self._writer.execute("PRAGMA journal_mode=WAL")
+
+    def __enter__(self) -> 'ConnectionPool':
+        return self
+
+    def __exit__(self, *exc_info: any) -> None:
+        self.close()
+
+    def _open(self, readonly: bool = False) -> Connection:
+        """
+        Abre una conexión con la misma configuración que Connect.connect().
+
+        Args:
+            readonly (bool): Si es True la conexión rechaza cualquier escritura.
+
+        Returns:
+            Connection: Conexión a la base de datos.
+        """
+        connection = connect(self.path, check_same_thread=False, timeout=self.timeout, isolation_level=None)
+        if readonly:
+            connection.execute("PRAGMA query_only=ON")
+        return connection
+
+    @staticmethod
+    def _is_healthy(connection: Connection) -> bool:
+        """
+        Comprueba que una conexión siga siendo utilizable.
+
+        Args:
+            connection (Connection): Conexión a comprobar.
+
+        Returns:
+            bool: True si la conexión responde.
+        """
+        try:
+            connection.execute("SELECT 1").fetchone()
+            return True
+        except Error:
+            return False
+
+    def _acquire_reader(self, timeout: float | None) -> Connection:
+        """
+        Entrega un lector libre, abre uno nuevo si no se alcanzó el límite o espera a que se libere uno.
+
+        Args:
+            timeout (float | None): Segundos máximos de espera. None espera indefinidamente.
+
+        Returns:
+            Connection: Conexión de lectura.
+        """
+        if self._closed:
+            raise RuntimeError("El pool de conexiones está cerrado")
+        try:
+            connection = self._idle.get_nowait()
+        except Empty:
+            with self._lock:
+                create = self._created < self.max_readers
+                if create:
+                    self._created += 1
+            if create:
+                try:
+                    return self._open(readonly=True)
+                except Exception:
+                    with self._lock:
+                        self._created -= 1
+                    raise
+            try:
+                connection = self._idle.get(timeout=timeout)
+            except Empty:
+                raise TimeoutError("No hay conexiones de lectura disponibles en el pool") from None
+
+        if self.health_check and not self._is_healthy(connection):
+            try:
+                connection.close()
+            except Error:
+                pass
+            connection = self._open(readonly=True)
+        return connection
+
+    def _release_reader(self, connection: Connection) -> None:
+        """
+        Devuelve un lector al pool, o lo cierra si el pool ya está cerrado.
+
+        Args:
+            connection (Connection): Conexión de lectura a devolver.
+        """
+        if not self._closed:
+            try:
+                if connection.in_transaction:
+                    connection.rollback()
+                self._idle.put_nowait(connection)
+                return
+            except (Error, Full):
+                pass
+        connection.close()
+        with self._lock:
+            self._created -= 1
+
+    @contextmanager
+    def reader(self, timeout: float | None = None) -> Iterator[Connection]:
+        """
+        Presta una conexión de lectura durante el bloque.
+
+        Args:
+            timeout (float | None): Segundos máximos de espera por un lector libre. None espera indefinidamente.
+
+        Yields:
+            Connection: Conexión de solo lectura.
+
+        Example:
+            >>> with pool.reader() as connection:
+            ...     connection.execute('SELECT COUNT(*) FROM users').fetchone()
+            (2,)
+        """
+        connection = self._acquire_reader(timeout)
+        try:
+            yield connection
+        finally:
+            self._release_reader(connection)
+
+    @contextmanager
+    def writer(self, mode: str = 'IMMEDIATE') -> Iterator[Connection]:
+        """
+        Presta la conexión de escritura en exclusiva dentro de una transacción. Si el mismo hilo ya
+        tiene abierta una transacción de escritura, el bloque se une a ella.
+
+        Args:
+            mode (str): Tipo de bloqueo de la transacción: 'DEFERRED', 'IMMEDIATE' o 'EXCLUSIVE'. Por defecto es 'IMMEDIATE'.
+
+        Yields:
+            Connection: Conexión de escritura.
+
+        Example:
+            >>> with pool.writer() as connection:
+            ...     connection.execute("INSERT INTO users (name) VALUES ('John')")
+        """
+        with self._writer_lock:
+            if self._closed:
+                raise RuntimeError("El pool de conexiones está cerrado")
+            connection = self._writer
+            if connection.in_transaction:
+                yield connection
+                return
+            connection.execute(f"BEGIN {mode}")
+            try:
+                yield connection
+            except BaseException:
+                if connection.in_transaction:
+                    connection.rollback()
+                raise
+            connection.commit()
+
+    def read(self, query: str, params: Sequence[any] | dict[str, any] = ()) -> list[tuple[any, ...]]:
+        """
+        Ejecuta una consulta en un lector del pool.
+
+        Args:
+            query (str): Consulta SQL a ejecutar.
+            params (Sequence | dict): Parámetros de la consulta.
+
+        Returns:
+            list[tuple]: Resultado de la consulta.
+
+        Example:
+            >>> pool.read('SELECT name FROM users WHERE id = ?', (1,))
+            [('John',)]
+        """
+        with self.reader() as connection:
+            return connection.execute(query, params).fetchall()
+
+    def iter_read(self, query: str, params: Sequence[any] | dict[str, any] = (), batch_size: int = 1000) -> Iterator[tuple[any, ...]]:
+        """
+        Ejecuta una consulta en un lector del pool y recorre el resultado por lotes.
+        El lector permanece prestado hasta que se agota o se cierra el iterador.
+
+        Args:
+            query (str): Consulta SQL a ejecutar.
+            params (Sequence | dict): Parámetros de la consulta.
+            batch_size (int): Filas leídas por cada llamada a fetchmany. Por defecto es 1000.
+
+        Yields:
+            tuple: Cada fila del resultado.
+        """
+        with self.reader() as connection:
+            cursor = connection.execute(query, params)
+            try:
+                while rows := cursor.fetchmany(batch_size):
+                    yield from rows
+            finally:
+                cursor.close()
+
+    def execute(self, query: str, params: Sequence[any] | dict[str, any] = ()) -> int:
+        """
+        Ejecuta una sentencia de escritura a través del escritor del pool.
+
+        Args:
+            query (str): Sentencia SQL a ejecutar.
+            params (Sequence | dict): Parámetros de la sentencia.
+
+        Returns:
+            int: Número de filas afectadas.
+
+        Example:
+            >>> pool.execute('UPDATE users SET age = ? WHERE id = ?', (31, 1))
+            1
+        """
+        with self.writer() as connection:
+            return connection.execute(query, params).rowcount
+
+    def executemany(self, query: str, params_list: Iterable[Sequence[any]]) -> int:
+        """
+        Ejecuta una sentencia de escritura varias veces en una sola transacción.
+
+        Args:
+            query (str): Sentencia SQL a ejecutar.
+            params_list (Iterable): Parámetros de cada ejecución.
+
+        Returns:
+            int: Número de filas afectadas.
+        """
+        with self.writer() as connection:
+            return connection.executemany(query, params_list).rowcount
+
+    def stats(self) -> dict[str, int]:
+        """
+        Informa del uso actual del pool.
+
+        Returns:
+            dict[str, int]: Lectores abiertos, lectores libres y tamaño máximo.
+
+        Example:
+            >>> pool.stats()
+            {'readers': 2, 'idle_readers': 2, 'max_readers': 4}
+        """
+        with self._lock:
+            return {'readers': self._created, 'idle_readers': self._idle.qsize(), 'max_readers': self.max_readers}
+
+    def close(self) -> None:
+        """
+        Cierra el escritor y los lectores libres. Los lectores prestados se cierran al devolverse.
+
+        Returns:
+            None
+        """
+        self._closed = True
+        while True:
+            try:
+                connection = self._idle.get_nowait()
+            except Empty:
+                break
+            connection.close()
+            with self._lock:
+                self._created -= 1
+        with self._writer_lock:
+            self._writer.close()
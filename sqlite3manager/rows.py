@@ -0,0 +1,58 @@
+import re
+from sqlite3 import Cursor, Row
+from collections import namedtuple
+from functools import lru_cache, partial
+from keyword import iskeyword
+from typing import Any as any, Callable
+
+# Formatos de fila admitidos: tuplas (por defecto), sqlite3.Row, diccionarios y registros con atributos.
+ROW_FACTORIES = ('tuple', 'row', 'dict', 'record')
+
+
+@lru_cache(maxsize=256)
+def record_class(table_name: str, names: tuple[str, ...]) -> type[tuple]:
+    """
+    Obtiene la clase de registro para una tabla y una lista de columnas, generándola la primera vez.
+
+    Las clases son subclases de tuple con ``__slots__`` vacío, como las de namedtuple: ocupan lo mismo que una
+    tupla, se construyen casi igual de rápido y permiten acceder a cada columna como atributo. Los nombres que
+    no son identificadores válidos se sustituyen por ``_0``, ``_1``, etc.
+
+    Args:
+        table_name (str): El nombre de la tabla, usado para nombrar la clase.
+        names (tuple[str, ...]): Columnas del resultado.
+
+    Returns:
+        type[tuple]: Clase de registro.
+
+    Example:
+        >>> User = record_class('users', ('id', 'name'))
+        >>> User._make((1, 'John')).name
+        'John'
+    """
+    typename = re.sub(r'\W', '_', table_name.title().replace('_', '')) + 'Record'
+    if not typename.isidentifier() or iskeyword(typename):
+        typename = 'Record'
+    return namedtuple(typename, names, rename=True)
+
+
+def row_maker(factory: str, cursor: Cursor, table_name: str) -> Callable[[tuple[any, ...]], any] | None:
+    """
+    Devuelve la función que convierte cada tupla del resultado de un cursor ya ejecutado al formato pedido.
+
+    Args:
+        factory (str): Formato de ROW_FACTORIES.
+        cursor (Cursor): Cursor con la consulta ya ejecutada, del que se toman los nombres de las columnas.
+        table_name (str): Tabla consultada, para elegir la clase de registro.
+
+    Returns:
+        Callable | None: Función de conversión, o None si las filas se devuelven como tuplas.
+    """
+    if factory == 'tuple' or cursor.description is None:
+        return None
+    if factory == 'row':
+        return partial(Row, cursor)
+    names = tuple(column[0] for column in cursor.description)
+    if factory == 'dict':
+        return lambda row: dict(zip(names, row))
+    return partial(tuple.__new__, record_class(table_name, names))
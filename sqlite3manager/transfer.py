@@ -0,0 +1,92 @@
+from base64 import b64encode
+from contextlib import contextmanager
+from typing import Any as any, Callable, IO, Iterator
+
+
+@contextmanager
+def open_text(source: str | IO[str], mode: str) -> Iterator[IO[str]]:
+    """
+    Abre una ruta como archivo de texto UTF-8 o usa tal cual un archivo ya abierto, que no se cierra.
+
+    Args:
+        source (str | IO[str]): Ruta o archivo de texto.
+        mode (str): 'r' o 'w'.
+
+    Yields:
+        IO[str]: Archivo de texto.
+    """
+    if isinstance(source, str):
+        with open(source, mode, encoding='utf-8', newline='') as file:
+            yield file
+    else:
+        yield source
+
+
+def coercer(declared_type: str) -> Callable[[str], any]:
+    """
+    Devuelve la función que convierte un valor de texto de CSV al tipo de una columna, según la afinidad
+    de su tipo declarado. Las cadenas vacías se convierten en NULL salvo en columnas de texto.
+
+    Args:
+        declared_type (str): Tipo declarado de la columna.
+
+    Returns:
+        Callable[[str], any]: Función de conversión.
+
+    Example:
+        >>> coercer('INTEGER')('42')
+        42
+    """
+    declared = declared_type.upper()
+    if 'CHAR' in declared or 'CLOB' in declared or 'TEXT' in declared:
+        return str
+    if 'INT' in declared:
+        return lambda value: int(value) if value != '' else None
+    if 'BLOB' in declared or not declared:
+        return lambda value: value if value != '' else None
+    if 'REAL' in declared or 'FLOA' in declared or 'DOUB' in declared:
+        return lambda value: float(value) if value != '' else None
+
+    def numeric(value: str) -> int | float | str | None:
+        if value == '':
+            return None
+        try:
+            return int(value)
+        except ValueError:
+            try:
+                return float(value)
+            except ValueError:
+                return value
+    return numeric
+
+
+def infer_type(value: any) -> str:
+    """
+    Deduce el tipo SQLite de una columna a partir de un valor de JSON.
+
+    Args:
+        value (any): Valor de ejemplo.
+
+    Returns:
+        str: 'INTEGER', 'REAL' o 'TEXT'.
+    """
+    if isinstance(value, (bool, int)):
+        return 'INTEGER'
+    if isinstance(value, float):
+        return 'REAL'
+    return 'TEXT'
+
+
+def json_default(value: any) -> any:
+    """
+    Serializa los valores que json no admite: los BLOB se exportan en base64.
+
+    Args:
+        value (any): Valor a serializar.
+
+    Returns:
+        str: Representación del valor.
+    """
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return b64encode(bytes(value)).decode('ascii')
+    raise TypeError(f"No se puede exportar un valor de tipo {type(value).__name__}")
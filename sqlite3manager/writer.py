@@ -0,0 +1,258 @@
+from concurrent.futures import Future, InvalidStateError, TimeoutError as FutureTimeoutError
+from queue import Empty, Queue
+from threading import Lock, Thread
+from time import monotonic
+from typing import TYPE_CHECKING, Any as any, Iterable, Sequence
+
+if TYPE_CHECKING:
+    from .manager import Condition, Connect
+
+# Métodos de Connect que se pueden encolar.
+WRITE_METHODS = ('insert', 'bulk_insert', 'update', 'delete', 'upsert', 'bulk_update', 'bulk_delete', 'bulk_upsert')
+
+
+class WriteBehindQueue:
+    """
+    Cola de escritura diferida para Connect con confirmación en grupo.
+
+    Las escrituras que llegan desde cualquier hilo se encolan y un hilo escritor propio las aplica en
+    transacciones compartidas: cada transacción agrupa como máximo ``max_batch`` escrituras y se confirma
+    como mucho ``max_delay`` segundos después de que llegue la primera. Cada escritura se ejecuta en su propio
+    SAVEPOINT, de modo que el fallo de una no afecta a las demás. Así solo un hilo toma el bloqueo de
+    escritura y el coste del commit se reparte entre todas las escrituras del lote.
+
+    Cada método devuelve un Future que se resuelve cuando la transacción de su lote se confirma, y flush()
+    espera a que se confirme todo lo encolado antes de la llamada. Las escrituras que sigan en la cola al
+    terminar el proceso sin llamar a flush() o close() se pierden.
+
+    Args:
+        connect (Connect): Instancia cuya configuración (ruta, PRAGMAs, cachés, instrumentación) usa el hilo escritor.
+        max_batch (int): Escrituras como máximo por transacción. Por defecto es 500.
+        max_delay (float): Segundos como máximo que una escritura espera a que se complete su lote. Por defecto es 0.005.
+        max_pending (int): Escrituras que pueden estar en cola a la vez; al alcanzarlo, los hilos esperan. Por defecto es 10000.
+    """
+    max_batch: int
+    max_delay: float
+
+    def __init__(self, connect: 'Connect', max_batch: int = 500, max_delay: float = 0.005, max_pending: int = 10000) -> None:
+        """
+        Inicializa la cola y arranca el hilo escritor.
+
+        Args:
+            connect (Connect): Instancia cuya configuración usa el hilo escritor.
+            max_batch (int): Escrituras como máximo por transacción. Por defecto es 500.
+            max_delay (float): Segundos como máximo que una escritura espera a que se complete su lote. Por defecto es 0.005.
+            max_pending (int): Escrituras que pueden estar en cola a la vez. Por defecto es 10000.
+        """
+        if max_batch < 1 or max_pending < 1:
+            raise ValueError("max_batch y max_pending deben ser mayores que cero")
+        if max_delay < 0:
+            raise ValueError("max_delay no puede ser negativo")
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self._connect = connect
+        self._queue: Queue[tuple[Future, str | None, tuple, dict] | None] = Queue(max_pending)
+        self._lock = Lock()
+        self._closing = Lock()
+        self._closed = False
+        self._stats = {'writes': 0, 'batches': 0, 'failed_batches': 0}
+        self._thread = Thread(target=self._run, name='sqlite3manager-writer', daemon=True)
+        self._thread.start()
+
+    def __enter__(self) -> 'WriteBehindQueue':
+        return self
+
+    def __exit__(self, *exc_info: any) -> None:
+        self.close()
+
+    def _run(self) -> None:
+        """
+        Bucle del hilo escritor: reúne lotes de la cola y los aplica hasta recibir la señal de cierre.
+        """
+        running = True
+        while running:
+            item = self._queue.get()
+            batch: list[tuple[Future, str, tuple, dict]] = []
+            barriers: list[Future] = []
+            deadline = monotonic() + self.max_delay
+            while True:
+                if item is None:
+                    running = False
+                    break
+                future, name, args, kwargs = item
+                if name is None:
+                    barriers.append(future)
+                    break
+                # Las escrituras cuyo future se canceló mientras estaban en cola no se aplican.
+                if future.set_running_or_notify_cancel():
+                    batch.append(item)
+                if len(batch) >= self.max_batch:
+                    break
+                try:
+                    item = self._queue.get(timeout=max(0.0, deadline - monotonic()))
+                except Empty:
+                    break
+            if batch:
+                self._apply(batch)
+            for barrier in barriers:
+                self._resolve(barrier, True, None)
+        self._connect.close()
+
+    def _resolve(self, future: Future, success: bool, value: any) -> None:
+        """
+        Resuelve un future sin dejar que un future ya resuelto detenga el hilo escritor.
+
+        Args:
+            future (Future): Future a resolver.
+            success (bool): True para fijar el resultado, False para fijar la excepción.
+            value (any): Resultado o excepción.
+        """
+        try:
+            if success:
+                future.set_result(value)
+            else:
+                future.set_exception(value)
+        except InvalidStateError as e:
+            self._connect.instrumentation.message(f"[!] No se pudo resolver una escritura: {e}")
+
+    def _apply(self, batch: list[tuple[Future, str, tuple, dict]]) -> None:
+        """
+        Aplica un lote de escrituras en una sola transacción y resuelve sus futures al confirmarla.
+
+        Args:
+            batch (list): Escrituras a aplicar como (future, método, args, kwargs).
+        """
+        results: list[tuple[bool, any]] = []
+        try:
+            self._connect._get_connection()
+            with self._connect.transaction('IMMEDIATE'):
+                for future, name, args, kwargs in batch:
+                    try:
+                        with self._connect.transaction():
+                            results.append((True, getattr(self._connect, name)(*args, **kwargs)))
+                    except Exception as e:
+                        results.append((False, e))
+        except Exception as e:
+            with self._lock:
+                self._stats['failed_batches'] += 1
+            self._connect.instrumentation.message(f"[!] Error al confirmar un lote de {len(batch)} escrituras: {e}")
+            for future, *_ in batch:
+                self._resolve(future, False, e)
+            return
+
+        with self._lock:
+            self._stats['writes'] += len(batch)
+            self._stats['batches'] += 1
+        for (future, *_), (success, value) in zip(batch, results):
+            self._resolve(future, success, value)
+
+    def _put(self, name: str | None, args: tuple, kwargs: dict) -> Future:
+        """
+        Encola una escritura o una barrera de flush().
+
+        Args:
+            name (str | None): Método de WRITE_METHODS, o None para una barrera.
+
+        Returns:
+            Future: Future que se resuelve al confirmarse la escritura.
+        """
+        future: Future = Future()
+        with self._closing:
+            if self._closed:
+                raise RuntimeError("La cola de escritura está cerrada")
+            self._queue.put((future, name, args, kwargs))
+        return future
+
+    def submit(self, method: str, *args: any, **kwargs: any) -> Future:
+        """
+        Encola una llamada a un método de escritura de Connect.
+
+        Args:
+            method (str): Método de WRITE_METHODS.
+            *args: Argumentos del método.
+            **kwargs: Argumentos con nombre del método.
+
+        Returns:
+            Future: Future con el resultado del método una vez confirmado el lote.
+
+        Example:
+            >>> future = writes.submit('bulk_update', 'users', [{'id': 1, 'age': 31}])
+            >>> future.result()
+            1
+        """
+        if method not in WRITE_METHODS:
+            raise ValueError(f"Método de escritura no válido: '{method}'. Usa uno de {', '.join(WRITE_METHODS)}")
+        return self._put(method, args, kwargs)
+
+    def insert(self, table_name: str, data: dict[str, any]) -> Future:
+        """
+        Encola un Connect.insert().
+
+        Example:
+            >>> writes.insert('users', {'name': 'John'}).result()
+            True
+        """
+        return self._put('insert', (table_name, data), {})
+
+    def bulk_insert(self, table_name: str, data_list: Iterable[dict[str, any] | Sequence[any]], columns: Sequence[str] | None = None, chunk_size: int = 500) -> Future:
+        """Encola un Connect.bulk_insert()."""
+        return self._put('bulk_insert', (table_name, data_list, columns, chunk_size), {})
+
+    def update(self, table_name: str, data: dict[str, any], condition: 'Condition') -> Future:
+        """Encola un Connect.update()."""
+        return self._put('update', (table_name, data, condition), {})
+
+    def delete(self, table_name: str, condition: 'Condition') -> Future:
+        """Encola un Connect.delete()."""
+        return self._put('delete', (table_name, condition), {})
+
+    def upsert(self, table_name: str, data: dict[str, any], conflict: str | Sequence[str] | None = None, update: Sequence[str] | None = None) -> Future:
+        """Encola un Connect.upsert()."""
+        return self._put('upsert', (table_name, data, conflict, update), {})
+
+    def flush(self, timeout: float | None = None) -> None:
+        """
+        Espera a que se confirmen todas las escrituras encoladas antes de la llamada.
+
+        Args:
+            timeout (float | None): Segundos máximos de espera. None espera indefinidamente.
+
+        Example:
+            >>> writes.insert('users', {'name': 'John'})
+            >>> writes.flush()
+        """
+        try:
+            self._put(None, (), {}).result(timeout)
+        except FutureTimeoutError:
+            raise TimeoutError("Las escrituras pendientes no se confirmaron a tiempo") from None
+
+    def stats(self) -> dict[str, int]:
+        """
+        Obtiene las estadísticas de la cola.
+
+        Returns:
+            dict[str, int]: Escrituras confirmadas, lotes confirmados, lotes fallidos y escrituras en cola.
+
+        Example:
+            >>> writes.stats()
+            {'writes': 1200, 'batches': 14, 'failed_batches': 0, 'pending': 3}
+        """
+        with self._lock:
+            return {**self._stats, 'pending': self._queue.qsize()}
+
+    def close(self, timeout: float | None = None) -> None:
+        """
+        Confirma las escrituras pendientes, detiene el hilo escritor y rechaza las nuevas escrituras.
+
+        Args:
+            timeout (float | None): Segundos máximos de espera. None espera indefinidamente.
+
+        Example:
+            >>> writes.close()
+        """
+        with self._closing:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(None)
+        self._thread.join(timeout)
@@ -0,0 +1,82 @@
+import asyncio
+import io
+import os
+from sqlite3 import IntegrityError
+import pytest
+from sqlite3manager import AsyncConnect
+
+TEST_DB_PATH = "test_async.sqlite3"
+
+
+@pytest.fixture
+def db():
+    yield AsyncConnect(TEST_DB_PATH, raise_exceptions=True)
+
+    if os.path.exists(TEST_DB_PATH):
+        os.remove(TEST_DB_PATH)
+
+
+def test_async_crud(db):
+    async def scenario():
+        async with db:
+            assert await db.get_status() is True
+            await db.create_table("users", {"id": "INTEGER PRIMARY KEY", "name": "TEXT", "age": "INTEGER"})
+            await db.insert("users", {"id": 1, "name": "John", "age": 30})
+            await db.update("users", {"age": 31}, {"id": 1})
+            assert await db.search("users", {"id": 1}) == [(1, "John", 31)]
+            await db.delete("users", {"id": 1})
+            return await db.read_table("users")
+
+    assert asyncio.run(scenario()) == []
+
+
+def test_concurrent_writes_are_coalesced(db):
+    async def scenario():
+        async with db:
+            await db.create_table("users", {"id": "INTEGER PRIMARY KEY", "name": "TEXT"})
+            results = await asyncio.gather(
+                *[db.insert("users", {"id": i, "name": f"user{i}"}) for i in range(1, 201)],
+                db.insert("users", {"id": 1, "name": "Duplicate"}),
+                return_exceptions=True,
+            )
+            rows = await db.custom_query("SELECT COUNT(*) FROM users")
+            return results, rows
+
+    results, rows = asyncio.run(scenario())
+    assert results[:200] == [True] * 200
+    assert isinstance(results[200], IntegrityError)
+    assert rows == [(200,)]
+
+
+def test_async_iterators(db):
+    async def scenario():
+        async with db:
+            await db.create_table("users", {"id": "INTEGER PRIMARY KEY", "name": "TEXT"})
+            await db.bulk_insert("users", [{"id": i, "name": f"user{i}"} for i in range(1, 51)])
+            ids = [row[0] async for row in db.iter_table("users", batch_size=7)]
+            names = [row[0] async for row in db.iter_query("SELECT name FROM users WHERE id <= ?", (2,))]
+            values, _ = await db.read_columns("users", ["id"], {"id": ("<=", 3)})
+            pages = [[row[0] for row in page] async for page in db.iter_pages("users", "id", page_size=20, condition={"id": (">", 5)})]
+            after = await db.search("users", order_by="id", limit=2, after=(48,))
+            return ids, names, values, pages, after
+
+    ids, names, values, pages, after = asyncio.run(scenario())
+    assert ids == list(range(1, 51))
+    assert names == ["user1", "user2"]
+    assert list(values["id"]) == [1, 2, 3]
+    assert [len(page) for page in pages] == [20, 20, 5] and pages[0][0] == 6
+    assert after == [(49, "user49"), (50, "user50")]
+
+
+def test_async_import_export(db):
+    async def scenario():
+        async with db:
+            imported = await db.import_jsonl("events", io.StringIO('{"id": 1, "name": "John"}\n{"id": 2, "name": "Jane"}\n'), create=True)
+            await db.insert("events", {"id": 3, "name": "Jack"})
+            target = io.StringIO()
+            exported = await db.export_csv("events", target, condition={"id": (">", 1)})
+            return imported, exported, target.getvalue()
+
+    imported, exported, text = asyncio.run(scenario())
+    assert imported["rows"] == 2 and exported["rows"] == 2
+    assert text.splitlines() == ["id,name", "2,Jane", "3,Jack"]
@@ -1,7 +1,11 @@
+import io
+import json
 import os
+import sqlite3
 from sqlite3 import IntegrityError, OperationalError
+from threading import Thread
 import pytest
-from sqlite3manager import Connect
+from sqlite3manager import Connect, IndexAdvisor
 
 TEST_DB_PATH = "test_database.sqlite3"
 
@@ -190,3 +194,823 @@ def test_custom_query(db):
 
     result = db.custom_query("SELECT name, age FROM users WHERE id = 1")
     assert result == [("John", 30)]
+
+
+def test_iter_table_and_search(db):
+    columns = {
+        "id": "INTEGER PRIMARY KEY",
+        "name": "TEXT",
+        "age": "INTEGER"
+    }
+    db.create_table("users", columns)
+    db.bulk_insert("users", [{"id": i, "name": f"user{i}", "age": i % 3} for i in range(1, 11)])
+
+    rows = db.iter_table("users", batch_size=3)
+    assert next(rows) == (1, "user1", 1)
+    assert len(list(rows)) == 9
+
+    outer = db.iter_search("users", {"age": 0}, batch_size=2)
+    pairs = [(row[0], inner[0]) for row in outer for inner in db.iter_search("users", {"age": 0})]
+    assert len(pairs) == 9
+
+
+def test_iter_query(db):
+    columns = {
+        "id": "INTEGER PRIMARY KEY",
+        "name": "TEXT"
+    }
+    db.create_table("users", columns)
+    db.insert("users", {"id": 1, "name": "John"})
+
+    result = list(db.iter_query("SELECT name FROM users WHERE id = ?", (1,)))
+    assert result == [("John",)]
+
+
+def test_transaction_commits_once(db):
+    db.create_table("users", {"id": "INTEGER PRIMARY KEY", "name": "TEXT"})
+
+    with db.transaction("IMMEDIATE"):
+        for i in range(1, 101):
+            db.insert("users", {"id": i, "name": f"user{i}"})
+        assert db._get_connection().in_transaction is True
+
+    assert db._get_connection().in_transaction is False
+    assert len(db.read_table("users")) == 100
+
+
+def test_transaction_rollback_and_savepoints(db):
+    db.create_table("users", {"id": "INTEGER PRIMARY KEY", "name": "TEXT"})
+
+    with pytest.raises(RuntimeError):
+        with db.transaction():
+            db.insert("users", {"id": 1, "name": "John"})
+            raise RuntimeError("boom")
+    assert db.read_table("users") == []
+
+    with db.transaction():
+        db.insert("users", {"id": 1, "name": "John"})
+        with pytest.raises(IntegrityError):
+            with db.transaction():
+                db.insert("users", {"id": 2, "name": "Jane"})
+                db.insert("users", {"id": 1, "name": "Duplicate"})
+        db.insert("users", {"id": 3, "name": "Alice"})
+
+    assert db.read_table("users") == [(1, "John"), (3, "Alice")]
+
+    with pytest.raises(ValueError):
+        with db.transaction("LAZY"):
+            pass
+
+
+def test_transaction_rolls_back_swallowed_errors(db):
+    db.create_table("users", {"id": "INTEGER PRIMARY KEY", "name": "TEXT"})
+    db.raise_exceptions = False
+
+    with db.transaction():
+        db.insert("users", {"id": 1, "name": "John"})
+        assert db.insert("users", {"id": 1, "name": "Duplicate"}) is None
+    assert db.read_table("users") == []
+
+    with db.transaction():
+        db.insert("users", {"id": 1, "name": "John"})
+        with db.transaction():
+            db.insert("users", {"id": 2, "name": "Jane"})
+            db.insert("users", {"id": 1, "name": "Duplicate"})
+        db.insert("users", {"id": 3, "name": "Alice"})
+    assert db.read_table("users") == [(1, "John"), (3, "Alice")]
+
+
+def test_bulk_insert_generator_and_tuples(db):
+    columns = {
+        "id": "INTEGER PRIMARY KEY",
+        "name": "TEXT",
+        "age": "INTEGER"
+    }
+    db.create_table("users", columns)
+
+    rows = ((i, f"user{i}", i % 90) for i in range(1, 2501))
+    result = db.bulk_insert("users", rows, columns=("id", "name", "age"), chunk_size=300)
+    assert result is True
+    assert db.custom_query("SELECT COUNT(*), SUM(id) FROM users") == [(2500, 2500 * 2501 // 2)]
+
+
+def test_bulk_insert_maps_dicts_by_key(db):
+    columns = {
+        "id": "INTEGER PRIMARY KEY",
+        "name": "TEXT",
+        "age": "INTEGER"
+    }
+    db.create_table("users", columns)
+
+    db.bulk_insert("users", [
+        {"id": 1, "name": "John", "age": 30},
+        {"age": 25, "name": "Jane", "id": 2},
+    ])
+    assert db.read_table("users") == [(1, "John", 30), (2, "Jane", 25)]
+
+    with pytest.raises(ValueError):
+        db.bulk_insert("users", [{"id": 3, "name": "Alice", "age": 28}, {"id": 4, "name": "Bob"}])
+    assert len(db.read_table("users")) == 2
+
+
+def test_thread_connections_are_counted_and_closed(db):
+    from threading import Thread
+
+    db.create_table("users", {"id": "INTEGER PRIMARY KEY", "name": "TEXT"})
+    results = []
+
+    def worker():
+        connection = db._get_connection()
+        results.append(connection.execute("SELECT COUNT(*) FROM users").fetchone())
+
+    thread = Thread(target=worker)
+    thread.start()
+    thread.join()
+
+    assert results == [(0,)]
+    assert db.connection_count() == 1
+
+    db.close_all()
+    assert db.get_status() is False
+    assert db.connection_count() == 0
+    db.connect()
+
+
+def test_statement_cache_reuses_generated_sql(db):
+    db.create_table("users", {"id": "INTEGER PRIMARY KEY", "name": "TEXT", "age": "INTEGER"})
+    before = db.statement_cache_info()
+
+    for i in range(1, 51):
+        db.insert("users", {"id": i, "name": f"user{i}", "age": 20})
+        db.update("users", {"age": 21}, {"id": i})
+    db.search("users", {"name": "user1"})
+
+    info = db.statement_cache_info()
+    assert info["misses"] - before["misses"] == 3
+    assert info["hits"] - before["hits"] == 98
+    assert db.search("users", {"name": "user1"}) == [(1, "user1", 21)]
+
+
+def test_schema_cache_tracks_ddl(db):
+    db.create_table("users", {"id": "INTEGER PRIMARY KEY", "name": "TEXT"})
+    assert db.get_column_names("users") == ["id", "name"]
+
+    db.add_column("users", "age", "INTEGER")
+    assert db.get_column_names("users") == ["id", "name", "age"]
+
+    db.custom_query("CREATE TABLE products (sku TEXT PRIMARY KEY, price REAL)")
+    assert db.list_table_names() == ["users", "products"]
+    info = db.get_table_info("products")
+    assert info["primary_key"] == ["sku"]
+    assert info["types"] == {"sku": "TEXT", "price": "REAL"}
+    assert len(info["indexes"]) == 1
+
+
+def test_unknown_column_is_rejected_before_execution(db):
+    db.create_table("users", {"id": "INTEGER PRIMARY KEY", "name": "TEXT"})
+
+    with pytest.raises(ValueError) as excinfo:
+        db.insert("users", {"id": 1, "nmae": "John"})
+    assert "nmae" in str(excinfo.value)
+    assert db.search("users", {"ROWID": 1}) == []
+
+
+def test_result_cache_invalidation():
+    from sqlite3manager import ResultCache
+
+    cache = ResultCache(max_entries=2)
+    conn = Connect(TEST_DB_PATH, raise_exceptions=True, result_cache=cache)
+    other = Connect(TEST_DB_PATH, raise_exceptions=True)
+    conn.connect()
+    other.connect()
+    try:
+        conn.create_table("users", {"id": "INTEGER PRIMARY KEY", "name": "TEXT"})
+        conn.insert("users", {"id": 1, "name": "John"})
+
+        assert conn.search("users", {"id": 1}) == [(1, "John")]
+        assert conn.search("users", {"id": 1}) == [(1, "John")]
+        assert cache.info()["hits"] == 1
+
+        conn.update("users", {"name": "Johnny"}, {"id": 1})
+        assert conn.search("users", {"id": 1}) == [(1, "Johnny")]
+
+        other.update("users", {"name": "Jack"}, {"id": 1})
+        assert conn.search("users", {"id": 1}) == [(1, "Jack")]
+
+        conn.read_table("users")
+        conn.search("users", {"name": "Jack"})
+        assert cache.info()["entries"] == 2
+        assert cache.info()["evictions"] >= 1
+    finally:
+        other.close()
+        conn.close()
+        os.remove(TEST_DB_PATH)
+
+
+def test_result_cache_skips_uncommitted_reads():
+    from sqlite3manager import ResultCache
+
+    conn = Connect(TEST_DB_PATH, raise_exceptions=True, result_cache=ResultCache())
+    conn.connect()
+    seen = []
+
+    def read():
+        conn.connect()
+        seen.append(conn.search("users", {"id": 2}))
+
+    try:
+        conn.create_table("users", {"id": "INTEGER PRIMARY KEY", "name": "TEXT"})
+        with pytest.raises(RuntimeError):
+            with conn.transaction():
+                conn.insert("users", {"id": 2, "name": "dirty"})
+                assert conn.search("users", {"id": 2}) == [(2, "dirty")]
+                reader = Thread(target=read)
+                reader.start()
+                reader.join()
+                raise RuntimeError("rollback")
+        assert seen == [[]]
+        assert conn.search("users", {"id": 2}) == []
+    finally:
+        conn.close_all()
+        os.remove(TEST_DB_PATH)
+
+
+def test_pragma_profiles_apply_to_every_connection():
+    from threading import Thread
+
+    conn = Connect(TEST_DB_PATH, raise_exceptions=True, profile="throughput", pragmas={"cache_size": -1000})
+    conn.connect()
+    try:
+        connection = conn._get_connection()
+        assert connection.execute("PRAGMA journal_mode").fetchone() == ("wal",)
+        assert connection.execute("PRAGMA synchronous").fetchone() == (1,)
+        assert connection.execute("PRAGMA cache_size").fetchone() == (-1000,)
+
+        results = []
+        thread = Thread(target=lambda: results.append(conn._get_connection().execute("PRAGMA synchronous").fetchone()))
+        thread.start()
+        thread.join()
+        assert results == [(1,)]
+
+        with conn.temporary_pragmas("bulk_load"):
+            assert connection.execute("PRAGMA synchronous").fetchone() == (0,)
+            assert connection.execute("PRAGMA wal_autocheckpoint").fetchone() == (0,)
+        assert connection.execute("PRAGMA synchronous").fetchone() == (1,)
+        assert connection.execute("PRAGMA wal_autocheckpoint").fetchone() == (1000,)
+
+        with pytest.raises(ValueError):
+            Connect(TEST_DB_PATH, pragmas={"journal_mode": "WAL; DROP TABLE users"})
+    finally:
+        conn.close_all()
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(TEST_DB_PATH + suffix):
+                os.remove(TEST_DB_PATH + suffix)
+
+
+def test_silent_mode(capsys):
+    conn = Connect(TEST_DB_PATH, verbose=False)
+    conn.connect()
+    conn.create_table("users", {"id": "INTEGER PRIMARY KEY"})
+    conn.insert("missing", {"id": 1})
+    conn.close()
+    os.remove(TEST_DB_PATH)
+
+    assert capsys.readouterr().out == ""
+
+
+def test_instrumentation_stats_and_slow_queries():
+    from sqlite3manager import Instrumentation
+
+    messages = []
+    instrumentation = Instrumentation(slow_query_threshold=0.0, trace_sql=True, log=messages.append)
+    conn = Connect(TEST_DB_PATH, raise_exceptions=True, instrumentation=instrumentation)
+    conn.connect()
+    try:
+        conn.create_table("users", {"id": "INTEGER PRIMARY KEY", "name": "TEXT"})
+        conn.bulk_insert("users", [{"id": i, "name": f"user{i}"} for i in range(1, 11)])
+        conn.update("users", {"name": "John"}, {"id": 1})
+        assert len(conn.read_table("users")) == 10
+
+        stats = instrumentation.stats()
+        assert stats["bulk_insert"]["rows"] == 10
+        assert stats["update"]["rows"] == 1
+        assert stats["read_table"]["rows"] == 10
+        assert stats["read_table"]["p50_seconds"] <= stats["read_table"]["max_seconds"]
+
+        slow = [entry for entry in instrumentation.slow_queries if entry["method"] == "update"]
+        assert slow and "UPDATE users SET name = 'John' WHERE id = 1" in slow[0]["sql"]
+        assert any("Llamada lenta" in message for message in messages)
+    finally:
+        conn.close()
+        os.remove(TEST_DB_PATH)
+
+
+def test_read_columns(db):
+    db.create_table("users", {"id": "INTEGER PRIMARY KEY", "name": "TEXT", "age": "INTEGER", "score": "REAL"})
+    db.bulk_insert("users", [
+        (1, "John", 30, 1.5),
+        (2, "Jane", None, 2.5),
+        (3, None, 28, None),
+    ], columns=("id", "name", "age", "score"))
+
+    values, nulls = db.read_columns("users", batch_size=2)
+    assert values["id"].typecode == "q" and list(values["id"]) == [1, 2, 3]
+    assert list(values["age"]) == [30, 0, 28]
+    assert values["score"].typecode == "d" and list(values["score"]) == [1.5, 2.5, 0.0]
+    assert values["name"] == ["John", "Jane", None]
+    assert nulls["age"] == bytearray(b"\x00\x01\x00")
+    assert nulls["name"] == bytearray(b"\x00\x00\x01")
+
+    values, _ = db.read_columns("users", ["score"], condition={"age": 28}, dtypes={"score": None})
+    assert values == {"score": [None]}
+
+
+def test_read_columns_numeric_affinity_and_mixed_types(db):
+    db.create_table("events", {"id": "INTEGER PRIMARY KEY", "at": "DATETIME", "amount": "DECIMAL(10, 2)", "level": "INTEGER"})
+    db.bulk_insert("events", [
+        (1, "2024-01-01 10:00", 10, None),
+        (2, None, 2.5, 3),
+        (3, "2024-01-02", None, 1.5),
+        (4, "2024-01-03", 1, "high"),
+    ], columns=("id", "at", "amount", "level"))
+
+    values, nulls = db.read_columns("events", batch_size=2)
+    assert values["id"].typecode == "q"
+    assert values["at"] == ["2024-01-01 10:00", None, "2024-01-02", "2024-01-03"]
+    assert values["amount"] == [10, 2.5, None, 1]
+    assert values["level"] == [None, 3, 1.5, "high"]
+    assert nulls["level"] == bytearray(b"\x01\x00\x00\x00")
+
+
+def test_read_columns_numpy(db):
+    numpy = pytest.importorskip("numpy")
+    db.create_table("users", {"id": "INTEGER PRIMARY KEY", "age": "INTEGER"})
+    db.bulk_insert("users", [(1, 30), (2, None)], columns=("id", "age"))
+
+    values, nulls = db.read_columns("users", numpy=True, dtypes={"age": "float32"})
+    assert values["id"].dtype == numpy.int64
+    assert values["age"].dtype == numpy.float32
+    assert nulls["age"].tolist() == [False, True]
+
+
+def test_csv_round_trip(db, tmp_path):
+    source = tmp_path / "users.csv"
+    source.write_text("id,name,age,score\n1,John,30,1.5\n2,,,\n3,Ana,28,2\n", encoding="utf-8")
+    progress = []
+
+    stats = db.import_csv("users", str(source), create=True, chunk_size=2,
+                          column_types={"id": "INTEGER PRIMARY KEY", "age": "INTEGER", "score": "REAL"},
+                          progress=lambda rows, seconds: progress.append(rows))
+    assert stats["rows"] == 3
+    assert progress == [2, 3]
+    assert db.read_table("users") == [(1, "John", 30, 1.5), (2, "", None, None), (3, "Ana", 28, 2.0)]
+
+    target = tmp_path / "adults.csv"
+    assert db.export_csv("users", str(target), columns=["id", "name"], condition={"age": 30})["rows"] == 1
+    assert target.read_text(encoding="utf-8").splitlines() == ["id,name", "1,John"]
+
+
+def test_jsonl_round_trip(db):
+    source = io.StringIO('{"id": 1, "name": "John", "tags": ["a"]}\n\n{"id": 2, "data": null}\n')
+    assert db.import_jsonl("events", source, create=True)["rows"] == 2
+    assert db.get_table_info("events")["types"] == {"id": "INTEGER", "name": "TEXT", "tags": "TEXT"}
+    assert db.read_table("events") == [(1, "John", '["a"]'), (2, None, None)]
+
+    target = io.StringIO()
+    db.export_jsonl("events", target)
+    assert [json.loads(line) for line in target.getvalue().splitlines()] == [
+        {"id": 1, "name": "John", "tags": '["a"]'},
+        {"id": 2, "name": None, "tags": None},
+    ]
+
+    with pytest.raises(ValueError):
+        db.import_jsonl("missing", io.StringIO('{"id": 1}\n'))
+
+
+def test_bulk_update_and_delete(db):
+    db.create_table("users", {"id": "INTEGER PRIMARY KEY", "name": "TEXT", "age": "INTEGER"})
+    db.bulk_insert("users", [(i, f"user{i}", 20) for i in range(1, 6)], columns=("id", "name", "age"))
+
+    updated = db.bulk_update("users", [{"id": 1, "age": 30}, {"id": 2, "name": "Jane"}, {"id": 3, "age": 31}, {"id": 99, "age": 1}])
+    assert updated == 3
+    assert db.search("users", {"id": 2}) == [(2, "Jane", 20)]
+    assert db.bulk_update("users", [{"name": "Jane", "age": 40}], key="name") == 1
+
+    with pytest.raises(ValueError):
+        db.bulk_update("users", [{"age": 1}])
+
+    assert db.bulk_delete("users", [{"id": 1}, {"id": 3}, {"name": "Jane"}]) == 3
+    assert [row[0] for row in db.read_table("users")] == [4, 5]
+    assert db.bulk_delete("users", [{"id": (">", 4)}, {"id": ("IN", [4])}]) == 2
+    assert db.read_table("users") == []
+
+
+def test_upsert(db):
+    db.create_table("stock", {"sku": "TEXT PRIMARY KEY", "name": "TEXT", "units": "INTEGER"})
+    assert db.upsert("stock", {"sku": "A", "name": "Apple", "units": 1}) == 1
+    assert db.upsert("stock", {"sku": "A", "units": 5}) == 1
+    assert db.read_table("stock") == [("A", "Apple", 5)]
+
+    affected = db.bulk_upsert("stock", [("A", "Avocado", 7), ("B", "Banana", 2)], columns=("sku", "name", "units"), update=("units",))
+    assert affected == 2
+    assert db.read_table("stock") == [("A", "Apple", 7), ("B", "Banana", 2)]
+
+    assert db.bulk_upsert("stock", [{"sku": "B", "units": 0}, {"sku": "C", "units": 3}], update=()) == 1
+    assert db.search("stock", {"sku": "B"}) == [("B", "Banana", 2)]
+
+
+def test_bulk_writes_keep_input_order(db):
+    db.create_table("stock", {"sku": "TEXT PRIMARY KEY", "name": "TEXT", "units": "INTEGER"})
+    db.bulk_upsert("stock", [{"sku": "A", "name": "a"}, {"sku": "A", "name": "b", "units": 1}, {"sku": "A", "name": "c"}])
+    assert db.read_table("stock") == [("A", "c", 1)]
+
+    db.bulk_update("stock", [{"sku": "A", "name": "p"}, {"sku": "A", "name": "q", "units": 2}, {"sku": "A", "name": "r"}])
+    assert db.read_table("stock") == [("A", "r", 2)]
+
+
+def test_drop_indexed_column_keeps_constraints(db, capsys):
+    db.create_table("users", {"id": "INTEGER PRIMARY KEY", "name": "TEXT NOT NULL DEFAULT 'anon'", "age": "INTEGER"})
+    db.custom_query("CREATE INDEX idx_users_age ON users (age)")
+    db.custom_query("CREATE INDEX idx_users_name ON users (name)")
+    db.insert("users", {"id": 1, "name": "John", "age": 30})
+
+    db._get_connection().execute("PRAGMA busy_timeout = 0")
+    blocker = sqlite3.connect(TEST_DB_PATH, isolation_level=None)
+    blocker.execute("BEGIN IMMEDIATE")
+    try:
+        with pytest.raises(sqlite3.OperationalError):
+            db.drop_column("users", "age")
+    finally:
+        blocker.rollback()
+        blocker.close()
+    assert sorted(db.get_table_info("users")["indexes"]) == ["idx_users_age", "idx_users_name"]
+
+    capsys.readouterr()
+    assert db.drop_column("users", "age") is True
+    assert "idx_users_age" in capsys.readouterr().out
+    assert db.get_column_names("users") == ["id", "name"]
+    assert db.get_table_info("users")["indexes"] == ["idx_users_name"]
+    db.insert("users", {"id": 2})
+    assert db.read_table("users") == [(1, "John"), (2, "anon")]
+
+
+def test_alter_table(db):
+    db.create_table("users", {"id": "INTEGER PRIMARY KEY", "mail": "TEXT UNIQUE", "score": "TEXT NOT NULL", "age": "INTEGER"})
+    db.create_table("audit", {"user_id": "INTEGER"})
+    db.custom_query("CREATE INDEX idx_users_score ON users (score)")
+    db.custom_query("CREATE TRIGGER users_audit AFTER INSERT ON users BEGIN INSERT INTO audit VALUES (new.id); END")
+    db.custom_query("CREATE VIEW user_mails AS SELECT id, mail FROM users")
+    db.insert("users", {"id": 1, "mail": "a@example.com", "score": "1.5", "age": 30})
+
+    operations = [("drop", "age"), ("rename", "mail", "email"), ("retype", "score", "REAL"), ("add", "active", "INTEGER DEFAULT 1")]
+    assert db.alter_table("users", operations) is True
+    assert db.get_table_info("users")["types"] == {"id": "INTEGER", "email": "TEXT", "score": "REAL", "active": "INTEGER"}
+    assert db.read_table("users") == [(1, "a@example.com", 1.5, 1)]
+    assert "idx_users_score" in db.get_table_info("users")["indexes"]
+    assert db.custom_query("SELECT * FROM user_mails") == [(1, "a@example.com")]
+
+    db.insert("users", {"id": 2, "email": "b@example.com", "score": 2})
+    assert db.read_table("audit") == [(1,), (2,)]
+    with pytest.raises(IntegrityError):
+        db.insert("users", {"id": 3, "email": "b@example.com", "score": 3})
+    with pytest.raises(ValueError):
+        db.alter_table("users", [("drop", "missing")])
+
+
+def test_index_management(db):
+    db.create_table("users", {"id": "INTEGER PRIMARY KEY", "email": "TEXT UNIQUE", "country": "TEXT", "age": "INTEGER", "active": "INTEGER"})
+    assert db.create_index("users", ["country", "age DESC"], where="active = 1", include=["email"]) is True
+    assert db.create_index("users", "age", index_name="users_by_age", unique=True) is True
+    with pytest.raises(ValueError):
+        db.create_index("users", "missing")
+
+    indexes = {index["name"]: index for index in db.list_indexes("users")}
+    assert indexes["idx_users_country_age"]["columns"] == ["country", "age", "email"]
+    assert indexes["idx_users_country_age"]["partial"] is True
+    assert indexes["users_by_age"]["unique"] is True
+    assert [index["origin"] for index in indexes.values()].count("u") == 1
+
+    plan = db.custom_query("EXPLAIN QUERY PLAN SELECT email FROM users WHERE country = 'ES' AND age > 30 AND active = 1")
+    assert "USING INDEX idx_users_country_age" in plan[0][-1]
+
+    assert db.drop_index("users_by_age") is True
+    assert db.analyze() is True
+    assert "users_by_age" not in db.get_table_info("users")["indexes"]
+
+
+def test_index_advisor(capsys):
+    conn = Connect(TEST_DB_PATH, raise_exceptions=True, advisor=IndexAdvisor(min_rows=100, auto_create=True, auto_create_after=3))
+    conn.connect()
+    try:
+        conn.create_table("users", {"id": "INTEGER PRIMARY KEY", "email": "TEXT"})
+        conn.bulk_insert("users", ((i, f"user{i}@example.com") for i in range(1, 201)), columns=("id", "email"))
+        capsys.readouterr()
+
+        conn.search("users", {"id": 5})
+        conn.search("users", {"email": "user5@example.com"})
+        assert "Sugerencia: CREATE INDEX IF NOT EXISTS idx_users_email" in capsys.readouterr().out
+        assert [entry["columns"] for entry in conn.advisor.suggestions()] == [("email",)]
+
+        conn.update("users", {"email": "x"}, {"email": "user6@example.com"})
+        conn.delete("users", {"email": "user7@example.com"})
+        assert "idx_users_email" in conn.get_table_info("users")["indexes"]
+        conn.search("users", {"email": "user8@example.com"})
+        assert conn.advisor.suggestions() == []
+    finally:
+        conn.close()
+        os.remove(TEST_DB_PATH)
+
+
+def test_search_operators_and_projection(db):
+    db.create_table("users", {"id": "INTEGER PRIMARY KEY", "name": "TEXT", "age": "INTEGER", "country": "TEXT"})
+    db.bulk_insert("users", [
+        (1, "John", 30, "ES"),
+        (2, "Jane", 25, "MX"),
+        (3, "Ana", None, "AR"),
+        (4, "Luis", 41, "ES"),
+    ], columns=("id", "name", "age", "country"))
+
+    assert db.search("users", {"age": (">", 28)}, columns=["id"]) == [(1,), (4,)]
+    assert db.search("users", {"country": ("IN", ["ES", "AR"]), "name": ("LIKE", "%a%")}, columns=["id"]) == [(3,)]
+    assert db.search("users", {"age": ("BETWEEN", 20, 35)}, columns=["name"], order_by="age DESC") == [("John",), ("Jane",)]
+    assert db.search("users", {"age": ("IS", None)}, columns=["id"]) == [(3,)]
+    assert db.search("users", [{"country": "MX"}, {"age": (">=", 40)}], columns=["id"], order_by="id") == [(2,), (4,)]
+    assert db.search("users", {"id": ("IN", [])}) == []
+    assert db.read_table("users", columns=["id"], order_by=["country", "id DESC"], limit=2, offset=1) == [(4,), (1,)]
+
+    with pytest.raises(ValueError):
+        db.search("users", {"age": ("~", 1)})
+    with pytest.raises(ValueError):
+        db.search("users", {"id": 1}, columns=["missing"])
+
+    assert db.update("users", {"country": "UY"}, {"age": ("<", 26)}) is True
+    assert db.delete("users", [{"country": "UY"}, {"age": ("IS", None)}]) is True
+    assert [row[0] for row in db.read_table("users")] == [1, 4]
+
+
+def test_keyset_pagination(db):
+    db.create_table("events", {"id": "INTEGER PRIMARY KEY", "kind": "TEXT"})
+    db.bulk_insert("events", ((i, "even" if i % 2 == 0 else "odd") for i in range(1, 26)), columns=("id", "kind"))
+
+    first = db.search("events", {"kind": "even"}, columns=["id"], order_by="id", limit=5)
+    assert first == [(2,), (4,), (6,), (8,), (10,)]
+    assert db.search("events", {"kind": "even"}, columns=["id"], order_by="id", limit=5, after=first[-1]) == [(12,), (14,), (16,), (18,), (20,)]
+
+    pages = list(db.iter_pages("events", ["kind", "id"], page_size=10))
+    assert [len(page) for page in pages] == [10, 10, 5]
+    assert [row[0] for page in pages for row in page] == list(range(2, 26, 2)) + list(range(1, 26, 2))
+
+    plan = db.custom_query("EXPLAIN QUERY PLAN SELECT id FROM events WHERE id > 10 ORDER BY id LIMIT 5")
+    assert "SEARCH" in plan[0][-1]
+    with pytest.raises(ValueError):
+        db.search("events", order_by=["kind", "id DESC"], after=("odd", 3))
+
+
+def test_row_factories(db):
+    db.create_table("users", {"id": "INTEGER PRIMARY KEY", "name": "TEXT"})
+    db.bulk_insert("users", [(1, "John"), (2, "Jane")], columns=("id", "name"))
+
+    assert db.read_table("users", row_factory="dict") == [{"id": 1, "name": "John"}, {"id": 2, "name": "Jane"}]
+    row = db.search("users", {"id": 2}, row_factory="row")[0]
+    assert row["name"] == "Jane" and row.keys() == ["id", "name"]
+
+    records = db.read_table("users", row_factory="record")
+    assert records[0].name == "John" and records[1] == (2, "Jane")
+    assert type(records[0]) is type(db.search("users", {"id": 1}, row_factory="record")[0])
+    assert [record.id for record in db.iter_table("users", row_factory="record")] == [1, 2]
+    assert db.custom_query("SELECT COUNT(*) AS total FROM users", row_factory="dict") == [{"total": 2}]
+
+    with pytest.raises(ValueError):
+        db.read_table("users", row_factory="xml")
+
+
+def test_row_factory_with_result_cache():
+    from sqlite3manager import ResultCache
+
+    conn = Connect(TEST_DB_PATH, raise_exceptions=True, result_cache=ResultCache(), row_factory="dict")
+    conn.connect()
+    try:
+        conn.create_table("users", {"id": "INTEGER PRIMARY KEY", "name": "TEXT"})
+        conn.insert("users", {"id": 1, "name": "John"})
+
+        first = conn.read_table("users")
+        first[0]["name"] = "changed"
+        assert conn.read_table("users") == [{"id": 1, "name": "John"}]
+        assert conn.read_table("users", row_factory="tuple") == [(1, "John")]
+        assert conn.result_cache.info()["hits"] == 1
+    finally:
+        conn.close()
+        os.remove(TEST_DB_PATH)
+
+
+def count_and_sum(rows):
+    count = total = 0
+    for row in rows:
+        count += 1
+        total += row[0]
+    return count, total
+
+
+def add_pairs(left, right):
+    return left[0] + right[0], left[1] + right[1]
+
+
+def test_parallel_scan(db):
+    db.create_table("events", {"id": "INTEGER PRIMARY KEY", "kind": "TEXT", "value": "INTEGER"})
+    db.create_index("events", "kind")
+    db.bulk_insert("events", [(i, ("a", "b", "c")[i % 3], i) for i in range(1, 1001)], columns=("id", "kind", "value"))
+
+    assert db.parallel_scan("events", count_and_sum, add_pairs, workers=2, columns=["value"]) == (1000, 500500)
+    partials = db.parallel_scan("events", count_and_sum, workers=2, partitions=3, columns=["value"], condition={"value": ("<=", 10)})
+    assert len(partials) == 3 and add_pairs(*partials[:2]) == (10, 55) and partials[2] == (0, 0)
+    assert db.parallel_scan("events", count_and_sum, add_pairs, workers=2, key="kind", columns=["value"], partitions=3) == (1000, 500500)
+    assert db.parallel_scan("events", count_and_sum, add_pairs, workers=2, condition={"kind": "z"}, columns=["value"], initial=(0, 0)) == (0, 0)
+
+    with pytest.raises(ValueError):
+        db.parallel_scan("events", count_and_sum, key="missing")
+
+    memory = Connect(":memory:", raise_exceptions=True)
+    memory.connect()
+    with pytest.raises(ValueError):
+        memory.parallel_scan("events", count_and_sum)
+    memory.close()
+
+
+def test_backup(db):
+    db.create_table("users", {"id": "INTEGER PRIMARY KEY", "name": "TEXT"})
+    db.bulk_insert("users", [(i, f"user{i}") for i in range(500)], columns=("id", "name"))
+    steps = []
+
+    try:
+        result = db.backup("test_backup.sqlite3", pages_per_step=1, progress=lambda copied, total: steps.append((copied, total)))
+        assert result["pages"] == steps[-1][1] and steps[-1][0] == steps[-1][1] and len(steps) > 1
+        copy = Connect("test_backup.sqlite3", raise_exceptions=True)
+        copy.connect()
+        assert copy.custom_query("SELECT COUNT(*) FROM users") == [(500,)]
+        copy.close()
+    finally:
+        os.remove("test_backup.sqlite3")
+    with pytest.raises(ValueError):
+        db.backup(TEST_DB_PATH)
+
+
+def test_load_into_memory_and_persist(db):
+    db.create_table("users", {"id": "INTEGER PRIMARY KEY", "name": "TEXT"})
+    db.insert("users", {"id": 1, "name": "John"})
+
+    assert db.load_into_memory() is True
+    db.insert("users", {"id": 2, "name": "Jane"})
+    disk = Connect(TEST_DB_PATH, raise_exceptions=True)
+    disk.connect()
+    assert disk.custom_query("SELECT COUNT(*) FROM users") == [(1,)]
+
+    assert db.persist_from_memory() is True
+    assert disk.custom_query("SELECT COUNT(*) FROM users") == [(2,)]
+    disk.close()
+
+    db.persist_from_memory(release=True)
+    assert db._memory is None
+    assert db.read_table("users") == [(1, "John"), (2, "Jane")]
+    with pytest.raises(ValueError):
+        db.persist_from_memory()
+
+
+@pytest.mark.skipif(not hasattr(sqlite3.Connection, "serialize"), reason="serialize requiere Python 3.11")
+def test_serialize_and_deserialize(db):
+    db.create_table("users", {"id": "INTEGER PRIMARY KEY", "name": "TEXT"})
+    db.insert("users", {"id": 1, "name": "John"})
+    data = db.serialize()
+
+    worker = Connect(":memory:", raise_exceptions=True)
+    worker.connect()
+    assert worker.deserialize(data) is True
+    assert worker.read_table("users") == [(1, "John")]
+    worker.close()
+
+
+def test_read_only_and_immutable_modes(db):
+    db.create_table("users", {"id": "INTEGER PRIMARY KEY", "name": "TEXT"})
+    db.insert("users", {"id": 1, "name": "John"})
+
+    reader = Connect(TEST_DB_PATH, raise_exceptions=True, mode="ro", profile="throughput")
+    reader.connect()
+    assert reader.read_only and reader.read_table("users") == [(1, "John")]
+    with pytest.raises(ValueError):
+        reader.insert("users", {"id": 2, "name": "Jane"})
+    with pytest.raises(OperationalError):
+        reader.custom_query("DELETE FROM users")
+    reader.close()
+
+    frozen = Connect(TEST_DB_PATH, raise_exceptions=True, immutable=True)
+    frozen.connect()
+    assert frozen.mode == "ro" and frozen.search("users", {"id": 1}) == [(1, "John")]
+    with pytest.raises(ValueError):
+        frozen.create_index("users", "name")
+    frozen.close()
+
+    with pytest.raises(ValueError):
+        Connect(TEST_DB_PATH, mode="rw", immutable=True)
+    with pytest.raises(ValueError):
+        Connect(TEST_DB_PATH, mode="append")
+
+
+def test_shared_memory_mode():
+    conn = Connect("test_shared_memory", raise_exceptions=True, mode="memory")
+    conn.connect()
+    conn.create_table("users", {"id": "INTEGER PRIMARY KEY"})
+    conn.insert("users", {"id": 1})
+    rows = []
+
+    def read():
+        conn.connect()
+        rows.extend(conn.read_table("users"))
+        conn.close()
+
+    thread = Thread(target=read)
+    thread.start()
+    thread.join()
+    assert rows == [(1,)]
+    conn.close()
+
+
+def test_aggregations(db):
+    db.create_table("orders", {"id": "INTEGER PRIMARY KEY", "country": "TEXT", "amount": "REAL", "status": "TEXT"})
+    db.bulk_insert("orders", [(i, ("ES", "MX", "AR")[i % 3], float(i), ("paid", "new")[i % 2]) for i in range(1, 31)],
+                   columns=("id", "country", "amount", "status"))
+
+    assert db.count("orders") == 30 and db.count("orders", {"status": "paid"}) == 15
+    assert db.exists("orders", {"country": "ES"}) is True and db.exists("orders", {"country": "FR"}) is False
+    assert db.distinct("orders", "country") == ["AR", "ES", "MX"]
+    assert db.distinct("orders", ["country", "status"], {"id": ("<", 3)}) == [("AR", "paid"), ("MX", "new")]
+
+    assert db.aggregate("orders", {"total": ("sum", "amount"), "orders": ("count", "*")}, {"status": "paid"}) == {"total": 240.0, "orders": 15}
+    assert db.aggregate("orders", {"total": ("sum", "amount"), "top": ("max", "amount")}, group_by="country", having={"total": (">", 150)}) == [
+        {"country": "AR", "total": 155.0, "top": 29.0},
+        {"country": "ES", "total": 165.0, "top": 30.0},
+    ]
+    with pytest.raises(ValueError):
+        db.aggregate("orders", {"total": ("median", "amount")})
+    with pytest.raises(ValueError):
+        db.aggregate("orders", {"total": ("sum", "amount")}, group_by="country", having={"status": "paid"})
+
+
+@pytest.mark.skipif(not hasattr(sqlite3.Connection, "blobopen"), reason="blobopen requiere Python 3.11")
+def test_blob_streaming(db):
+    db.create_table("files", {"id": "INTEGER PRIMARY KEY", "name": "TEXT", "content": "BLOB"})
+    payload = bytes(range(256)) * 1000
+
+    rowid = db.insert_blob_stream("files", "content", io.BytesIO(payload), {"name": "payload.bin"}, chunk_size=4096)
+    assert db.custom_query(f"SELECT name, length(content) FROM files WHERE id = {rowid}") == [("payload.bin", len(payload))]
+
+    buffer = bytearray(10000)
+    chunks = []
+    with db.open_blob("files", "content", rowid) as blob:
+        assert len(blob) == len(payload) and not blob.writable()
+        while count := blob.readinto(buffer):
+            chunks.append(bytes(buffer[:count]))
+        blob.seek(-256, io.SEEK_END)
+        assert blob.read() == bytes(range(256))
+        with pytest.raises(ValueError):
+            blob.write(b"x")
+    assert b"".join(chunks) == payload
+
+    with db.open_blob("files", "content", rowid, readonly=False) as blob:
+        blob.seek(10)
+        assert blob.write(memoryview(b"abc")) == 3
+    with db.open_blob("files", "content", rowid) as blob:
+        blob.seek(8)
+        assert blob.read(6) == bytes([8, 9]) + b"abc" + bytes([13])
+
+    with pytest.raises(ValueError):
+        db.insert_blob_stream("files", "content", io.BytesIO(b"short"), size=10)
+    assert db.count("files") == 1
+
+
+def test_change_tracking(db):
+    db.create_table("users", {"id": "INTEGER PRIMARY KEY", "name": "TEXT"})
+    db.insert("users", {"id": 1, "name": "John"})
+    assert db.enable_change_tracking("users") is True
+
+    db.insert("users", {"id": 2, "name": "Jane"})
+    db.update("users", {"name": "Johnny"}, {"id": 1})
+    db.update("users", {"id": 3}, {"id": 2})
+    db.delete("users", {"id": 1})
+
+    changes = db.changes_since("users")
+    assert [(operation, rowid, row) for _, operation, rowid, row in changes] == [
+        ("insert", 2, None), ("update", 1, None), ("delete", 2, None), ("update", 3, (3, "Jane")), ("delete", 1, None),
+    ]
+    versions = [version for version, *_ in changes]
+    assert versions == sorted(versions)
+    assert db.changes_since("users", versions[1], limit=2) == changes[2:4]
+
+    assert db.prune_changes(before=versions[2]) == 3
+    assert db.prune_changes(keep=1, table_name="users") == 1
+    db.insert("users", {"id": 4, "name": "Ann"})
+    assert db.changes_since("users", versions[-1]) == [(versions[-1] + 1, "insert", 4, (4, "Ann"))]
+
+    db.disable_change_tracking("users")
+    db.insert("users", {"id": 5, "name": "Bob"})
+    assert len(db.changes_since("users")) == 2
+    with pytest.raises(ValueError):
+        db.prune_changes()
@@ -0,0 +1,74 @@
+import os
+from sqlite3 import OperationalError
+from threading import Thread
+import pytest
+from sqlite3manager import ConnectionPool
+
+TEST_DB_PATH = "test_pool.sqlite3"
+
+
+@pytest.fixture
+def pool():
+    pool = ConnectionPool(TEST_DB_PATH, max_readers=2)
+    pool.execute("CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT)")
+
+    yield pool
+
+    pool.close()
+    for suffix in ("", "-wal", "-shm"):
+        if os.path.exists(TEST_DB_PATH + suffix):
+            os.remove(TEST_DB_PATH + suffix)
+
+
+def test_wal_mode(pool):
+    assert pool.read("PRAGMA journal_mode") == [("wal",)]
+
+
+def test_concurrent_writers_and_readers(pool):
+    errors = []
+
+    def work(offset):
+        try:
+            for i in range(50):
+                pool.execute("INSERT INTO users (id, name) VALUES (?, ?)", (offset + i, f"user{offset + i}"))
+                pool.read("SELECT COUNT(*) FROM users")
+        except Exception as e:
+            errors.append(e)
+
+    threads = [Thread(target=work, args=(n * 1000,)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert pool.read("SELECT COUNT(*) FROM users") == [(400,)]
+    assert pool.stats()["readers"] <= 2
+
+
+def test_readers_are_reused_and_read_only(pool):
+    with pool.reader() as first:
+        pass
+    with pool.reader() as second:
+        assert second is first
+        with pytest.raises(OperationalError):
+            second.execute("INSERT INTO users (name) VALUES ('John')")
+
+
+def test_reader_timeout_and_health_check(pool):
+    with pool.reader(), pool.reader():
+        with pytest.raises(TimeoutError):
+            with pool.reader(timeout=0.05):
+                pass
+
+    with pool.reader() as connection:
+        connection.close()
+    assert pool.read("SELECT 1") == [(1,)]
+
+
+def test_writer_rolls_back_on_error(pool):
+    with pytest.raises(RuntimeError):
+        with pool.writer() as connection:
+            connection.execute("INSERT INTO users (id, name) VALUES (1, 'John')")
+            raise RuntimeError("boom")
+    assert pool.read("SELECT COUNT(*) FROM users") == [(0,)]
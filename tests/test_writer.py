@@ -0,0 +1,79 @@
+import os
+import sqlite3
+from sqlite3 import IntegrityError
+from threading import Thread
+from time import sleep
+import pytest
+from sqlite3manager import Connect, WriteBehindQueue
+
+TEST_DB_PATH = "test_writer.sqlite3"
+
+
+@pytest.fixture
+def db():
+    conn = Connect(TEST_DB_PATH, raise_exceptions=True, profile="throughput", verbose=False)
+    conn.connect()
+    conn.create_table("users", {"id": "INTEGER PRIMARY KEY", "name": "TEXT"})
+
+    yield conn
+
+    conn.close_all()
+    for suffix in ("", "-wal", "-shm"):
+        if os.path.exists(TEST_DB_PATH + suffix):
+            os.remove(TEST_DB_PATH + suffix)
+
+
+def test_concurrent_writers_are_batched(db):
+    with WriteBehindQueue(db, max_batch=100, max_delay=0.05) as writes:
+        futures = []
+
+        def work(offset):
+            futures.extend(writes.insert("users", {"id": offset + i, "name": f"user{offset + i}"}) for i in range(50))
+
+        threads = [Thread(target=work, args=(n * 1000,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        writes.flush()
+
+        assert all(future.done() and future.result() for future in futures)
+        assert db.custom_query("SELECT COUNT(*) FROM users") == [(400,)]
+        stats = writes.stats()
+        assert stats["writes"] == 400 and stats["batches"] < 400 and stats["pending"] == 0
+
+
+def test_failed_write_does_not_affect_batch(db):
+    writes = WriteBehindQueue(db, max_delay=0.05)
+    first = writes.insert("users", {"id": 1, "name": "John"})
+    duplicate = writes.insert("users", {"id": 1, "name": "Jane"})
+    renamed = writes.update("users", {"name": "Johnny"}, {"id": 1})
+    writes.close()
+
+    assert first.result() is True and renamed.result() is True
+    with pytest.raises(IntegrityError):
+        duplicate.result()
+    assert db.read_table("users") == [(1, "Johnny")]
+    with pytest.raises(RuntimeError):
+        writes.insert("users", {"id": 2, "name": "Jane"})
+    with pytest.raises(ValueError):
+        WriteBehindQueue(db, max_batch=0)
+
+
+def test_cancelled_write_is_skipped(db):
+    blocker = sqlite3.connect(TEST_DB_PATH, isolation_level=None)
+    blocker.execute("BEGIN IMMEDIATE")
+    writes = WriteBehindQueue(db, max_delay=0)
+    first = writes.insert("users", {"id": 1, "name": "John"})
+    while writes.stats()["pending"]:
+        sleep(0.001)
+    cancelled = writes.insert("users", {"id": 2, "name": "Jane"})
+    assert cancelled.cancel()
+    blocker.rollback()
+    blocker.close()
+
+    writes.flush(timeout=5)
+    later = writes.insert("users", {"id": 3, "name": "Jack"})
+    assert first.result(timeout=5) is True and later.result(timeout=5) is True
+    writes.close()
+    assert db.read_table("users") == [(1, "John"), (3, "Jack")]